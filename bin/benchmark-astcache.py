@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""Measure how fast rope's AST cache is compared to parsing
+
+Parses the modules of a folder, the standard library by default, and
+reports the time parsing them and reading them from a warm
+`rope.base.astcache.ASTCache` takes and the size of its entries.
+
+    python bin/benchmark-astcache.py [--folder PATH] [--repeat 3]
+
+"""
+
+import argparse
+import os
+import shutil
+import sysconfig
+import tempfile
+import time
+
+import rope.base.project
+
+
+def read_modules(folder):
+    result = []
+    for name in sorted(os.listdir(folder)):
+        if name.endswith(".py"):
+            with open(os.path.join(folder, name), "rb") as input_file:
+                result.append(input_file.read())
+    return result
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def parse_all(ast_cache, modules):
+    for source_bytes in modules:
+        try:
+            ast_cache.parse(source_bytes)
+        except SyntaxError:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--folder", default=sysconfig.get_paths()["stdlib"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    modules = read_modules(args.folder)
+    root = tempfile.mkdtemp(prefix="rope-benchmark-")
+    try:
+        project = rope.base.project.Project(root)
+        ast_cache = project.pycore.ast_cache
+        parse = min(
+            timed(lambda: parse_all(ast_cache, modules))[1] for _ in range(args.repeat)
+        )
+        project.prefs.set("save_ast_cache", True)
+        project.prefs.set("max_ast_cache_size", 1024)
+        parse_all(ast_cache, modules)
+        hit = min(
+            timed(lambda: parse_all(ast_cache, modules))[1] for _ in range(args.repeat)
+        )
+        source_size = sum(len(source_bytes) for source_bytes in modules)
+        cache_size = sum(
+            os.path.getsize(os.path.join(ast_cache.folder, name))
+            for name in os.listdir(ast_cache.folder)
+        )
+        print("%d modules, %.1f MiB" % (len(modules), source_size / 1024 / 1024))
+        print("parsing: %.2fs" % parse)
+        print(
+            "cache hits: %.2fs, %.1f MiB of entries" % (hit, cache_size / 1024 / 1024)
+        )
+        project.close()
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""Measure how long syncing a large objectdb takes in each format
+
+Fills the objectdb of a temporary project with the given number of
+files, each with some scopes, and reports the time writing and reading
+its data file takes and its size for each ``data_files_format``.
+
+    python bin/benchmark-datafiles.py [--files 3000] [--scopes 20]
+
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import rope.base.project
+from rope.base.oi import memorydb, objectdb
+from rope.base.project import data_file_formats
+
+
+class _Validation:
+    def is_value_valid(self, value):
+        return True
+
+    def is_more_valid(self, new, old):
+        return True
+
+
+def fill_objectdb(db, files, scopes):
+    for index in range(files):
+        path = "pkg/mod%d.py" % index
+        for scope in range(scopes):
+            key = "Class%d.method" % scope
+            db.add_callinfo(
+                path,
+                key,
+                (
+                    ("instance", ("defined", path, "Class%d" % scope)),
+                    ("builtin", "int"),
+                ),
+                ("builtin", "list", ("builtin", "str")),
+            )
+            db.add_pername(path, key, "result", ("defined", path, "Class0"))
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=3000)
+    parser.add_argument("--scopes", type=int, default=20)
+    args = parser.parse_args()
+    root = tempfile.mkdtemp(prefix="rope-benchmark-")
+    try:
+        project = rope.base.project.Project(root, save_objectdb=True)
+        db = objectdb.ObjectDB(memorydb.MemoryDB(project), _Validation())
+        fill_objectdb(db, args.files, args.scopes)
+        for name, format in data_file_formats.items():
+            project.prefs.set("data_files_format", name)
+            _, write = timed(db.write)
+            _, read = timed(lambda: project.data_files.read_data("objectdb"))
+            path = os.path.join(
+                project.ropefolder.real_path, "objectdb" + format.extension
+            )
+            print(
+                "%s: write %.2fs, read %.2fs, %.1f MiB"
+                % (name, write, read, os.path.getsize(path) / 1024 / 1024)
+            )
+        project.close()
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
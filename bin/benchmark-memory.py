@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""Measure the memory rope uses for analyzing a large project
+
+Creates a temporary project with the given number of modules, parses
+all of them, collects the names of all of their scopes and reports the
+peak resident set size of the process.
+
+    python bin/benchmark-memory.py [--modules 5000]
+
+"""
+
+import argparse
+import os
+import resource
+import shutil
+import tempfile
+import time
+
+import rope.base.project
+
+MODULE_TEMPLATE = '''\
+import os
+from pkg import mod%(previous)d
+
+
+CONSTANT = %(index)d
+NAMES = [name for name in os.listdir(".")]
+
+
+def function%(index)d(first, second=None, *args, **kwds):
+    total = first + CONSTANT
+    items, rest = args[:1], args[1:]
+    for item in items:
+        total += item
+    return [total, second, rest, kwds]
+
+
+class Class%(index)d(object):
+    attribute = mod%(previous)d.CONSTANT
+
+    def __init__(self, value):
+        self.value = value
+        self.values = [value * 2 for _ in range(3)]
+
+    def method(self, other):
+        result = self.value + other
+        return function%(index)d(result)
+
+    @property
+    def prop(self):
+        return self.value
+'''
+
+
+def make_tree(root, modules):
+    package = os.path.join(root, "pkg")
+    os.makedirs(package)
+    with open(os.path.join(package, "__init__.py"), "w"):
+        pass
+    for index in range(modules):
+        with open(os.path.join(package, "mod%d.py" % index), "w") as output:
+            output.write(
+                MODULE_TEMPLATE % {"index": index, "previous": max(index - 1, 0)}
+            )
+
+
+def visit_scope(scope):
+    scope.get_names()
+    for child in scope.get_scopes():
+        visit_scope(child)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", type=int, default=5000)
+    args = parser.parse_args()
+    root = tempfile.mkdtemp(prefix="rope-benchmark-")
+    try:
+        make_tree(root, args.modules)
+        project = rope.base.project.Project(root, ropefolder=None)
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.perf_counter()
+        for file in project.get_python_files():
+            pymodule = project.get_pymodule(file)
+            visit_scope(pymodule.get_scope())
+        seconds = time.perf_counter() - start
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(
+            "analyzed %d modules in %.1fs; peak RSS %.0f MiB (%.0f MiB before)"
+            % (args.modules, seconds, peak / 1024, before / 1024)
+        )
+        project.close()
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""Measure how fast rope lists the files of a large project
+
+Creates a temporary tree with the given number of files, some of them
+inside ignored folders, and reports the time `Project.get_files()`
+and matching `ignored_resources` patterns take.
+
+    python bin/benchmark-walk.py [--files 100000]
+
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import rope.base.project
+
+IGNORED_FOLDERS = [".git", "node_modules", ".venv"]
+
+
+def make_tree(root, files, files_per_folder=100):
+    folders = IGNORED_FOLDERS + ["pkg%d" % index for index in range(10)]
+    for index in range(files):
+        folder = os.path.join(
+            root,
+            folders[index % len(folders)],
+            "sub%d" % (index // (files_per_folder * len(folders))),
+        )
+        os.makedirs(folder, exist_ok=True)
+        with open(os.path.join(folder, "mod%d.py" % index), "w"):
+            pass
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100000)
+    args = parser.parse_args()
+    root = tempfile.mkdtemp(prefix="rope-benchmark-")
+    try:
+        make_tree(root, args.files)
+        project = rope.base.project.Project(
+            root,
+            ropefolder=None,
+            ignored_resources=["*.pyc", "*~", ".ropeproject", ".hg", ".svn"]
+            + IGNORED_FOLDERS,
+        )
+        files, seconds = timed(project.get_files)
+        print(
+            "get_files: %d of %d files in %.3fs (%.0f files/s)"
+            % (len(files), args.files, seconds, args.files / seconds)
+        )
+        paths = [file.path for file in files]
+        matcher = project.ignored
+        matcher.set_patterns(matcher.patterns)
+        _, cold = timed(lambda: [matcher.does_match_path(path) for path in paths])
+        _, warm = timed(lambda: [matcher.does_match_path(path) for path in paths])
+        print(
+            "does_match_path: %.0f paths/s uncached, %.0f paths/s cached"
+            % (len(paths) / cold, len(paths) / warm)
+        )
+        project.close()
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
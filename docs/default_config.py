@@ -55,6 +55,63 @@ def set_prefs(prefs):
     # Should rope save object information or not.
     #
     #     prefs["save_objectdb"] = True
+    #
+    # The format of the files rope saves history, object information
+    # and other data in, inside project's rope folder: "pickle" or
+    # "json".  Data files saved in the other format are still read.
+    #
+    #     prefs["data_files_format"] = "pickle"
+    #
+    # If `True`, rope saves history, object information and other
+    # data files in a background thread when the project is synced
+    # and only waits for them to be written when it is closed.
+    #
+    #     prefs["write_data_files_in_background"] = False
+    #
+    # How rope saves object information.  With "memory" all of it
+    # is loaded when the project is opened and pickled into the
+    # `objectdb` file when it is synced; with "sqlite" it is kept
+    # in an SQLite database that is read lazily and updated only for
+    # the scopes that have changed.
+    #
+    #     prefs["objectdb_backend"] = "memory"
+
+    # The maximum number of parsed modules rope keeps in memory.  Least
+    # recently used modules are dropped when there are more.  `None`
+    # means no limit.
+    #
+    #     prefs["max_cached_modules"] = None
+
+    # If `True`, when a module changes only inside one top-level
+    # function or class, rope reparses that definition instead of the
+    # whole module and keeps the objects of other definitions.
+    #
+    #     prefs["incremental_reparse"] = False
+
+    # The number of worker processes rope uses for searching for
+    # occurrences in project-wide refactorings like rename and for
+    # analyzing all modules with `libutils.analyze_modules()`.  `0`
+    # means doing them in the current process.
+    #
+    #     prefs["worker_processes"] = 0
+
+    # If `True`, rope saves the index of the names used in project
+    # files, which is used for skipping files when searching for
+    # occurrences, and reuses it when the project is opened later.
+    #
+    #     prefs["save_name_index"] = False
+
+    # The number of source codes whose simplified forms, used for
+    # finding words and occurrences, rope keeps in memory.  This cache
+    # is shared by all projects in the process.
+    #
+    #     prefs["simplified_code_cache_size"] = 32
+
+    # If `True`, rope watches project folders for changes made outside
+    # rope using inotify on Linux and only validates the changed
+    # resources.  It has no effect on other platforms.
+    #
+    #     prefs["watch_resources"] = False
 
     # If `True`, rope analyzes each module when it is being saved.
     #
@@ -63,6 +120,14 @@ def set_prefs(prefs):
     # The depth of calls to follow in static object analysis
     #
     #     prefs["soa_followed_calls"] = 0
+    #
+    # If positive, rope records which functions call which while
+    # performing static object analysis.  When a module is saved, it
+    # also analyzes at most this many callers and callees of its changed
+    # scopes that may be affected; the rest are analyzed after later
+    # saves.
+    #
+    #     prefs["soa_call_graph_budget"] = 0
 
     # If `False` when running modules or unit tests "dynamic object
     # analysis" is turned off.  This makes them much faster.
@@ -96,6 +161,12 @@ def set_prefs(prefs):
     #
     #     prefs["import_dynload_stdmods"] = True
 
+    # If `True`, rope does not import `extension_modules` into its own
+    # process; they are inspected in a child process and the results
+    # are saved in the rope folder for later sessions.
+    #
+    #     prefs["introspect_in_subprocess"] = False
+
     # If `True` modules with syntax errors are considered to be empty.
     # The default value is `False`; When `False` syntax errors raise
     # `rope.base.exceptions.ModuleSyntaxError` exception.
@@ -1,22 +1,34 @@
 """rope, a python refactoring library"""
 
-import importlib.metadata
 
-try:
-    VERSION = importlib.metadata.version("rope")
-except importlib.metadata.PackageNotFoundError:
+def _get_version():
+    import importlib.metadata
 
-    def get_fallback_version():
-        import pathlib
-        import re
+    try:
+        return importlib.metadata.version("rope")
+    except importlib.metadata.PackageNotFoundError:
+        return get_fallback_version()
 
-        pyproject = (
-            pathlib.Path(__file__).resolve().parent.parent / "pyproject.toml"
-        ).read_text()
-        version = re.search("version.*=.*'(.*)'", pyproject)
-        return version.group(1) if version else None
 
-    VERSION = get_fallback_version()
+def get_fallback_version():
+    import pathlib
+    import re
+
+    pyproject = (
+        pathlib.Path(__file__).resolve().parent.parent / "pyproject.toml"
+    ).read_text()
+    version = re.search("version.*=.*'(.*)'", pyproject)
+    return version.group(1) if version else None
+
+
+def __getattr__(name):
+    # Looking up the version imports `importlib.metadata`, which is
+    # slow; it is done when `VERSION` is first accessed
+    if name == "VERSION":
+        global VERSION
+        VERSION = _get_version()
+        return VERSION
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 INFO = __doc__
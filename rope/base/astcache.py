@@ -0,0 +1,156 @@
+"""A persistent cache for parsed modules
+
+When ``save_ast_cache`` project config is `True`, the ASTs of parsed
+modules are pickled into the ``astcache`` folder inside project's
+rope folder and are reused by later `Project` instances instead of
+parsing the modules again.
+
+This cache is experimental and its configs are not documented:
+loading pickled ASTs is barely faster than parsing them and the
+entries take more than three times the space of the sources; see
+``bin/benchmark-astcache.py``.  ``max_ast_cache_size`` project config
+limits the size of the entries in megabytes (64 by default).
+
+"""
+
+import contextlib
+import hashlib
+import os
+import pickle
+import sys
+import time
+
+from rope.base import ast
+
+# Entries used again are marked as recently used at most this often,
+# in seconds, so that cache hits do not write to the file system
+_TOUCH_INTERVAL = 24 * 60 * 60
+
+
+class ASTCache:
+    """Stores and reuses parsed modules
+
+    Entries are keyed by the contents of the module and the version of
+    the running interpreter; the same source is parsed only once, no
+    matter which file or path it is read from.  The total size of the
+    entries is limited by ``max_ast_cache_size`` project config (in
+    megabytes); least recently used entries, with a resolution of a
+    day, are removed first.
+
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self.hits = 0
+        self.misses = 0
+        self._size = None
+
+    @property
+    def enabled(self):
+        return self.project.ropefolder is not None and self.project.prefs.get(
+            "save_ast_cache", False
+        )
+
+    @property
+    def max_size(self):
+        return self.project.prefs.get("max_ast_cache_size", 64) * 1024 * 1024
+
+    @property
+    def folder(self):
+        return os.path.join(self.project.ropefolder.real_path, "astcache")
+
+    def parse(self, source_bytes, filename="<string>"):
+        """Return the AST of `source_bytes`
+
+        Raises `SyntaxError` like `ast.parse()`; modules with syntax
+        errors are never cached.
+
+        """
+        if not self.enabled:
+            return ast.parse(source_bytes, filename=filename)
+        path = self._get_entry_path(source_bytes)
+        node = self._read_entry(path)
+        if node is not None:
+            self.hits += 1
+            return node
+        self.misses += 1
+        node = ast.parse(source_bytes, filename=filename)
+        self._write_entry(path, node)
+        return node
+
+    def clear(self):
+        """Remove all cached entries"""
+        for path, _, _ in self._get_entries():
+            with contextlib.suppress(OSError):
+                os.remove(path)
+        self._size = 0
+
+    def _get_entry_path(self, source_bytes):
+        digest = hashlib.sha1(sys.version.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(source_bytes)
+        return os.path.join(self.folder, digest.hexdigest() + ".pickle")
+
+    def _read_entry(self, path):
+        try:
+            with open(path, "rb") as input_file:
+                node = pickle.load(input_file)
+                mtime = os.fstat(input_file.fileno()).st_mtime
+            if time.time() - mtime > _TOUCH_INTERVAL:
+                os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # A corrupted or incompatible entry; it is rewritten
+            return None
+        if isinstance(node, ast.Module):
+            return node
+
+    def _write_entry(self, path, node):
+        data = pickle.dumps(node, pickle.HIGHEST_PROTOCOL)
+        temp_path = "%s.%d.tmp" % (path, os.getpid())
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(temp_path, "wb") as output_file:
+                output_file.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            return
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._get_entries())
+        else:
+            self._size += len(data)
+        if self._size > self.max_size:
+            self._evict()
+
+    def _evict(self):
+        entries = sorted(self._get_entries(), key=lambda entry: entry[2])
+        self._size = sum(size for _, size, _ in entries)
+        # Dropping down to 3/4 of the limit to avoid evicting on every write
+        limit = self.max_size * 3 // 4
+        for path, size, _ in entries:
+            if self._size <= limit:
+                break
+            with contextlib.suppress(OSError):
+                os.remove(path)
+                self._size -= size
+
+    def _get_entries(self):
+        result = []
+        try:
+            scanner = os.scandir(self.folder)
+        except OSError:
+            return result
+        with scanner:
+            for entry in scanner:
+                if not entry.name.endswith(".pickle"):
+                    continue
+                with contextlib.suppress(OSError):
+                    stat = entry.stat()
+                    result.append((entry.path, stat.st_size, stat.st_mtime))
+        return result
+
+    def __str__(self):
+        return "ASTCache: %d hits, %d misses\n" % (self.hits, self.misses)
@@ -4,7 +4,7 @@ import inspect
 import io
 
 import rope.base.evaluate
-from rope.base import arguments, ast, pynames, pyobjects, utils
+from rope.base import arguments, ast, introspect, pynames, pyobjects, utils
 
 
 class BuiltinModule(pyobjects.AbstractModule):
@@ -40,6 +40,13 @@ class BuiltinModule(pyobjects.AbstractModule):
     @property
     @utils.saveit
     def module(self):
+        if self.pycore is not None and self.pycore.project.prefs.get(
+            "introspect_in_subprocess", False
+        ):
+            description = introspect.get_description(self.pycore.project, self.name)
+            if description is not None:
+                return _Introspected(description)
+            return
         try:
             result = __import__(self.name)
             for token in self.name.split(".")[1:]:
@@ -112,6 +119,8 @@ class BuiltinUnknown(_BuiltinElement, pyobjects.PyObject):
         self.type = pyobjects.get_unknown()
 
     def get_name(self):
+        if isinstance(self.builtin, _Introspected):
+            return self.builtin.type_name
         return getattr(type(self.builtin), "__name__", None)
 
     @utils.saveit
@@ -119,7 +128,43 @@ class BuiltinUnknown(_BuiltinElement, pyobjects.PyObject):
         return _object_attributes(self.builtin, self)
 
 
+class _Introspected:
+    """Stands for an object introspected in another process
+
+    See `rope.base.introspect.describe()`.
+
+    """
+
+    def __init__(self, description):
+        self.kind = description["kind"]
+        self.__name__ = description["name"]
+        self.__doc__ = description["doc"]
+        self.type_name = description["type_name"]
+        self.params = description.get("params", [])
+        self.attributes = description["attributes"]
+
+
+def _introspected_attributes(obj, parent):
+    attributes = {}
+    for name, description in obj.attributes.items():
+        if name == "None":
+            continue
+        child = _Introspected(description)
+        if child.kind == "class":
+            pyobject = BuiltinClass(child, {}, parent=parent)
+        elif child.kind == "function":
+            pyobject = BuiltinFunction(
+                builtin=child, argnames=child.params, parent=parent
+            )
+        else:
+            pyobject = BuiltinUnknown(builtin=child)
+        attributes[name] = BuiltinName(pyobject)
+    return attributes
+
+
 def _object_attributes(obj, parent):
+    if isinstance(obj, _Introspected):
+        return _introspected_attributes(obj, parent)
     attributes = {}
     for name in dir(obj):
         if name == "None":
@@ -1,7 +1,11 @@
 import bisect
+import itertools
 import re
 import token
 import tokenize
+from array import array
+
+from rope.base import utils
 
 
 class ChangeCollector:
@@ -35,25 +39,14 @@ class ChangeCollector:
 class SourceLinesAdapter:
     """Adapts source to Lines interface
 
-    Note: The creation of this class is expensive.
+    The offsets of line starts are shared by the adapters of the same
+    source, so creating one for the source of a module that was already
+    adapted is cheap.
     """
 
     def __init__(self, source_code):
         self.code = source_code
-        self.starts = None
-        self._initialize_line_starts()
-
-    def _initialize_line_starts(self):
-        self.starts = []
-        self.starts.append(0)
-        try:
-            i = 0
-            while True:
-                i = self.code.index("\n", i) + 1
-                self.starts.append(i)
-        except ValueError:
-            pass
-        self.starts.append(len(self.code) + 1)
+        self.starts = _get_line_starts(source_code)
 
     def get_line(self, lineno):
         return self.code[self.starts[lineno - 1] : self.starts[lineno] - 1]
@@ -71,6 +64,20 @@ class SourceLinesAdapter:
         return self.starts[lineno] - 1
 
 
+@utils.cached(32)
+def _get_line_starts(source_code):
+    """Return the offsets of the lines of `source_code` in an array
+
+    The offset of an imaginary line after the last one, the length of
+    the source plus one, is included too.
+    """
+    starts = array("I", [0])
+    starts.extend(
+        itertools.accumulate(len(line) + 1 for line in source_code.split("\n"))
+    )
+    return starts
+
+
 class ArrayLinesAdapter:
     def __init__(self, lines):
         self.lines = lines
@@ -267,31 +274,35 @@ class CachingLogicalLineFinder:
         return self._ends
 
     def _init_logicals(self):
-        """Should initialize _starts and _ends attributes"""
-        size = self.lines.length() + 1
-        self._starts = [None] * size
-        self._ends = [None] * size
+        """Should initialize _starts and _ends attributes
+
+        They are sorted arrays of the first and last lines of logical
+        lines.
+        """
+        starts = set()
+        ends = set()
         for start, end in self._generate(self.lines):
-            self._starts[start] = True
-            self._ends[end] = True
+            starts.add(start)
+            ends.add(end)
+        self._starts = array("I", sorted(starts))
+        self._ends = array("I", sorted(ends))
 
     def logical_line_in(self, line_number):
-        start = line_number
-        while start > 0 and not self.starts[start]:
-            start -= 1
-        if start == 0:
-            try:
-                start = self.starts.index(True, line_number)
-            except ValueError:
-                return (line_number, line_number)
-        return (start, self.ends.index(True, start))
+        index = bisect.bisect(self.starts, line_number)
+        if index > 0:
+            start = self.starts[index - 1]
+        elif self.starts:
+            start = self.starts[0]
+        else:
+            return (line_number, line_number)
+        return (start, self.ends[bisect.bisect_left(self.ends, start)])
 
     def generate_starts(self, start_line=1, end_line=None):
         if end_line is None:
             end_line = self.lines.length()
-        for index in range(start_line, end_line):
-            if self.starts[index]:
-                yield index
+        first = bisect.bisect_left(self.starts, start_line)
+        last = bisect.bisect_left(self.starts, end_line)
+        yield from self.starts[first:last]
 
 
 def get_block_start(lines, lineno, maximum_indents=80):
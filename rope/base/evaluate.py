@@ -37,6 +37,10 @@ def eval_node(scope, node):
 
 
 def eval_node2(scope, node):
+    return _get_evaluated(scope, node, _eval_node2)
+
+
+def _eval_node2(scope, node):
     evaluator = StatementEvaluator(scope)
     evaluator.visit(node)
     return evaluator.old_result, evaluator.result
@@ -47,12 +51,52 @@ def eval_str(holding_scope, name):
 
 
 def eval_str2(holding_scope, name):
+    return _get_evaluated(holding_scope, name, _eval_str2)
+
+
+def _eval_str2(holding_scope, name):
     try:
         # parenthesizing for handling cases like 'a_var.\nattr'
         node = ast.parse("(%s)" % name)
     except SyntaxError:
         raise BadIdentifierError("Not a resolvable python identifier selected.")
-    return eval_node2(holding_scope, node)
+    return _eval_node2(holding_scope, node)
+
+
+# The number of results saved in each module; they are all forgotten
+# when there are more
+_MAX_EVALUATED_NODES = 10000
+
+
+def _get_evaluated(scope, expression, evaluate):
+    """Return `evaluate(scope, expression)`, saving it in scope's module
+
+    Saved results are forgotten with other concluded data of the
+    module, like when the module or a module it depends on changes.
+    """
+    module = scope._get_global_scope().pyobject
+    if not isinstance(module, pyobjects._PyModule) or not _can_save_evaluated(scope):
+        return evaluate(scope, expression)
+    evaluated = module._get_evaluated_nodes()
+    key = (scope, expression)
+    if key not in evaluated:
+        if len(evaluated) >= _MAX_EVALUATED_NODES:
+            evaluated.clear()
+        evaluated[key] = evaluate(scope, expression)
+    return evaluated[key]
+
+
+def _can_save_evaluated(scope):
+    """Whether the results of evaluating nodes in `scope` can be saved
+
+    Nodes in functions depend on their parameter objects, which object
+    inference sets for each call; temporary scopes are not reused.
+    """
+    while scope is not None:
+        if scope.get_kind() not in ("Module", "Class"):
+            return False
+        scope = scope.parent
+    return True
 
 
 class ScopeNameFinder:
@@ -50,6 +50,9 @@ class ModuleSyntaxError(RopeError):
             f"Syntax error in file <{filename}> line <{lineno}>: {message}"
         )
 
+    def __reduce__(self):
+        return (self.__class__, (self.filename, self.lineno, self.message_))
+
 
 class ModuleDecodeError(RopeError):
     """Cannot decode module"""
@@ -58,3 +61,6 @@ class ModuleDecodeError(RopeError):
         self.filename = filename
         self.message_ = message
         super().__init__(f"Cannot decode file <{filename}>: {message}")
+
+    def __reduce__(self):
+        return (self.__class__, (self.filename, self.message_))
@@ -0,0 +1,206 @@
+"""Noticing changes to project files using Linux inotify
+
+When ``watch_resources`` project config is `True` and inotify is
+available, `rope.base.project.Project.validate()` only validates the
+resources that inotify has reported as changed instead of checking
+every resource rope tracks.
+
+"""
+
+import contextlib
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+import sys
+import weakref
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+_WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+_libc = None
+
+
+def _get_libc():
+    global _libc
+    if _libc is None:
+        name = ctypes.util.find_library("c") or "libc.so.6"
+        _libc = ctypes.CDLL(name, use_errno=True)
+    return _libc
+
+
+def is_available():
+    """Return `True` if inotify can be used"""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        return hasattr(_get_libc(), "inotify_init1")
+    except OSError:
+        return False
+
+
+class InotifyWatcher:
+    """Collects the resources of a project changed since last asked
+
+    All folders of the project except ignored ones are watched.  If
+    the kernel drops events, `get_changed_resources()` returns `None`
+    once so that the caller performs a full validation.  If a folder
+    cannot be watched, for instance because of
+    ``fs.inotify.max_user_watches`` limit, the watcher stops watching
+    and `get_changed_resources()` always returns `None`.
+
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self.libc = _get_libc()
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._finalizer = weakref.finalize(self, os.close, self.fd)
+        self.watches = {}
+        self.changed = set()
+        self.lost = False
+        # Whether some folders are not watched
+        self.incomplete = False
+        self._watch_tree(project.root)
+
+    def get_changed_resources(self, folder):
+        """Return changed resources inside `folder`
+
+        `None` is returned if some changes may have been missed; all
+        of `folder` should be validated in that case.
+
+        """
+        self._read_events()
+        if self.incomplete:
+            return None
+        if self.lost:
+            self.lost = False
+            self.changed.clear()
+            return None
+        result = []
+        for path, is_folder in list(self.changed):
+            if _contains(folder.path, path):
+                self.changed.discard((path, is_folder))
+                if is_folder:
+                    result.append(self.project.get_folder(path))
+                else:
+                    result.append(self.project.get_file(path))
+        return result
+
+    def close(self):
+        self._finalizer()
+        self.fd = -1
+
+    def _watch_tree(self, folder):
+        pending = [folder.path]
+        while pending:
+            path = pending.pop()
+            if not self._add_watch(path):
+                self.incomplete = True
+                self.changed.clear()
+                self.close()
+                return
+            with contextlib.suppress(OSError):
+                with os.scandir(self.project._get_resource_path(path)) as entries:
+                    for entry in entries:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        child = path + "/" + entry.name if path else entry.name
+                        if not self.project.is_ignored(self.project.get_folder(child)):
+                            pending.append(child)
+
+    def _add_watch(self, path):
+        real_path = self.project._get_resource_path(path)
+        wd = self.libc.inotify_add_watch(
+            self.fd, os.fsencode(real_path), ctypes.c_uint32(_WATCH_MASK)
+        )
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR):
+                return True
+            return False
+        self.watches[wd] = path
+        return True
+
+    def _read_events(self):
+        while self.fd >= 0:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            except OSError:
+                self.lost = True
+                return
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+                offset += length
+                self._handle_event(wd, mask, name)
+
+    def _handle_event(self, wd, mask, name):
+        if mask & IN_Q_OVERFLOW:
+            self.lost = True
+            return
+        folder_path = self.watches.get(wd)
+        if folder_path is None:
+            return
+        if mask & IN_IGNORED:
+            del self.watches[wd]
+            return
+        if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+            self.changed.add((folder_path, True))
+            return
+        path = folder_path + "/" + name if folder_path else name
+        is_folder = bool(mask & IN_ISDIR)
+        if self.project.is_ignored(self._get_resource(path, is_folder)):
+            return
+        self.changed.add((path, is_folder))
+        if mask & (IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO):
+            # The children of the folder have changed, too
+            self.changed.add((folder_path, True))
+        if is_folder and mask & (IN_CREATE | IN_MOVED_TO):
+            self._watch_tree(self.project.get_folder(path))
+
+    def _get_resource(self, path, is_folder):
+        if is_folder:
+            return self.project.get_folder(path)
+        return self.project.get_file(path)
+
+
+def _contains(folder_path, path):
+    return (
+        folder_path == "" or path == folder_path or path.startswith(folder_path + "/")
+    )
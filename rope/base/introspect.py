@@ -0,0 +1,182 @@
+"""Introspecting extension modules in another process
+
+When ``introspect_in_subprocess`` project config is `True`,
+`rope.base.builtins.BuiltinModule` does not import extension modules
+into rope's process.  Instead, the names, kinds, docstrings and
+parameters of their attributes are collected by a child interpreter
+and saved in the ``introspection`` folder inside project's rope
+folder, keyed by module file and interpreter version.
+
+"""
+
+import contextlib
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import subprocess
+import sys
+
+# The levels of attributes described; attributes of module members'
+# attributes are not described
+_MAX_DEPTH = 2
+
+_TIMEOUT = 60
+
+_CHILD_CODE = (
+    "import json, sys\n"
+    "data = json.load(sys.stdin)\n"
+    "sys.path[:] = data['path']\n"
+    "from rope.base import introspect\n"
+    "introspect._write_description(data['name'], sys.stdout)\n"
+)
+
+# Descriptions of modules in this process, by cache key
+_descriptions = {}
+
+
+def get_description(project, name):
+    """Return the description of `name` extension module
+
+    `None` is returned if the module cannot be imported.  See
+    `describe()` for the format.
+
+    """
+    key = _get_key(name)
+    if key in _descriptions:
+        return _descriptions[key]
+    path = _get_cache_path(project, key)
+    description = _read_cached(path)
+    if description is None:
+        description = _describe_in_subprocess(name)
+        if description is not None:
+            _write_cached(path, description)
+    _descriptions[key] = description
+    return description
+
+
+def describe(obj, depth=0):
+    """Return a JSON serializable description of `obj`
+
+    Descriptions are dicts with ``kind`` (``"class"``, ``"function"``
+    or ``"unknown"``), ``name``, ``doc``, ``type_name`` and
+    ``attributes`` keys; functions also have ``params``, a list of
+    parameter names if their signature is available.
+
+    """
+    if inspect.isclass(obj):
+        kind = "class"
+    elif inspect.isroutine(obj):
+        kind = "function"
+    else:
+        kind = "unknown"
+    result = {
+        "kind": kind,
+        "name": _get_str(obj, "__name__"),
+        "doc": _get_str(obj, "__doc__"),
+        "type_name": _get_str(type(obj), "__name__"),
+        "attributes": {},
+    }
+    if kind == "function":
+        result["params"] = _get_params(obj)
+    if depth < _MAX_DEPTH:
+        for attr in dir(obj):
+            try:
+                child = getattr(obj, attr)
+            except Exception:
+                continue
+            result["attributes"][attr] = describe(child, depth + 1)
+    return result
+
+
+def _get_str(obj, name):
+    value = getattr(obj, name, None)
+    return value if isinstance(value, str) else None
+
+
+def _get_params(function):
+    try:
+        signature = inspect.signature(function)
+    except (TypeError, ValueError):
+        return []
+    return list(signature.parameters)
+
+
+def _write_description(name, output):
+    try:
+        module = __import__(name)
+        for token in name.split(".")[1:]:
+            module = getattr(module, token)
+        description = describe(module)
+    except Exception:
+        description = None
+    # Modules may print while being imported; the last line is ours
+    output.write("\n" + json.dumps(description) + "\n")
+
+
+def _describe_in_subprocess(name):
+    data = json.dumps({"name": name, "path": sys.path})
+    try:
+        process = subprocess.run(
+            [sys.executable, "-c", _CHILD_CODE],
+            input=data,
+            capture_output=True,
+            text=True,
+            timeout=_TIMEOUT,
+        )
+        return json.loads(process.stdout.splitlines()[-1])
+    except (OSError, ValueError, IndexError, subprocess.SubprocessError):
+        return None
+
+
+def _get_key(name):
+    """Return the cache key of `name`
+
+    The key depends on the file of the module, or its top-level
+    package, and the running interpreter.  Dotted names are not looked
+    up, because finding a submodule imports its parent packages.
+
+    """
+    origin = None
+    with contextlib.suppress(Exception):
+        spec = importlib.util.find_spec(name.split(".")[0])
+        if spec is not None:
+            origin = spec.origin
+    mtime = None
+    if origin is not None:
+        with contextlib.suppress(OSError):
+            mtime = os.stat(origin).st_mtime_ns
+    return "\0".join(map(str, (sys.version, sys.executable, name, origin, mtime)))
+
+
+def _get_cache_path(project, key):
+    ropefolder = getattr(project, "ropefolder", None)
+    if ropefolder is None:
+        return None
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(ropefolder.real_path, "introspection", digest + ".json")
+
+
+def _read_cached(path):
+    if path is None:
+        return None
+    try:
+        with open(path, encoding="utf-8") as input_file:
+            return json.load(input_file)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached(path, description):
+    if path is None:
+        return
+    temp_path = "%s.%d.tmp" % (path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as output_file:
+            json.dump(description, output_file)
+        os.replace(temp_path, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
@@ -3,8 +3,7 @@
 import os.path
 
 import rope.base.project
-import rope.base.pycore
-from rope.base import pyobjectsdef, taskhandle, utils
+from rope.base import parallel, taskhandle, utils
 
 
 def path_to_resource(project, path, type=None):
@@ -57,6 +56,8 @@ def report_change(project, path, old_content):
     for observer in list(project.observers):
         observer.resource_changed(resource)
     if project.pycore.automatic_soa:
+        import rope.base.pycore
+
         rope.base.pycore.perform_soa_on_changed_scopes(project, resource, old_content)
 
 
@@ -71,10 +72,18 @@ def analyze_module(project, resource):
 def analyze_modules(project, task_handle=taskhandle.DEFAULT_TASK_HANDLE):
     """Perform static object analysis on all python files in the project
 
-    Note that this might be really time consuming.
+    Note that this might be really time consuming.  If
+    ``worker_processes`` project config is positive, modules are
+    analyzed in that many processes; see
+    `rope.base.oi.soa.analyze_modules_in_parallel()`.
     """
     resources = project.get_python_files()
     job_set = task_handle.create_jobset("Analyzing Modules", len(resources))
+    if parallel.can_run_in_parallel(project, resources):
+        import rope.base.oi.soa
+
+        rope.base.oi.soa.analyze_modules_in_parallel(project, resources, job_set)
+        return
     for resource in resources:
         job_set.started_job(resource.path)
         analyze_module(project, resource)
@@ -89,6 +98,8 @@ def get_string_module(project, code, resource=None, force_errors=False):
     ``ignore_syntax_errors`` project config.
 
     """
+    from rope.base import pyobjectsdef
+
     return pyobjectsdef.PyModule(
         project.pycore, code, resource, force_errors=force_errors
     )
@@ -0,0 +1,151 @@
+"""An index of the identifiers used in project files
+
+`NameIndex` maps each identifier to the files that contain it.  It is
+used for skipping the files that cannot contain a name before reading
+and analyzing them when searching for its occurrences.
+
+"""
+
+import os
+import re
+
+from rope.base import exceptions, resourceobserver
+
+_identifier_pattern = re.compile(r"\w+")
+
+
+class NameIndex:
+    """An inverted index of identifiers in project files
+
+    Files are indexed lazily, the first time they are asked about.
+    Changes made through rope are tracked with a resource observer and
+    external changes are noticed when the project is validated.  If
+    ``save_name_index`` project config is `True`, the index is saved in
+    project's rope folder and entries are checked against the
+    modification time and size of their files once per session.
+
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self.files = {}
+        self.names = {}
+        self._checked = set()
+        self._changed = False
+        self._load()
+        self.project.data_files.add_write_hook(self.write)
+        observer = resourceobserver.ResourceObserver(
+            changed=self._forget,
+            moved=self._moved,
+            created=self._forget,
+            removed=self._forget,
+            validate=self._validate,
+        )
+        self.project.add_observer(observer)
+
+    @property
+    def persist(self):
+        return self.project.prefs.get("save_name_index", False)
+
+    def may_contain(self, resource, name):
+        """Return `False` if `name` does not appear in `resource`
+
+        The name is matched as a whole identifier like rope's textual
+        occurrence search; the name may appear in strings or comments.
+
+        """
+        if resource.project is not self.project or not _is_identifier(name):
+            return True
+        try:
+            self._index(resource)
+        except (OSError, exceptions.RopeError):
+            return True
+        return resource.path in self.names.get(name, ())
+
+    def get_resources(self, name, resources=None):
+        """Return the resources that may contain `name`
+
+        If `resources` is `None`, all python files of the project are
+        considered.
+
+        """
+        if resources is None:
+            resources = self.project.get_python_files()
+        return [resource for resource in resources if self.may_contain(resource, name)]
+
+    def _index(self, resource):
+        path = resource.path
+        if path in self.files:
+            if path in self._checked:
+                return
+            self._checked.add(path)
+            if self.files[path][0] == _get_indicator(resource):
+                return
+            self._remove(path)
+        indicator = _get_indicator(resource)
+        names = frozenset(_identifier_pattern.findall(resource.read()))
+        self.files[path] = (indicator, names)
+        self._checked.add(path)
+        for name in names:
+            self.names.setdefault(name, set()).add(path)
+        self._changed = True
+
+    def _remove(self, path):
+        entry = self.files.pop(path, None)
+        self._checked.discard(path)
+        if entry is None:
+            return
+        for name in entry[1]:
+            paths = self.names.get(name)
+            if paths is not None:
+                paths.discard(path)
+                if not paths:
+                    del self.names[name]
+        self._changed = True
+
+    def _forget(self, resource):
+        if resource.is_folder():
+            prefix = resource.path + "/" if resource.path else ""
+            for path in [path for path in self.files if path.startswith(prefix)]:
+                self._remove(path)
+        else:
+            self._remove(resource.path)
+
+    def _moved(self, resource, new_resource=None):
+        self._forget(resource)
+        if new_resource is not None:
+            self._forget(new_resource)
+
+    def _validate(self, folder):
+        prefix = folder.path + "/" if folder.path else ""
+        for path in list(self.files):
+            if path.startswith(prefix) or path == folder.path:
+                self._checked.discard(path)
+
+    def _load(self):
+        if self.persist:
+            result = self.project.data_files.read_data("nameindex")
+            if result is not None:
+                for path, (indicator, names) in result.items():
+                    names = frozenset(names)
+                    self.files[path] = (indicator, names)
+                    for name in names:
+                        self.names.setdefault(name, set()).add(path)
+
+    def write(self):
+        if self.persist and self._changed:
+            data = {
+                path: (indicator, sorted(names))
+                for path, (indicator, names) in self.files.items()
+            }
+            self.project.data_files.write_data("nameindex", data)
+            self._changed = False
+
+
+def _is_identifier(name):
+    return _identifier_pattern.fullmatch(name) is not None
+
+
+def _get_indicator(resource):
+    stat = os.stat(resource.real_path)
+    return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,115 @@
+"""Scheduling static object analysis with a call graph
+
+When ``soa_call_graph_budget`` project config is positive, rope
+records the functions each scope calls while performing static object
+analysis.  After the changed scopes of a saved module are analyzed,
+`analyze_affected()` analyzes their callers, whose calls may pass the
+objects they return, and their callees; the callees of the functions
+whose analysis changes the saved object information are analyzed, too.
+At most ``soa_call_graph_budget`` functions are analyzed after each
+save; the rest remain scheduled and are analyzed after later saves.
+
+Scopes are identified by ``(path, key)`` tuples, like in
+`rope.base.oi.objectdb`.
+
+"""
+
+import contextlib
+
+from rope.base import exceptions
+from rope.base.oi import soa
+
+
+class CallGraph:
+    def __init__(self):
+        self.callees = {}
+        self.callers = {}
+        # Scopes waiting to be analyzed, in the order they were scheduled
+        self.scheduled = {}
+
+    def add_call(self, caller, callee):
+        self.callees.setdefault(caller, set()).add(callee)
+        self.callers.setdefault(callee, set()).add(caller)
+
+    def forget_calls_from(self, caller):
+        """Forget the calls of `caller`; it is being analyzed again"""
+        for callee in self.callees.pop(caller, ()):
+            callers = self.callers[callee]
+            callers.discard(caller)
+            if not callers:
+                del self.callers[callee]
+
+    def get_callers(self, scope):
+        return self.callers.get(scope, set())
+
+    def get_callees(self, scope):
+        return self.callees.get(scope, set())
+
+    def schedule(self, scopes):
+        for scope in scopes:
+            self.scheduled[scope] = None
+
+    def unschedule(self, scopes):
+        for scope in scopes:
+            self.scheduled.pop(scope, None)
+
+    def pop_scheduled(self, count):
+        """Remove and return at most `count` of the scheduled scopes"""
+        result = []
+        for scope in self.scheduled:
+            if len(result) == count:
+                break
+            result.append(scope)
+        self.unschedule(result)
+        return result
+
+
+def analyze_affected(pycore, changed):
+    """Analyze scopes affected by analyzing `changed` scopes
+
+    `changed` is a list of ``(path, key)`` tuples of the scopes that
+    have been analyzed after they have changed.
+
+    """
+    object_info = pycore.object_info
+    call_graph = object_info.call_graph
+    budget = pycore.project.prefs.get("soa_call_graph_budget", 0)
+    if call_graph is None or budget <= 0:
+        return
+    for scope in changed:
+        call_graph.schedule(call_graph.get_callers(scope))
+        call_graph.schedule(call_graph.get_callees(scope))
+    call_graph.unschedule(changed)
+    changes = object_info.objectdb.changes
+    while budget > 0 and call_graph.scheduled:
+        scopes = call_graph.pop_scheduled(budget)
+        budget -= len(scopes)
+        keys_by_path = {}
+        for path, key in scopes:
+            keys_by_path.setdefault(path, set()).add(key)
+        for path, keys in keys_by_path.items():
+            _analyze_scopes(pycore, path, keys)
+    # Forgetting concluded data once, instead of for each analyzed
+    # module like `PyCore.analyze_module()`
+    if object_info.objectdb.changes != changes:
+        pycore.module_cache.forget_all_data()
+
+
+def _analyze_scopes(pycore, path, keys):
+    object_info = pycore.object_info
+    call_graph = object_info.call_graph
+    resource = object_info.to_pyobject.path_to_resource(path)
+    if resource is None or not resource.exists():
+        return
+    changes = object_info.objectdb.changes
+    with contextlib.suppress(exceptions.ModuleSyntaxError):
+        soa.analyze_module(
+            pycore,
+            pycore.resource_to_pyobject(resource),
+            lambda pydefined: object_info._get_scope(pydefined)[1] in keys,
+            lambda pydefined: True,
+            pycore.project.prefs.get("soa_followed_calls", 0),
+        )
+    if object_info.objectdb.changes != changes:
+        for key in keys:
+            call_graph.schedule(call_graph.get_callees((path, key)))
@@ -50,7 +50,13 @@ class MemoryDB(objectdb.FileDict):
 
     def write(self):
         if self.persist:
-            self.project.data_files.write_data("objectdb", self._files)
+            files = self._files
+            if self.project.data_files.writes_in_background:
+                files = _copy_files(files)
+            self.project.data_files.write_data("objectdb", files)
+
+    def close(self):
+        """Nothing is kept open; data is saved by `write()`"""
 
     @property
     @utils.deprecated("compress_objectdb is no longer supported")
@@ -115,6 +121,11 @@ class ScopeInfo(objectdb.ScopeInfo):
     def add_call(self, parameters, returned):
         self.call_info[parameters] = returned
 
+    def __reduce__(self):
+        # Pickled in the legacy format, which is much faster to pickle
+        # than the JSON-compatible encoding of `__getstate__()`
+        return (self.__class__, (), (self.call_info, self.per_name))
+
     def __getstate__(self):
         original_data = (self.call_info, self.per_name)
         encoded = python_to_json(original_data, version=2)
@@ -129,3 +140,19 @@ class ScopeInfo(objectdb.ScopeInfo):
             # new serialization
             assert data["$"] == "ScopeInfo"
             self.call_info, self.per_name = json_to_python(data)
+
+
+def _copy_files(files):
+    """Return a copy of `files` that does not change with it
+
+    Textual object information is made of tuples and strings and is
+    not copied.
+    """
+    result = {}
+    for path, scopes in files.items():
+        result[path] = file_copy = {}
+        for key, scope_info in scopes.items():
+            file_copy[key] = copy = ScopeInfo()
+            copy.call_info = dict(scope_info.call_info)
+            copy.per_name = dict(scope_info.per_name)
+    return result
@@ -4,11 +4,14 @@ class ObjectDB:
         self.validation = validation
         self.observers = []
         self.files = db.files
+        # The number of times saved information has changed
+        self.changes = 0
 
     def validate_files(self):
         for file in list(self.files):
             if not self.validation.is_file_valid(file):
                 del self.files[file]
+                self.changes += 1
                 self._file_removed(file)
 
     def validate_file(self, file):
@@ -17,11 +20,13 @@ class ObjectDB:
         for key in list(self.files[file]):
             if not self.validation.is_scope_valid(file, key):
                 del self.files[file][key]
+                self.changes += 1
 
     def file_moved(self, file, newfile):
         if file not in self.files:
             return
         self.files.rename(file, newfile)
+        self.changes += 1
         self._file_removed(file)
         self._file_added(newfile)
 
@@ -48,12 +53,16 @@ class ObjectDB:
         scope_info = self._get_scope_info(path, key, readonly=False)
         old_returned = scope_info.get_returned(args)
         if self.validation.is_more_valid(returned, old_returned):
+            if returned != old_returned:
+                self.changes += 1
             scope_info.add_call(args, returned)
 
     def add_pername(self, path, key, name, value):
         scope_info = self._get_scope_info(path, key, readonly=False)
         old_value = scope_info.get_per_name(name)
         if self.validation.is_more_valid(value, old_value):
+            if value != old_value:
+                self.changes += 1
             scope_info.save_per_name(name, value)
 
     def add_file_list_observer(self, observer):
@@ -62,6 +71,9 @@ class ObjectDB:
     def write(self):
         self.db.write()
 
+    def close(self):
+        self.db.close()
+
     def _get_scope_info(self, path, key, readonly=True):
         if path not in self.files:
             if readonly:
@@ -1,7 +1,7 @@
 import warnings
 
 from rope.base import exceptions, resourceobserver
-from rope.base.oi import memorydb, objectdb, transform
+from rope.base.oi import callgraph, memorydb, objectdb, sqlitedb, transform
 
 
 class ObjectInfoManager:
@@ -18,6 +18,9 @@ class ObjectInfoManager:
         self.to_pyobject = transform.TextualToPyObject(project)
         self.doi_to_pyobject = transform.DOITextualToPyObject(project)
         self._init_objectdb()
+        self.call_graph = None
+        if project.prefs.get("soa_call_graph_budget", 0) > 0:
+            self.call_graph = callgraph.CallGraph()
         if project.prefs.get("validate_objectdb", False):
             self._init_validation()
 
@@ -34,9 +37,22 @@ class ObjectInfoManager:
             if dbtype != "memory" and self.project.ropefolder is not None:
                 persist = True
         self.validation = TextualValidation(self.to_pyobject)
-        db = memorydb.MemoryDB(self.project, persist=persist)
+        if self._uses_sqlite(persist):
+            db = sqlitedb.SQLiteDB(self.project)
+        else:
+            db = memorydb.MemoryDB(self.project, persist=persist)
         self.objectdb = objectdb.ObjectDB(db, self.validation)
 
+    def _uses_sqlite(self, persist):
+        prefs = self.project.get_prefs()
+        if persist is None:
+            persist = prefs.get("save_objectdb", False)
+        return (
+            persist
+            and self.project.ropefolder is not None
+            and prefs.get("objectdb_backend", "memory") == "sqlite"
+        )
+
     def _init_validation(self):
         self.objectdb.validate_files()
         observer = resourceobserver.ResourceObserver(
@@ -82,7 +98,7 @@ class ObjectInfoManager:
             if result is None:
                 result = returned
         if result is not None:
-            return self.to_pyobject(result)
+            return self._to_pyobject(pyobject, result)
 
     def get_exact_returned(self, pyobject, args):
         path, key = self._get_scope(pyobject)
@@ -91,7 +107,7 @@ class ObjectInfoManager:
                 path, key, self._args_to_textual(pyobject, args)
             )
             if returned is not None:
-                return self.to_pyobject(returned)
+                return self._to_pyobject(pyobject, returned)
 
     def _args_to_textual(self, pyfunction, args):
         parameters = list(pyfunction.get_param_names(special_args=False))
@@ -117,7 +133,7 @@ class ObjectInfoManager:
             if unknowns == 0:
                 break
         if unknowns < arg_count:
-            return [self.to_pyobject(parameter) for parameter in parameters]
+            return [self._to_pyobject(pyobject, parameter) for parameter in parameters]
 
     def get_passed_objects(self, pyfunction, parameter_index):
         path, key = self._get_scope(pyfunction)
@@ -127,7 +143,7 @@ class ObjectInfoManager:
         for call_info in self.objectdb.get_callinfos(path, key):
             args = call_info.get_parameters()
             if len(args) > parameter_index:
-                parameter = self.to_pyobject(args[parameter_index])
+                parameter = self._to_pyobject(pyfunction, args[parameter_index])
                 if parameter is not None:
                     result.append(parameter)
         return result
@@ -151,6 +167,19 @@ class ObjectInfoManager:
             returned_text = self.to_textual(returned)
         self._save_data(function_text, params_text, returned_text)
 
+    def record_call(self, caller, pyfunction):
+        """Note that `caller` calls `pyfunction` in the call graph"""
+        if self.call_graph is not None:
+            caller_scope = self._get_scope(caller)
+            callee_scope = self._get_scope(pyfunction)
+            if caller_scope[0] is not None and callee_scope[0] is not None:
+                self.call_graph.add_call(caller_scope, callee_scope)
+
+    def forget_calls(self, caller):
+        """Forget the calls of `caller` in the call graph"""
+        if self.call_graph is not None:
+            self.call_graph.forget_calls_from(self._get_scope(caller))
+
     def save_per_name(self, scope, name, data):
         path, key = self._get_scope(scope.pyobject)
         if path is not None:
@@ -161,11 +190,27 @@ class ObjectInfoManager:
         if path is not None:
             result = self.objectdb.get_pername(path, key, name)
             if result is not None:
-                return self.to_pyobject(result)
+                return self._to_pyobject(scope.pyobject, result)
 
     def _save_data(self, function, args, returned=("unknown",)):
         self.objectdb.add_callinfo(function[1], function[2], args, returned)
 
+    def _to_pyobject(self, pyobject, textual):
+        """Transform `textual` and record the modules it refers to
+
+        The modules referenced by `textual` are registered as
+        dependencies of the module of `pyobject` so that its concluded
+        data is forgotten when they change.
+
+        """
+        module_cache = self.project.pycore.module_cache
+        pymodule = pyobject.get_module()
+        for path in _get_defined_paths(textual):
+            resource = self.to_pyobject.path_to_resource(path)
+            if resource is not None:
+                module_cache.add_dependency(pymodule, resource)
+        return self.to_pyobject(textual)
+
     def _get_scope(self, pyobject):
         resource = pyobject.get_module().get_resource()
         if resource is None:
@@ -183,6 +228,10 @@ class ObjectInfoManager:
     def sync(self):
         self.objectdb.sync()
 
+    def close(self):
+        """Release the files the object information is saved in"""
+        self.objectdb.close()
+
     def __str__(self):
         return str(self.objectdb)
 
@@ -213,6 +262,16 @@ class TextualValidation:
         return self.to_pyobject(textual) is not None
 
 
+def _get_defined_paths(textual):
+    if not isinstance(textual, (tuple, list)) or not textual:
+        return
+    if textual[0] == "defined":
+        yield textual[1]
+        return
+    for item in textual[1:]:
+        yield from _get_defined_paths(item)
+
+
 class _FileListObserver:
     def __init__(self, object_info):
         self.object_info = object_info
@@ -1,7 +1,7 @@
 import rope.base.ast
 import rope.base.oi.soi
 import rope.base.pynames
-from rope.base import arguments, evaluate, nameanalyze, pyobjects
+from rope.base import arguments, evaluate, nameanalyze, parallel, pyobjects
 
 
 def analyze_module(pycore, pymodule, should_analyze, search_subscopes, followed_calls):
@@ -14,6 +14,79 @@ def analyze_module(pycore, pymodule, should_analyze, search_subscopes, followed_
     _analyze_node(pycore, pymodule, should_analyze, search_subscopes, followed_calls)
 
 
+def analyze_modules_in_parallel(project, resources, job_set):
+    """Analyze `resources` modules in worker processes
+
+    Each worker analyzes some of the modules with its own object
+    information and sends the data it has added back; the data is
+    saved in the object information of `project` afterwards.  Unlike
+    analyzing modules one after another in one process, the analysis
+    of a module does not use the information collected from modules
+    analyzed in other workers.  See `rope.base.parallel`.
+
+    """
+    objectdb = project.pycore.object_info.objectdb
+    for _, (call_infos, per_names) in parallel.run(
+        project, _analyze_modules_in_worker, resources, job_set
+    ):
+        for path, key, args, returned in call_infos:
+            objectdb.add_callinfo(path, key, args, returned)
+        for path, key, name, value in per_names:
+            objectdb.add_pername(path, key, name, value)
+    project.pycore.module_cache.forget_all_data()
+
+
+def _analyze_modules_in_worker(project, paths):
+    object_info = project.pycore.object_info
+    recorder = _RecordingObjectDB(object_info.objectdb)
+    object_info.objectdb = recorder
+    try:
+        for path in paths:
+            project.pycore.analyze_module(project.get_resource(path))
+    finally:
+        object_info.objectdb = recorder.objectdb
+    return recorder.get_added_data()
+
+
+class _RecordingObjectDB:
+    """Records the places data is added to an `objectdb.ObjectDB`"""
+
+    def __init__(self, objectdb):
+        self.objectdb = objectdb
+        self.call_infos = {}
+        self.per_names = {}
+
+    def add_callinfo(self, path, key, args, returned):
+        self.objectdb.add_callinfo(path, key, args, returned)
+        self.call_infos[(path, key, args)] = None
+
+    def add_pername(self, path, key, name, value):
+        self.objectdb.add_pername(path, key, name, value)
+        self.per_names[(path, key, name)] = None
+
+    def get_added_data(self):
+        """Return the textual data added to the recorded places
+
+        A ``(call_infos, per_names)`` tuple of lists of ``(path, key,
+        args, returned)`` and ``(path, key, name, value)`` tuples is
+        returned; the values are those saved in the database, which
+        may not be the last values added.
+
+        """
+        call_infos = []
+        for path, key, args in self.call_infos:
+            scope_info = self.objectdb._get_scope_info(path, key)
+            call_infos.append((path, key, args, scope_info.get_returned(args)))
+        per_names = []
+        for path, key, name in self.per_names:
+            scope_info = self.objectdb._get_scope_info(path, key)
+            per_names.append((path, key, name, scope_info.get_per_name(name)))
+        return call_infos, per_names
+
+    def __getattr__(self, name):
+        return getattr(self.objectdb, name)
+
+
 def _analyze_node(pycore, pydefined, should_analyze, search_subscopes, followed_calls):
     if search_subscopes(pydefined):
         for scope in pydefined.get_scope().get_scopes():
@@ -30,6 +103,7 @@ def _analyze_node(pycore, pydefined, should_analyze, search_subscopes, followed_
                 pycore, pyfunction, return_true, return_false, new_followed_calls
             )
 
+        pycore.object_info.forget_calls(pydefined)
         visitor = SOAVisitor(pycore, pydefined, _follow if followed_calls else None)
         for child in rope.base.ast.iter_child_nodes(pydefined.get_ast()):
             visitor.visit(child)
@@ -81,6 +155,7 @@ class SOAVisitor(rope.base.ast.RopeNodeVisitor):
             self.pycore.object_info.function_called(
                 pyfunction, args.get_arguments(pyfunction.get_param_names())
             )
+            self.pycore.object_info.record_call(self.scope.pyobject, pyfunction)
             pyfunction._set_parameter_pyobjects(None)
             if self.follow is not None:
                 after = self._parameter_objects(pyfunction)
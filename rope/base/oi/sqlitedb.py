@@ -0,0 +1,217 @@
+"""An object database stored in an SQLite database
+
+When ``save_objectdb`` is `True` and ``objectdb_backend`` project
+config is ``"sqlite"``, object information is saved in the
+``objectdb.sqlite3`` file inside project's rope folder instead of the
+pickled ``objectdb`` data file.  Each scope is kept in its own row;
+rows are read when their scopes are first used and only the scopes
+changed since the last write are saved when the project is synced.
+
+"""
+
+import os
+import pickle
+import sqlite3
+import weakref
+
+from rope.base.oi import memorydb, objectdb
+
+_SCHEMA_VERSION = 1
+
+
+class SQLiteDB(objectdb.FileDict):
+    def __init__(self, project):
+        self.project = project
+        self.files = self
+        self.connection = sqlite3.connect(
+            os.path.join(project.ropefolder.real_path, "objectdb.sqlite3"),
+            check_same_thread=False,
+        )
+        self._finalizer = weakref.finalize(self, self.connection.close)
+        self._file_infos = {}
+        self._setup_db()
+        self._paths = {
+            path for (path,) in self.connection.execute("SELECT path FROM files")
+        }
+        self.project.data_files.add_write_hook(self.write)
+
+    def _setup_db(self):
+        (version,) = self.connection.execute("PRAGMA user_version").fetchone()
+        if version == _SCHEMA_VERSION:
+            return
+        self.connection.executescript("""
+            DROP TABLE IF EXISTS files;
+            DROP TABLE IF EXISTS scopes;
+            CREATE TABLE files (path TEXT PRIMARY KEY);
+            CREATE TABLE scopes (
+                path TEXT, key TEXT, data BLOB, PRIMARY KEY (path, key)
+            );
+            """)
+        self._import_data_file()
+        self.connection.execute("PRAGMA user_version = %d" % _SCHEMA_VERSION)
+        self.connection.commit()
+
+    def _import_data_file(self):
+        """Copy the object information saved by `memorydb.MemoryDB`"""
+        files = self.project.data_files.read_data("objectdb")
+        if not isinstance(files, dict):
+            return
+        self.connection.executemany(
+            "INSERT INTO files VALUES (?)", [(path,) for path in files]
+        )
+        self.connection.executemany(
+            "INSERT INTO scopes VALUES (?, ?, ?)",
+            [
+                (path, key, _dumps(scope_info))
+                for path, scopes in files.items()
+                for key, scope_info in scopes.items()
+            ],
+        )
+
+    def keys(self):
+        return self._paths
+
+    def __iter__(self):
+        yield from self._paths
+
+    def __len__(self):
+        return len(self._paths)
+
+    def __setitem__(self):
+        raise NotImplementedError()
+
+    def __contains__(self, key):
+        return key in self._paths
+
+    def __getitem__(self, key):
+        if key not in self._paths:
+            raise KeyError(key)
+        if key not in self._file_infos:
+            self._file_infos[key] = FileInfo(self, key)
+        return self._file_infos[key]
+
+    def create(self, path):
+        self._paths.add(path)
+        self._file_infos[path] = FileInfo(self, path, keys=set())
+        self.connection.execute("INSERT OR IGNORE INTO files VALUES (?)", (path,))
+
+    def rename(self, file, newfile):
+        if file not in self._paths:
+            return
+        if newfile in self._paths:
+            del self[newfile]
+        file_info = self[file]
+        self._paths.remove(file)
+        self._paths.add(newfile)
+        file_info.path = newfile
+        self._file_infos[newfile] = self._file_infos.pop(file)
+        self.connection.execute(
+            "UPDATE files SET path = ? WHERE path = ?", (newfile, file)
+        )
+        self.connection.execute(
+            "UPDATE scopes SET path = ? WHERE path = ?", (newfile, file)
+        )
+
+    def __delitem__(self, file):
+        self._paths.remove(file)
+        self._file_infos.pop(file, None)
+        self.connection.execute("DELETE FROM files WHERE path = ?", (file,))
+        self.connection.execute("DELETE FROM scopes WHERE path = ?", (file,))
+
+    def write(self):
+        if not self._finalizer.alive:
+            return
+        changed = []
+        for path, file_info in self._file_infos.items():
+            for key, scope_info in file_info.scopes.items():
+                if scope_info.changed:
+                    changed.append((path, key, _dumps(scope_info)))
+                    scope_info.changed = False
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO scopes VALUES (?, ?, ?)", changed
+        )
+        self.connection.commit()
+
+    def close(self):
+        """Write the changes and close the database"""
+        self.write()
+        self._finalizer()
+
+
+class FileInfo(objectdb.FileInfo):
+    def __init__(self, db, path, keys=None):
+        self.db = db
+        self.path = path
+        self.scopes = {}
+        self._keys = keys
+
+    def _get_keys(self):
+        if self._keys is None:
+            self._keys = {
+                key
+                for (key,) in self.db.connection.execute(
+                    "SELECT key FROM scopes WHERE path = ?", (self.path,)
+                )
+            }
+        return self._keys
+
+    def create_scope(self, key):
+        self._get_keys().add(key)
+        self.scopes[key] = ScopeInfo()
+
+    def keys(self):
+        return self._get_keys()
+
+    def __contains__(self, key):
+        return key in self._get_keys()
+
+    def __getitem__(self, key):
+        if key not in self.scopes:
+            if key not in self._get_keys():
+                raise KeyError(key)
+            (data,) = self.db.connection.execute(
+                "SELECT data FROM scopes WHERE path = ? AND key = ?",
+                (self.path, key),
+            ).fetchone()
+            self.scopes[key] = ScopeInfo(*pickle.loads(data))
+        return self.scopes[key]
+
+    def __delitem__(self, key):
+        self._get_keys().remove(key)
+        self.scopes.pop(key, None)
+        self.db.connection.execute(
+            "DELETE FROM scopes WHERE path = ? AND key = ?", (self.path, key)
+        )
+
+    def __iter__(self):
+        yield from self._get_keys()
+
+    def __len__(self):
+        return len(self._get_keys())
+
+    def __setitem__(self):
+        raise NotImplementedError()
+
+
+class ScopeInfo(memorydb.ScopeInfo):
+    """A `memorydb.ScopeInfo` that notes whether it has changed"""
+
+    def __init__(self, call_info=None, per_name=None):
+        super().__init__()
+        self.changed = call_info is None
+        if call_info is not None:
+            self.call_info = call_info
+        if per_name is not None:
+            self.per_name = per_name
+
+    def save_per_name(self, name, value):
+        super().save_per_name(name, value)
+        self.changed = True
+
+    def add_call(self, parameters, returned):
+        super().add_call(parameters, returned)
+        self.changed = True
+
+
+def _dumps(scope_info):
+    return pickle.dumps((scope_info.call_info, scope_info.per_name), 2)
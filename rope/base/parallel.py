@@ -0,0 +1,196 @@
+"""Running project-wide analyses in worker processes
+
+Each worker process opens its own `rope.base.project.Project` for the
+same project root with the preferences of the main project; the
+results of the workers should be plain data that can be pickled.
+Worker projects do not use the rope folder and never save anything;
+their object information is a copy of the main project's, taken when
+the workers are started.
+
+Workers are started with the ``forkserver`` or ``spawn`` start methods,
+since forking a process that may be running other threads is unsafe.
+The workers of a project are reused until its object information or
+preferences change or `shutdown()` is called; changes are noticed
+using `rope.base.oi.objectdb.ObjectDB.changes`.
+
+"""
+
+import dataclasses
+import multiprocessing
+import pickle
+import weakref
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+_worker_project = None
+_worker_generation = None
+
+_NOT_INHERITED_PREFS = ("callbacks", "project_opened")
+
+# The `_WorkerPool` of each project
+_pools = weakref.WeakKeyDictionary()
+
+
+def get_processes(project):
+    """Return the number of worker processes to use for `project`
+
+    It is ``worker_processes`` project config; `0` means not to use
+    worker processes at all.
+
+    """
+    return project.prefs.get("worker_processes", 0) or 0
+
+
+def can_run_in_parallel(project, resources):
+    if get_processes(project) < 1 or len(resources) < 2:
+        return False
+    return getattr(project, "address", None) is not None and all(
+        resource.project is project for resource in resources
+    )
+
+
+def run(project, function, resources, job_set, *args, chunk_size=16):
+    """Call `function(worker_project, paths, *args)` in worker processes
+
+    `resources` are split into chunks of at most `chunk_size` and
+    `function` is called once for each chunk with the paths of the
+    resources in it.  It should be a module level function and its
+    return value is yielded alongside the resources of each chunk as
+    the workers finish them.  Progress is reported to `job_set` and
+    remaining chunks are cancelled if the task is interrupted.
+
+    """
+    chunks = [
+        resources[index : index + chunk_size]
+        for index in range(0, len(resources), chunk_size)
+    ]
+    pool = _get_pool(project)
+    futures = {
+        pool.submit(function, [resource.path for resource in chunk], args): chunk
+        for chunk in chunks
+    }
+    try:
+        for future in as_completed(futures):
+            chunk = futures[future]
+            result = future.result()
+            for resource in chunk:
+                job_set.started_job(resource.path)
+                job_set.finished_job()
+            yield chunk, result
+    except BrokenProcessPool:
+        shutdown(project)
+        raise
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def shutdown(project):
+    """Stop the worker processes of `project`, if any"""
+    pool = _pools.pop(project, None)
+    if pool is not None:
+        pool.close()
+
+
+class _WorkerPool:
+    def __init__(self, processes, key, initargs):
+        self.key = key
+        self.generation = 0
+        executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=_get_context(),
+            initializer=_init_worker,
+            initargs=initargs,
+        )
+        self.close = weakref.finalize(self, executor.shutdown, cancel_futures=True)
+        self.executor = executor
+
+    def submit(self, function, paths, args):
+        return self.executor.submit(
+            _call_in_worker, self.generation, function, paths, args
+        )
+
+
+def _get_pool(project):
+    objectdb = project.pycore.object_info.objectdb
+    prefs = _get_worker_prefs(project)
+    # Object information is copied only when starting the workers
+    key = (project.address, prefs, weakref.ref(objectdb), objectdb.changes)
+    pool = _pools.get(project)
+    if pool is None or pool.key != key:
+        shutdown(project)
+        initargs = (project.address, prefs, _get_objectdb_snapshot(objectdb))
+        pool = _pools[project] = _WorkerPool(get_processes(project), key, initargs)
+    else:
+        # Files may have changed since the workers last used them
+        pool.generation += 1
+    return pool
+
+
+def _get_context():
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _get_objectdb_snapshot(objectdb):
+    """Return the textual object information in `objectdb`
+
+    It is a dict of ``{path: {key: (call_info, per_name)}}``.
+
+    """
+    files = objectdb.files
+    result = {}
+    for path in files:
+        file_info = files[path]
+        result[path] = {
+            key: (dict(file_info[key].call_info), dict(file_info[key].per_name))
+            for key in file_info
+        }
+    return result
+
+
+def _get_worker_prefs(project):
+    result = {}
+    for field in dataclasses.fields(project.prefs):
+        if field.name in _NOT_INHERITED_PREFS:
+            continue
+        value = project.prefs.get(field.name)
+        try:
+            pickle.dumps(value)
+        except Exception:
+            continue
+        result[field.name] = value
+    result["ignored_resources"] = list(project.ignored.patterns)
+    result.update(
+        save_objectdb=False,
+        save_history=False,
+        automatic_soa=False,
+        validate_objectdb=False,
+        worker_processes=0,
+        watch_resources=False,
+    )
+    return result
+
+
+def _init_worker(address, prefs, objectdb_snapshot):
+    global _worker_project
+    import rope.base.project
+
+    _worker_project = rope.base.project.Project(address, ropefolder=None, **prefs)
+    objectdb = _worker_project.pycore.object_info.objectdb
+    for path, scopes in objectdb_snapshot.items():
+        for key, (call_info, per_name) in scopes.items():
+            for args, returned in call_info.items():
+                objectdb.add_callinfo(path, key, args, returned)
+            for name, value in per_name.items():
+                objectdb.add_pername(path, key, name, value)
+
+
+def _call_in_worker(generation, function, paths, args):
+    global _worker_generation
+    if generation != _worker_generation:
+        if _worker_generation is not None:
+            _worker_project.validate()
+        _worker_generation = generation
+    return function(_worker_project, paths, *args)
@@ -109,6 +109,81 @@ class Prefs:
     save_objectdb: bool = field(
         default=False, description="Should rope save object information or not."
     )
+    data_files_format: str = field(
+        default="pickle",
+        description=dedent("""
+            The format of the files rope saves history, object information
+            and other data in, inside project's rope folder: ``"pickle"`` or
+            ``"json"``.  Data files saved in the other format are still read.
+        """),
+    )
+    write_data_files_in_background: bool = field(
+        default=False,
+        description=dedent("""
+            If ``True``, rope saves history, object information and other
+            data files in a background thread when the project is synced
+            and only waits for them to be written when it is closed.
+        """),
+    )
+    objectdb_backend: str = field(
+        default="memory",
+        description=dedent("""
+            How rope saves object information.  With ``"memory"`` all of it
+            is loaded when the project is opened and pickled into the
+            ``objectdb`` file when it is synced; with ``"sqlite"`` it is kept
+            in an SQLite database that is read lazily and updated only for
+            the scopes that have changed.
+        """),
+    )
+    max_cached_modules: Optional[int] = field(
+        default=None,
+        description=dedent("""
+            The maximum number of parsed modules rope keeps in memory.  Least
+            recently used modules are dropped when there are more.  ``None``
+            means no limit.
+        """),
+    )
+    incremental_reparse: bool = field(
+        default=False,
+        description=dedent("""
+            If ``True``, when a module changes only inside one top-level
+            function or class, rope reparses that definition instead of the
+            whole module and keeps the objects of other definitions.
+        """),
+    )
+    worker_processes: int = field(
+        default=0,
+        description=dedent("""
+            The number of worker processes rope uses for searching for
+            occurrences in project-wide refactorings like rename and for
+            analyzing all modules with ``libutils.analyze_modules()``.  ``0``
+            means doing them in the current process.
+        """),
+    )
+    save_name_index: bool = field(
+        default=False,
+        description=dedent("""
+            If ``True``, rope saves the index of the names used in project
+            files, which is used for skipping files when searching for
+            occurrences, and reuses it when the project is opened later.
+        """),
+    )
+    simplified_code_cache_size: int = field(
+        default=32,
+        description=dedent("""
+            The number of source codes whose simplified forms, used for finding
+            words and occurrences, rope keeps in memory.  This cache is shared
+            by all projects in the process.
+        """),
+    )
+    watch_resources: bool = field(
+        default=False,
+        description=dedent("""
+            If ``True``, rope watches project folders for changes made outside
+            rope using inotify on Linux and only validates the changed
+            resources.  It has no effect on other platforms.
+        """),
+    )
     compress_objectdb: bool = field(
         default=False,
         description="**Deprecated**. This has no effect",
@@ -119,6 +194,16 @@ class Prefs:
     soa_followed_calls: int = field(
         default=0, description="The depth of calls to follow in static object analysis"
     )
+    soa_call_graph_budget: int = field(
+        default=0,
+        description=dedent("""
+            If positive, rope records which functions call which while
+            performing static object analysis.  When a module is saved, it
+            also analyzes at most this many callers and callees of its changed
+            scopes that may be affected; the rest are analyzed after later
+            saves.
+        """),
+    )
     perform_doa: bool = field(
         default=True,
         description=dedent("""
@@ -160,6 +245,14 @@ Builtin and c-extension modules that are allowed to be imported and inspected by
         default=True,
         description="Add all standard c-extensions to ``extension_modules`` list.",
     )
+    introspect_in_subprocess: bool = field(
+        default=False,
+        description=dedent("""
+            If ``True``, rope does not import ``extension_modules`` into its
+            own process; they are inspected in a child process and the results
+            are saved in the rope folder for later sessions.
+        """),
+    )
     ignore_syntax_errors: bool = field(
         default=False,
         description=dedent("""
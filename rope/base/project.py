@@ -2,15 +2,16 @@ from __future__ import annotations
 
 import contextlib
 import json
+import logging
 import os
 import sys
+import threading
 import warnings
-from contextlib import ExitStack
 from typing import Optional
 
 import rope.base.fscommands  # Use full qualification for clarity.
 import rope.base.resourceobserver as resourceobserver
-from rope.base import exceptions, history, pycore, taskhandle, utils
+from rope.base import exceptions, inotify, nameindex, serializer, taskhandle, utils
 from rope.base.exceptions import ModuleNotFoundError
 
 # At present rope.base.prefs starts with `# type:ignore`.
@@ -23,6 +24,8 @@ try:
 except ImportError:
     import pickle  # type: ignore
 
+logger = logging.getLogger(__name__)
+
 
 class _Project:
     prefs: Prefs
@@ -178,13 +181,24 @@ class _Project:
     @property
     @utils.saveit
     def history(self):
+        from rope.base import history
+
         return history.History(self)
 
     @property
     @utils.saveit
     def pycore(self):
+        # Imported here so that importing this module does not load
+        # the object inference machinery
+        from rope.base import pycore
+
         return pycore.PyCore(self)
 
+    @property
+    @utils.saveit
+    def name_index(self):
+        return nameindex.NameIndex(self)
+
     def close(self):
         warnings.warn("Cannot close a NoProject", DeprecationWarning, stacklevel=2)
 
@@ -224,6 +238,7 @@ class Project(_Project):
         super().__init__(fscommands)
         self.ignored = _ResourceMatcher()
         self.file_list = _FileListCacher(self)
+        self.watcher = None
         self._init_prefs(prefs)
         if ropefolder is not None:
             self.prefs.add("ignored_resources", ropefolder)
@@ -253,6 +268,20 @@ class Project(_Project):
             if self.pycore.is_python_file(resource)
         ]
 
+    def iter_python_files(self, near=None):
+        """Yield the python files available in the project
+
+        Unlike `get_python_files()`, the project is listed while the
+        files are consumed, so callers can start processing them (or
+        stop) without waiting for the whole project to be listed.  If
+        `near` resource is given, the files in its folder come first,
+        then the ones in its parent folder and so on.
+
+        """
+        for resource in self.file_list.iter_files(near):
+            if self.pycore.is_python_file(resource):
+                yield resource
+
     def _get_resource_path(self, name):
         return os.path.join(self._address, *name.split("/"))
 
@@ -272,8 +301,10 @@ class Project(_Project):
         self.ignored.set_patterns(self.prefs.ignored_resources)
         for key, value in prefs.items():
             self.prefs.set(key, value)
-        self._init_other_parts()
+        utils.configure_caches(self.prefs)
         self._init_ropefolder()
+        self._init_other_parts()
+        self._init_watcher()
         if config.project_opened:
             config.project_opened(self)
 
@@ -281,16 +312,35 @@ class Project(_Project):
         # Forcing the creation of `self.pycore` to register observers
         self.pycore  # pylint: disable=pointless-statement
 
+    def _init_watcher(self):
+        if self.prefs.get("watch_resources", False) and inotify.is_available():
+            try:
+                self.watcher = inotify.InotifyWatcher(self)
+            except OSError:
+                self.watcher = None
+
     def is_ignored(self, resource):
         return self.ignored.does_match(resource)
 
     def sync(self):
-        """Closes project open resources"""
-        self.close()
+        """Saves project data files
+
+        When ``write_data_files_in_background`` project config is
+        `True`, this method returns before they are written.
+        """
+        self.data_files.write()
 
     def close(self):
         """Closes project open resources"""
+        from rope.base import parallel
+
+        parallel.shutdown(self)
+        if self.watcher is not None:
+            self.watcher.close()
+            self.watcher = None
         self.data_files.write()
+        self.data_files.flush()
+        self.pycore.object_info.close()
 
     def set(self, key, value):
         """Set the `key` preference to `value`"""
@@ -304,7 +354,14 @@ class Project(_Project):
     def validate(self, folder=None):
         if folder is None:
             folder = self.root
-        super().validate(folder)
+        changed = None
+        if self.watcher is not None:
+            changed = self.watcher.get_changed_resources(folder)
+        if changed is None:
+            super().validate(folder)
+        else:
+            for resource in changed:
+                super().validate(resource)
 
     root = property(lambda self: self.get_resource(""))
     address = property(lambda self: self._address)
@@ -334,6 +391,9 @@ class NoProject(_Project):
     def get_python_files(self):
         return []
 
+    def iter_python_files(self, near=None):
+        return iter([])
+
     _no_project = None
 
 
@@ -344,11 +404,20 @@ def get_no_project():
 
 
 class _FileListCacher:
+    """Keeps the set of the files in a project
+
+    The set is built the first time it is asked for and is then
+    updated with the changes the project observers are notified about;
+    only the affected files and folders are read again.
+
+    """
+
     def __init__(self, project):
         self.project = project
         self.files = None
+        self.version = 0
         rawobserver = resourceobserver.ResourceObserver(
-            self._changed, self._invalid, self._invalid, self._invalid, self._invalid
+            self._changed, self._moved, self._created, self._removed, self._validate
         )
         self.project.add_observer(rawobserver)
 
@@ -358,51 +427,264 @@ class _FileListCacher:
             self._add_files(self.project.root)
         return self.files
 
+    def iter_files(self, near=None):
+        folder = self.project.root
+        if near is not None and near.project is self.project:
+            folder = near if near.is_folder() else near.parent
+            while not self._is_included(folder):
+                folder = folder.parent
+        if self.files is not None:
+            yield from sorted(self.files, key=_get_distance_key(folder))
+            return
+        version = self.version
+        files = set()
+        walked = None
+        while True:
+            for file in _walk_files(self.project, folder, skipped=walked):
+                files.add(file)
+                yield file
+            if folder == self.project.root:
+                break
+            walked = folder
+            folder = folder.parent
+        if self.files is None and version == self.version:
+            self.files = files
+
     def _add_files(self, folder):
-        for child in folder.get_children():
-            if child.is_folder():
-                self._add_files(child)
-            elif not self.project.is_ignored(child):
-                self.files.add(child)
+        self.files.update(_walk_files(self.project, folder))
 
     def _changed(self, resource):
         if resource.is_folder():
+            self._update(resource)
+
+    def _moved(self, resource, new_resource=None):
+        self._remove(resource)
+        if new_resource is not None:
+            self._add(new_resource)
+
+    def _created(self, resource):
+        self._add(resource)
+
+    def _removed(self, resource):
+        self._remove(resource)
+
+    def _validate(self, resource):
+        self.version += 1
+        if resource == self.project.root:
             self.files = None
+        else:
+            self._update(resource)
+
+    def _update(self, resource):
+        self._remove(resource)
+        self._add(resource)
+
+    def _add(self, resource):
+        self.version += 1
+        if self.files is None or not resource.exists():
+            return
+        if not self._is_included(resource):
+            return
+        if resource.is_folder():
+            self._add_files(resource)
+        else:
+            self.files.add(resource)
 
-    def _invalid(self, resource, new_resource=None):
-        self.files = None
+    def _remove(self, resource):
+        self.version += 1
+        if self.files is None:
+            return
+        if resource.is_folder():
+            for file in [file for file in self.files if resource.contains(file)]:
+                self.files.remove(file)
+        else:
+            self.files.discard(resource)
+
+    def _is_included(self, resource):
+        while resource != self.project.root:
+            if self.project.is_ignored(resource):
+                return False
+            resource = resource.parent
+        return True
+
+
+def _walk_files(project, folder, skipped=None):
+    """Yield the files inside `folder` that are not ignored
+
+    Ignored folders, symbolic links and `skipped` folder are not
+    entered.  The file type information `os.scandir()` returns is used
+    for avoiding extra system calls for each resource.  The files of a
+    folder are yielded before the files of its subfolders.
+
+    """
+    skipped_path = skipped.path if skipped is not None else None
+    ignored = project.ignored
+    pending = [folder.path]
+    while pending:
+        path = pending.pop()
+        try:
+            scanner = os.scandir(project._get_resource_path(path))
+        except OSError:
+            continue
+        with scanner:
+            for entry in scanner:
+                child = path + "/" + entry.name if path else entry.name
+                try:
+                    if entry.is_symlink() or ignored.does_match_path(child):
+                        continue
+                    if entry.is_dir():
+                        if child != skipped_path:
+                            pending.append(child)
+                    elif entry.is_file():
+                        yield File(project, child)
+                except OSError:
+                    continue
+
+
+def _get_distance_key(folder):
+    """Return a sort key for ordering files by their distance to `folder`
+
+    The distance is the number of folders to go up from `folder` to
+    reach a folder containing the file.
+
+    """
+    parts = folder.path.split("/") if folder.path else []
+
+    def distance_key(resource):
+        file_parts = resource.path.split("/")[:-1]
+        common = 0
+        for part, file_part in zip(parts, file_parts):
+            if part != file_part:
+                break
+            common += 1
+        return len(parts) - common, resource.path
+
+    return distance_key
 
 
 class _DataFiles:
     def __init__(self, project):
         self.project = project
         self.hooks = []
+        # Data waiting to be written in the background, by name
+        self._pending = {}
+        self._writer = None
+        self._error = None
+        self._condition = threading.Condition()
+
+    @property
+    def writes_in_background(self):
+        """Whether `write_data()` returns before the data is written
+
+        Callers should not modify the data passed to `write_data()`
+        afterwards in that case.
+        """
+        return self.project.prefs.get("write_data_files_in_background", False)
+
+    @property
+    def format(self):
+        name = self.project.prefs.get("data_files_format", "pickle")
+        return data_file_formats.get(name, PickleFormat)
 
     def read_data(self, name):
         if self.project.ropefolder is None:
             return None
-        file = self._get_file(name)
-        if file.exists():
-            with open(file.real_path, "rb") as input_file:
-                result = []
-                try:
-                    while True:
-                        result.append(pickle.load(input_file))
-                except EOFError:
-                    pass
-                if len(result) == 1:
-                    return result[0]
-                if len(result) > 1:
-                    return result
+        self._wait_for_writer()
+        # Data saved in other formats is read after changing the format;
+        # the newest file that can be read is used
+        candidates = []
+        for index, format in enumerate(self._get_formats()):
+            path = self._get_file(name + format.extension).real_path
+            with contextlib.suppress(OSError):
+                candidates.append((-os.stat(path).st_mtime_ns, index, path, format))
+        for _, _, path, format in sorted(candidates):
+            try:
+                with open(path, "rb") as input_file:
+                    return format.load(input_file)
+            except (
+                OSError,
+                ValueError,
+                KeyError,
+                TypeError,
+                pickle.UnpicklingError,
+            ):
+                continue
+
+    def _get_formats(self):
+        """Return data file formats; the current format comes first"""
+        return [self.format] + [
+            format for format in data_file_formats.values() if format != self.format
+        ]
 
     def write_data(self, name, data):
-        if self.project.ropefolder is not None:
-            file = self._get_file(name)
-            with ExitStack() as cm:
-                output_file = cm.enter_context(open(file.real_path, "wb"))
-                output_file2 = cm.enter_context(open(file.real_path + ".json", "w"))
-                pickle.dump(data, output_file, 2)
-                json.dump(data, output_file2, default=lambda o: o.__getstate__())
+        if self.project.ropefolder is None:
+            return
+        format = self.format
+        path = self._get_file(name + format.extension).real_path
+        if not self.writes_in_background:
+            self._write_data(path, format, data)
+            return
+        with self._condition:
+            # Only the last data of each file waiting to be written is
+            # written
+            self._pending[name] = (path, format, data)
+            if self._writer is None:
+                # Not a daemon thread; the interpreter waits for the
+                # pending data to be written before exiting
+                self._writer = threading.Thread(
+                    target=self._write_pending, name="rope data files writer"
+                )
+                self._writer.start()
+
+    def flush(self):
+        """Wait until data being written in the background is written
+
+        Errors raised when writing them are raised here.
+        """
+        self._wait_for_writer()
+        with self._condition:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _wait_for_writer(self):
+        with self._condition:
+            while self._writer is not None:
+                self._condition.wait()
+
+    def _write_pending(self):
+        while True:
+            with self._condition:
+                if not self._pending:
+                    self._writer = None
+                    self._condition.notify_all()
+                    return
+                name = next(iter(self._pending))
+                path, format, data = self._pending.pop(name)
+            try:
+                self._write_data(path, format, data)
+            except Exception as e:
+                logger.exception("Cannot write rope data file %s", path)
+                with self._condition:
+                    self._error = e
+
+    def _write_data(self, path, format, data):
+        temp_path = "%s.%d.tmp" % (path, os.getpid())
+        try:
+            with open(temp_path, "wb") as output_file:
+                format.dump(data, output_file)
+            os.replace(temp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+        # Removing copies saved in other formats, so that they are
+        # never read instead
+        base = path[: len(path) - len(format.extension)]
+        for other in data_file_formats.values():
+            if other.extension != format.extension:
+                with contextlib.suppress(OSError):
+                    os.remove(base + other.extension)
 
     def add_write_hook(self, hook):
         self.hooks.append(hook)
@@ -416,6 +698,72 @@ class _DataFiles:
         return self.project.get_file(path)
 
 
+class PickleFormat:
+    """Saves data files with `pickle`"""
+
+    extension = ""
+
+    @staticmethod
+    def dump(data, output_file):
+        pickle.dump(data, output_file, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def load(input_file):
+        result = []
+        try:
+            while True:
+                result.append(pickle.load(input_file))
+        except EOFError:
+            pass
+        if len(result) == 1:
+            return result[0]
+        if len(result) > 1:
+            return result
+
+
+class JSONFormat:
+    """Saves data files as JSON
+
+    Data is encoded with `rope.base.serializer`, so that tuples and
+    non-string dict keys survive; other objects are saved using their
+    `__getstate__()`, like `rope.base.oi.memorydb.ScopeInfo`.
+
+    """
+
+    extension = ".json"
+
+    @staticmethod
+    def dump(data, output_file):
+        encoded = serializer.python_to_json(
+            data, version=2, default=lambda o: o.__getstate__()
+        )
+        output_file.write(json.dumps(encoded).encode("utf-8"))
+
+    @staticmethod
+    def load(input_file):
+        data = json.loads(input_file.read().decode("utf-8"))
+        # Older versions of rope saved JSON copies of data files in
+        # another layout; they are not read
+        if not isinstance(data, dict) or data.get("v") != 2 or "data" not in data:
+            raise ValueError("Not a rope JSON data file")
+        return serializer.json_to_python(data, object_hook=_load_json_object)
+
+
+def _load_json_object(data):
+    if data["$"] == "ScopeInfo":
+        from rope.base.oi.memorydb import ScopeInfo
+
+        result = ScopeInfo.__new__(ScopeInfo)
+        result.__setstate__(data)
+        return result
+    raise TypeError(f'Unrecognized object of type: {data["$"]}')
+
+
+# The formats data files can be saved in, by their
+# ``data_files_format`` project config name
+data_file_formats = {"pickle": PickleFormat, "json": JSONFormat}
+
+
 def _realpath(path):
     """Return the real path of `path`
 
@@ -1,15 +1,26 @@
 import bisect
+import collections
 import contextlib
 import difflib
 import warnings
+import weakref
 
 import rope.base.libutils
+import rope.base.oi.callgraph
 import rope.base.oi.doa
 import rope.base.oi.objectinfo
 import rope.base.oi.soa
 import rope.base.resourceobserver
 import rope.base.resources
-from rope.base import builtins, exceptions, pyobjectsdef, stdmods, taskhandle, utils
+from rope.base import (
+    astcache,
+    builtins,
+    exceptions,
+    pyobjectsdef,
+    stdmods,
+    taskhandle,
+    utils,
+)
 
 
 class PyCore:
@@ -19,6 +30,7 @@ class PyCore:
         self.cache_observers = []
         self.module_cache = _ModuleCache(self)
         self.extension_cache = _ExtensionCache(self)
+        self.ast_cache = astcache.ASTCache(project)
         self.object_info = rope.base.oi.objectinfo.ObjectInfoManager(project)
         self._init_python_files()
         self._init_automatic_soa()
@@ -214,8 +226,12 @@ class PyCore:
         )
         return []
 
+    def get_stats(self):
+        """Return a dict containing module cache statistics"""
+        return self.module_cache.get_stats()
+
     def __str__(self):
-        return str(self.module_cache) + str(self.object_info)
+        return str(self.module_cache) + str(self.ast_cache) + str(self.object_info)
 
     @utils.deprecated("Use `libutils.modname` instead")
     def modname(self, resource):
@@ -231,45 +247,209 @@ class PyCore:
 
 
 class _ModuleCache:
+    """Caches the `PyModule` of project resources
+
+    At most ``max_cached_modules`` project config modules are kept;
+    least recently used modules are evicted when there are more.
+    Evicted modules are kept weakly and are reused as long as they are
+    still referenced, for instance by a refactoring in progress or by
+    other modules that depend on them; once collected, their resources
+    are no longer observed and their dependencies are forgotten.
+
+    When ``incremental_reparse`` project config is `True`, the modules
+    of changed resources are kept and, when asked for again, updated
+    by reparsing the changed definition, if the change is confined to
+    a single top-level function or class.
+
+    """
+
     def __init__(self, pycore):
         self.pycore = pycore
-        self.module_map = {}
+        self.module_map = collections.OrderedDict()
+        self.evicted_map = weakref.WeakValueDictionary()
+        # Maps a resource to the resources of the modules whose concluded
+        # data depends on it and the other way around
+        self.dependents = {}
+        self.dependencies = {}
+        # Resources whose cached modules are outdated
+        self.changed = set()
+        # Resources whose evicted modules have been garbage collected;
+        # they are forgotten later, since collection can happen anywhere
+        self.collected = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reparses = 0
         self.pycore.cache_observers.append(self._invalidate_resource)
         self.observer = self.pycore.observer
 
+    @property
+    def max_modules(self):
+        return self.pycore.project.prefs.get("max_cached_modules", None)
+
     def _invalidate_resource(self, resource):
+        if resource in self.module_map or resource in self.evicted_map:
+            for affected in self._get_transitive_dependents(resource):
+                pymodule = self._get_cached(affected)
+                if pymodule is not None:
+                    pymodule._forget_concluded_data()
+                self._forget_dependencies(affected)
+            if self._is_incremental() and resource.exists():
+                self.changed.add(resource)
+            else:
+                self._remove(resource)
+        self.observer.remove_resource(resource)
+
+    def _is_incremental(self):
+        return self.pycore.project.prefs.get("incremental_reparse", False)
+
+    def _remove(self, resource):
+        self.changed.discard(resource)
+        self.module_map.pop(resource, None)
+        self.evicted_map.pop(resource, None)
+
+    def _update_changed(self, resource):
+        pymodule = self._get_cached(resource)
+        updated = False
+        if isinstance(pymodule, pyobjectsdef.PyModule):
+            with contextlib.suppress(exceptions.RopeError, UnicodeError):
+                updated = pymodule._update_source(resource.read())
+        if updated:
+            self.changed.discard(resource)
+            self.reparses += 1
+            self.observer.add_resource(resource)
+        else:
+            self._remove(resource)
+
+    def _get_cached(self, resource):
         if resource in self.module_map:
-            self.forget_all_data()
-            self.observer.remove_resource(resource)
-            del self.module_map[resource]
+            return self.module_map[resource]
+        return self.evicted_map.get(resource)
+
+    def _get_transitive_dependents(self, resource):
+        result = {resource}
+        pending = [resource]
+        while pending:
+            for dependent in self.dependents.get(pending.pop(), ()):
+                if dependent not in result:
+                    result.add(dependent)
+                    pending.append(dependent)
+        return result
+
+    def _forget_dependencies(self, resource):
+        for dependency in self.dependencies.pop(resource, ()):
+            dependents = self.dependents.get(dependency)
+            if dependents is not None:
+                dependents.discard(resource)
+                if not dependents:
+                    del self.dependents[dependency]
+
+    def add_dependency(self, pymodule, resource):
+        """Record that concluded data of `pymodule` depends on `resource`
+
+        When `resource` changes, the concluded data of `pymodule` and of
+        the modules that depend on it is forgotten.
+
+        """
+        dependent = pymodule.get_resource()
+        if dependent is None or resource is None or dependent == resource:
+            return
+        self.dependents.setdefault(resource, set()).add(dependent)
+        self.dependencies.setdefault(dependent, set()).add(resource)
 
     def get_pymodule(self, resource, force_errors=False):
+        self._forget_collected()
+        if resource in self.changed:
+            self._update_changed(resource)
         if resource in self.module_map:
+            self.hits += 1
+            self.module_map.move_to_end(resource)
             return self.module_map[resource]
-        if resource.is_folder():
-            result = pyobjectsdef.PyPackage(
-                self.pycore,
-                resource,
-                force_errors=force_errors,
-            )
+        result = self.evicted_map.pop(resource, None)
+        if result is not None:
+            self.hits += 1
         else:
-            result = pyobjectsdef.PyModule(
-                self.pycore,
-                resource=resource,
-                force_errors=force_errors,
-            )
-            if result.has_errors:
-                return result
+            self.misses += 1
+            if resource.is_folder():
+                result = pyobjectsdef.PyPackage(
+                    self.pycore,
+                    resource,
+                    force_errors=force_errors,
+                )
+            else:
+                result = pyobjectsdef.PyModule(
+                    self.pycore,
+                    resource=resource,
+                    force_errors=force_errors,
+                )
+                if result.has_errors:
+                    return result
+            self.observer.add_resource(resource)
         self.module_map[resource] = result
-        self.observer.add_resource(resource)
+        self._evict_extra_modules()
         return result
 
+    def _evict_extra_modules(self):
+        max_modules = self.max_modules
+        if max_modules is None:
+            return
+        while len(self.module_map) > max(max_modules, 1):
+            resource, pymodule = self.module_map.popitem(last=False)
+            self.evicted_map[resource] = pymodule
+            weakref.finalize(pymodule, self.collected.append, resource)
+            self.evictions += 1
+
+    def _forget_collected(self):
+        while self.collected:
+            resource = self.collected.pop()
+            if self._get_cached(resource) is not None:
+                continue
+            self._forget_dependencies(resource)
+            for dependent in self.dependents.pop(resource, ()):
+                dependencies = self.dependencies.get(dependent)
+                if dependencies is not None:
+                    dependencies.discard(resource)
+                    if not dependencies:
+                        del self.dependencies[dependent]
+            self.changed.discard(resource)
+            self.observer.remove_resource(resource)
+
     def forget_all_data(self):
         for pymodule in self.module_map.values():
             pymodule._forget_concluded_data()
+        for pymodule in list(self.evicted_map.values()):
+            pymodule._forget_concluded_data()
+        self.dependents.clear()
+        self.dependencies.clear()
+
+    def get_stats(self):
+        """Return a dict containing module cache statistics
+
+        ``source_size`` is the total length of the sources of cached
+        modules; it can be used for estimating the memory they use.
+
+        """
+        return {
+            "modules": len(self.module_map),
+            "evicted_modules": len(self.evicted_map),
+            "max_modules": self.max_modules,
+            "source_size": sum(
+                len(getattr(pymodule, "source_code", ""))
+                for pymodule in self.module_map.values()
+            ),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "reparses": self.reparses,
+        }
 
     def __str__(self):
-        return "PyCore caches %d PyModules\n" % len(self.module_map)
+        stats = self.get_stats()
+        return (
+            "PyCore caches %(modules)d PyModules\n"
+            "  %(source_size)d bytes of source, %(hits)d hits, "
+            "%(misses)d misses, %(evictions)d evictions\n" % stats
+        )
 
 
 class _ExtensionCache:
@@ -293,6 +473,7 @@ def perform_soa_on_changed_scopes(project, resource, old_contents):
             new_contents = resource.read()
             # detecting changes in new_contents relative to old_contents
             detector = _TextChangeDetector(new_contents, old_contents)
+            changed = []
 
             def search_subscopes(pydefined):
                 scope = pydefined.get_scope()
@@ -302,9 +483,13 @@ def perform_soa_on_changed_scopes(project, resource, old_contents):
                 scope = pydefined.get_scope()
                 start = scope.get_start()
                 end = scope.get_end()
-                return detector.consume_changes(start, end)
+                if detector.consume_changes(start, end):
+                    changed.append(pycore.object_info._get_scope(pydefined))
+                    return True
+                return False
 
             pycore.analyze_module(resource, should_analyze, search_subscopes)
+            rope.base.oi.callgraph.analyze_affected(pycore, changed)
 
 
 class _TextChangeDetector:
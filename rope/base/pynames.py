@@ -14,6 +14,9 @@ if typing.TYPE_CHECKING:
 class PyName:
     """References to `PyObject` inside python programs"""
 
+    # Projects hold many `PyName`\s; subclasses define `__slots__` too
+    __slots__ = ()
+
     def get_object(self):
         """Return the `PyObject` object referenced by this `PyName`"""
 
@@ -22,6 +25,8 @@ class PyName:
 
 
 class DefinedName(PyName):
+    __slots__ = ("pyobject",)
+
     def __init__(self, pyobject):
         self.pyobject = pyobject
 
@@ -36,10 +41,12 @@ class DefinedName(PyName):
 
 
 class AssignedName(PyName):
-    pass
+    __slots__ = ()
 
 
 class UnboundName(PyName):
+    __slots__ = ("pyobject",)
+
     def __init__(self, pyobject=None):
         self.pyobject = pyobject
         if self.pyobject is None:
@@ -55,6 +62,8 @@ class UnboundName(PyName):
 class AssignmentValue:
     """An assigned expression"""
 
+    __slots__ = ("ast_node", "levels", "evaluation", "assign_type", "type_hint")
+
     def __init__(
         self, ast_node, levels=None, evaluation="", assign_type=False, type_hint=None
     ):
@@ -83,6 +92,8 @@ class AssignmentValue:
 class EvaluatedName(PyName):
     """A name whose object will be evaluated later"""
 
+    __slots__ = ("module", "lineno", "callback", "pyobject")
+
     def __init__(self, callback, module=None, lineno=None):
         self.module = module
         self.lineno = lineno
@@ -101,10 +112,12 @@ class EvaluatedName(PyName):
 
 
 class ParameterName(PyName):
-    pass
+    __slots__ = ()
 
 
 class ImportedModule(PyName):
+    __slots__ = ("importing_module", "module_name", "level", "resource", "pymodule")
+
     def __init__(
         self,
         importing_module: Union[
@@ -148,6 +161,10 @@ class ImportedModule(PyName):
                     self.pymodule.set(pymodule)
                 except exceptions.ModuleNotFoundError:
                     pass
+            if self.pymodule.get() is not None:
+                pycore.module_cache.add_dependency(
+                    self.importing_module, self.pymodule.get().get_resource()
+                )
         return self.pymodule.get()
 
     def get_object(self):
@@ -163,6 +180,13 @@ class ImportedModule(PyName):
 
 
 class ImportedName(PyName):
+    __slots__ = (
+        "imported_module",
+        "imported_name",
+        "_calling_get_object_",
+        "_calling_get_definition_location_",
+    )
+
     def __init__(self, imported_module, imported_name):
         self.imported_module = imported_module
         self.imported_name = imported_name
@@ -196,6 +220,8 @@ def _circular_inference():
 
 
 class _Inferred:
+    __slots__ = ("get_inferred", "concluded", "temp", "_calling_get_")
+
     def __init__(self, get_inferred, concluded=None):
         self.get_inferred = get_inferred
         self.concluded = concluded
@@ -6,10 +6,18 @@ from rope.base import pynames, utils
 
 
 class DefinedName(pynames.DefinedName):
-    pass
+    __slots__ = ()
 
 
 class AssignedName(pynames.AssignedName):
+    __slots__ = (
+        "lineno",
+        "module",
+        "assignments",
+        "pyobject",
+        "_calling__get_inferred_",
+    )
+
     def __init__(self, lineno=None, module=None, pyobject=None):
         self.lineno = lineno
         self.module = module
@@ -40,10 +48,12 @@ class AssignedName(pynames.AssignedName):
 
 
 class UnboundName(pynames.UnboundName):
-    pass
+    __slots__ = ()
 
 
 class ParameterName(pynames.ParameterName):
+    __slots__ = ("pyfunction", "index")
+
     def __init__(self, pyfunction, index):
         self.pyfunction = pyfunction
         self.index = index
@@ -63,19 +73,19 @@ class ParameterName(pynames.ParameterName):
 
 
 class AssignmentValue(pynames.AssignmentValue):
-    pass
+    __slots__ = ()
 
 
 class EvaluatedName(pynames.EvaluatedName):
-    pass
+    __slots__ = ()
 
 
 class ImportedModule(pynames.ImportedModule):
-    pass
+    __slots__ = ()
 
 
 class ImportedName(pynames.ImportedName):
-    pass
+    __slots__ = ()
 
 
 _Inferred = pynames._Inferred
@@ -1,3 +1,4 @@
+import weakref
 from typing import Optional
 
 from rope.base import ast, exceptions, utils
@@ -282,6 +283,8 @@ class PyClass(PyDefinedObject, AbstractClass):
 
 
 class _ConcludedData:
+    __slots__ = ("data_", "__weakref__")
+
     def __init__(self):
         self.data_ = None
 
@@ -303,9 +306,12 @@ class _ConcludedData:
 class _PyModule(PyDefinedObject, AbstractModule):
     def __init__(self, pycore, ast_node, resource):
         self.resource = resource
-        self.concluded_data = []
+        # Kept weakly so that the data of objects dropped after
+        # reparsing a definition does not accumulate
+        self.concluded_data = weakref.WeakSet()
         AbstractModule.__init__(self)
         PyDefinedObject.__init__(self, pycore, ast_node, None)
+        self.evaluated_nodes = self._get_concluded_data()
 
     @property
     def absolute_name(self) -> str:
@@ -313,13 +319,23 @@ class _PyModule(PyDefinedObject, AbstractModule):
 
     def _get_concluded_data(self):
         new_data = _ConcludedData()
-        self.concluded_data.append(new_data)
+        self.concluded_data.add(new_data)
         return new_data
 
     def _forget_concluded_data(self):
         for data in self.concluded_data:
             data._invalidate()
 
+    def _get_evaluated_nodes(self):
+        """Return a dict for saving the results of evaluating nodes
+
+        It is keyed by ``(scope, node)`` or ``(scope, expression)``
+        tuples and is forgotten with other concluded data.
+        """
+        if self.evaluated_nodes.get() is None:
+            self.evaluated_nodes.set({})
+        return self.evaluated_nodes.get()
+
     def get_resource(self):
         return self.resource
 
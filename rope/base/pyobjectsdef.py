@@ -1,3 +1,9 @@
+import bisect
+import contextlib
+import os
+import re
+import weakref
+
 import rope.base.builtins
 import rope.base.codeanalyze
 import rope.base.evaluate
@@ -10,6 +16,7 @@ from rope.base import (
     exceptions,
     fscommands,
     nameanalyze,
+    pynames,
     pynamesdef,
     pyobjects,
     utils,
@@ -188,8 +195,14 @@ class PyModule(pyobjects.PyModule):
         filename = "string"
         if resource:
             filename = resource.path
+        shared_key = None
         try:
             if source_code is None:
+                shared_key = _get_shared_key(pycore, resource)
+                shared = _shared_sources.get(shared_key)
+                if shared is not None:
+                    self._shared_source = shared
+                    return shared.source_code, shared.ast_node
                 source_bytes = resource.read_bytes()
                 source_code, _ = fscommands.file_data_to_unicode(source_bytes)
             else:
@@ -197,13 +210,75 @@ class PyModule(pyobjects.PyModule):
                     source_bytes = fscommands.unicode_to_file_data(source_code)
                 else:
                     source_bytes = source_code
-            ast_node = ast.parse(source_bytes, filename=filename)
+            if resource is not None:
+                ast_node = pycore.ast_cache.parse(source_bytes, filename=filename)
+            else:
+                ast_node = ast.parse(source_bytes, filename=filename)
         except SyntaxError as e:
             raise exceptions.ModuleSyntaxError(filename, e.lineno, e.msg)
         except UnicodeDecodeError as e:
             raise exceptions.ModuleSyntaxError(filename, 1, "%s" % (e.reason))
+        if shared_key is not None:
+            self._shared_source = _SharedSource(source_code, ast_node)
+            _shared_sources[shared_key] = self._shared_source
         return source_code, ast_node
 
+    def _update_source(self, source_code):
+        """Update this module for its new source, `source_code`
+
+        Only changes inside a single top-level function or class are
+        handled: that definition is reparsed and its objects are
+        replaced, while the objects of other definitions are kept.
+        Returns `False`, without changing anything, if the change
+        cannot be handled this way.
+
+        Concluded data is not updated; the caller should forget it.
+
+        """
+        if source_code == self.source_code and not self.has_errors:
+            return True
+        change = _find_changed_definition(self, source_code)
+        if change is None:
+            return False
+        index, end, new_node = change
+        body = self.ast_node.body
+        old_node = body[index]
+        if self.defineds is not None:
+            visitor = self.visitor_class(self.pycore, self)
+            visitor.visit(new_node)
+            position = [defined.get_ast() for defined in self.defineds].index(old_node)
+            self.defineds[position : position + 1] = visitor.defineds
+            self.structural_attributes[new_node.name] = visitor.names[new_node.name]
+        delta = source_code.count("\n") - self.source_code.count("\n")
+        body[index] = new_node
+        if delta:
+            for node in body[index + 1 :]:
+                ast.increment_lineno(node, delta)
+            _shift_pyname_linenos(self, end, delta)
+        self.source_code = source_code
+        self.coding = fscommands.read_str_coding(source_code)
+        self._forget_source_data()
+        return True
+
+    def _forget_source_data(self):
+        for name in ("_lines", "_logical_lines"):
+            self.__dict__.pop(name, None)
+        if hasattr(self.ast_node, "region"):
+            for node in ast.walk(self.ast_node):
+                node.__dict__.pop("region", None)
+                node.__dict__.pop("sorted_children", None)
+        if self.scope is not None:
+            for name in (
+                "_get_scopes",
+                "__scope_finder",
+                "__calculate_scope_regions",
+                "_get_logical_end",
+            ):
+                _forget_attribute(self.scope, name)
+        for pydefined in _get_defined_objects(self):
+            if pydefined.scope is not None:
+                _forget_attribute(pydefined.scope, "_get_logical_end")
+
     @utils.prevent_recursion(lambda: {})
     def _create_concluded_attributes(self):
         result = {}
@@ -230,6 +305,152 @@ class PyModule(pyobjects.PyModule):
         return rope.base.libutils.modname(self.resource) if self.resource else ""
 
 
+def _find_changed_definition(pymodule, source_code):
+    """Find the top-level definition of `pymodule` changed in `source_code`
+
+    Returns an ``(index, end, node)`` tuple, in which `index` is the
+    index of the definition in module body, `end` is the last line of
+    the definition and the lines following it in the old source and
+    `node` is the parsed new definition, or `None` if the changes are
+    not confined to a single function or class.
+
+    """
+    old_source = pymodule.source_code
+    if pymodule.has_errors or getattr(pymodule, "_shared_source", None):
+        return None
+    if "\r" in old_source or "\r" in source_code or old_source == source_code:
+        return None
+    old_lines = old_source.split("\n")
+    new_lines = source_code.split("\n")
+    common = min(len(old_lines), len(new_lines))
+    prefix = 0
+    while prefix < common and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < common - prefix and old_lines[-suffix - 1] == new_lines[-suffix - 1]:
+        suffix += 1
+    # The changed lines are `prefix + 1` till `last` in the old source;
+    # for insertions, `last` is `prefix`.  Changes to the first two
+    # lines might change source encoding.
+    last = len(old_lines) - suffix
+    if prefix < 2:
+        return None
+    body = pymodule.ast_node.body
+    starts = [_get_statement_start(node) for node in body]
+    index = bisect.bisect(starts, min(prefix + 1, last)) - 1
+    if index < 0 or not isinstance(body[index], _definition_nodes):
+        return None
+    start = starts[index]
+    end = starts[index + 1] - 1 if index + 1 < len(starts) else len(old_lines)
+    new_end = end + len(new_lines) - len(old_lines)
+    # Reparsing most of the module is not worth keeping the rest
+    if last > end or new_end < start or (end - start + 1) * 2 > len(old_lines):
+        return None
+    old_node = body[index]
+    segment = "\n".join(new_lines[start - 1 : new_end])
+    # Global statements add assignments to the names of the module
+    if _global_pattern.search(segment) or _global_pattern.search(
+        "\n".join(old_lines[start - 1 : end])
+    ):
+        return None
+    try:
+        tree = ast.parse(segment)
+    except SyntaxError:
+        return None
+    if len(tree.body) != 1:
+        return None
+    new_node = tree.body[0]
+    if type(new_node) is not type(old_node) or new_node.name != old_node.name:
+        return None
+    if pymodule.structural_attributes is not None:
+        pyname = pymodule.structural_attributes.get(old_node.name)
+        if not isinstance(pyname, pynamesdef.DefinedName) or (
+            pyname.get_object().get_ast() is not old_node
+        ):
+            return None
+    ast.increment_lineno(new_node, start - 1)
+    return index, end, new_node
+
+
+def _get_statement_start(node):
+    decorators = getattr(node, "decorator_list", None)
+    if decorators:
+        return min(node.lineno, decorators[0].lineno)
+    return node.lineno
+
+
+_definition_nodes = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+_global_pattern = re.compile(r"\bglobal\b")
+
+
+def _get_defined_objects(pydefined):
+    """Return the objects defined inside `pydefined` that were created
+
+    The objects defined in functions and comprehensions are kept by
+    their scopes.
+    """
+    result = []
+    pending = [pydefined]
+    while pending:
+        current = pending.pop()
+        if current is not pydefined:
+            result.append(current)
+        pending.extend(current.defineds or ())
+        pending.extend(getattr(current.scope, "defineds", None) or ())
+    return result
+
+
+def _forget_attribute(obj, name):
+    # Scopes save some of their attributes in `__slots__`
+    with contextlib.suppress(AttributeError):
+        delattr(obj, name)
+
+
+def _shift_pyname_linenos(pymodule, line, delta):
+    """Add `delta` to the line numbers stored in pynames after `line`"""
+    seen = set()
+    for pydefined in [pymodule] + _get_defined_objects(pymodule):
+        names = list((pydefined.structural_attributes or {}).values())
+        scope_names = getattr(pydefined.scope, "names", None)
+        if isinstance(scope_names, dict):
+            names.extend(scope_names.values())
+        for pyname in names:
+            if id(pyname) in seen:
+                continue
+            seen.add(id(pyname))
+            if isinstance(pyname, (pynamesdef.AssignedName, pynames.EvaluatedName)):
+                if pyname.lineno is not None and pyname.lineno > line:
+                    pyname.lineno += delta
+
+
+class _SharedSource:
+    def __init__(self, source_code, ast_node):
+        self.source_code = source_code
+        self.ast_node = ast_node
+
+
+# The parsed modules outside projects, shared by all `PyCore` instances
+# in this process; entries are kept as long as a `PyModule` uses them
+_shared_sources = weakref.WeakValueDictionary()
+
+
+def _get_shared_key(pycore, resource):
+    """Return the key of `resource` in `_shared_sources`
+
+    Only modules outside the project, like those in the standard
+    library and site-packages, are shared.  `None` is returned for
+    others.
+
+    """
+    if resource is None or resource.project is pycore.project:
+        return None
+    try:
+        stat = os.stat(resource.real_path)
+    except OSError:
+        return None
+    return resource.real_path, stat.st_mtime_ns, stat.st_size
+
+
 class PyPackage(pyobjects.PyPackage):
     def __init__(self, pycore, resource=None, force_errors=False):
         self.resource = resource
@@ -259,6 +480,7 @@ class PyPackage(pyobjects.PyPackage):
         init_dot_py = self._get_init_dot_py()
         if init_dot_py:
             init_object = self.pycore.project.get_pymodule(init_dot_py)
+            self.pycore.module_cache.add_dependency(self, init_dot_py)
             result.update(init_object.get_attributes())
         return result
 
@@ -4,6 +4,8 @@ from rope.refactor import patchedast
 
 
 class Scope:
+    __slots__ = ("pycore", "pyobject", "parent", "_get_scopes", "_get_logical_end")
+
     def __init__(self, pycore, pyobject, parent_scope):
         self.pycore = pycore
         self.pyobject = pyobject
@@ -116,6 +118,10 @@ class Scope:
 
 
 class GlobalScope(Scope):
+    # `utils.saveit` names starting with two underscores are mangled
+    # in `__slots__`; they are kept in `__dict__`
+    __slots__ = ("names", "__dict__")
+
     def __init__(self, pycore, module):
         super().__init__(pycore, module, None)
         self.names = module._get_concluded_data()
@@ -166,6 +172,8 @@ class GlobalScope(Scope):
 
 
 class ComprehensionScope(Scope):
+    __slots__ = ("names", "returned_asts", "defineds", "visitor")
+
     def __init__(self, pycore, pyobject, visitor):
         super().__init__(pycore, pyobject, pyobject.parent.get_scope())
         self.names = None
@@ -200,6 +208,8 @@ class ComprehensionScope(Scope):
 
 
 class FunctionScope(Scope):
+    __slots__ = ("names", "returned_asts", "is_generator", "defineds", "visitor")
+
     def __init__(self, pycore, pyobject, visitor):
         super().__init__(pycore, pyobject, pyobject.parent.get_scope())
         self.names = None
@@ -252,6 +262,8 @@ class FunctionScope(Scope):
 
 
 class ClassScope(Scope):
+    __slots__ = ()
+
     def __init__(self, pycore, pyobject):
         super().__init__(pycore, pyobject, pyobject.parent.get_scope())
 
@@ -262,6 +274,9 @@ class ClassScope(Scope):
         return {}
 
 
+_definition_nodes = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
 class _HoldingScopeFinder:
     def __init__(self, pymodule):
         self.pymodule = pymodule
@@ -287,16 +302,22 @@ class _HoldingScopeFinder:
                 and current_scope.get_kind() != "Module"
             ):
                 return current_scope
-            new_scope = None
-            for scope in current_scope.get_scopes():
-                if scope.get_start() <= lineno:
-                    if lineno <= scope.get_end():
-                        new_scope = scope
-                        break
-                else:
-                    break
+            new_scope = self._find_inner_scope(current_scope, lineno)
         return current_scope
 
+    def _find_inner_scope(self, scope, lineno):
+        for inner_scope in scope.get_scopes():
+            if inner_scope.get_start() > lineno:
+                break
+            # Finding the end of a scope is costly; definitions ending
+            # before `lineno` are skipped using the end of their AST nodes
+            node = inner_scope.pyobject.get_ast()
+            if isinstance(node, _definition_nodes) and node.end_lineno < lineno:
+                continue
+            if lineno <= inner_scope.get_end():
+                return inner_scope
+        return None
+
     def _is_empty_line(self, lineno):
         line = self.lines.get_line(lineno)
         return line.strip() == "" or line.lstrip().startswith("#")
@@ -353,6 +374,8 @@ class TemporaryScope(Scope):
     parent scopes.
     """
 
+    __slots__ = ("names",)
+
     def __init__(self, pycore, parent_scope, names):
         super().__init__(pycore, parent_scope.pyobject, parent_scope)
         self.names = names
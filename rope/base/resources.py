@@ -232,9 +232,21 @@ class Folder(Resource):
 
 
 class _ResourceMatcher:
+    """Matches resource paths against a list of patterns
+
+    The patterns are compiled into a single regular expression and the
+    results are cached for each path until the patterns change.
+
+    """
+
+    # Dropping cached results when there are more paths than this
+    max_cached_paths = 131072
+
     def __init__(self):
         self.patterns = []
-        self._compiled_patterns = []
+        self._compiled_pattern = None
+        self._compiled_count = 0
+        self._results = {}
 
     def set_patterns(self, patterns):
         """Specify which resources to match
@@ -243,30 +255,52 @@ class _ResourceMatcher:
         ``?`` signs for matching resource names.
 
         """
-        self._compiled_patterns = None
+        self._compiled_pattern = None
+        self._results.clear()
         self.patterns = patterns
 
-    def _add_pattern(self, pattern):
-        re_pattern = (
-            pattern.replace(".", "\\.")
-            .replace("*", "[^/]*")
-            .replace("?", "[^/]")
-            .replace("//", "/(.*/)?")
-        )
-        re_pattern = "^(.*/)?" + re_pattern + "(/.*)?$"
-        self.compiled_patterns.append(re.compile(re_pattern))
-
     def does_match(self, resource):
-        for pattern in self.compiled_patterns:
-            if pattern.match(resource.path):
-                return True
+        if self.does_match_path(resource.path):
+            return True
         path = os.path.join(resource.project.address, *resource.path.split("/"))
         return os.path.islink(path)
 
+    def does_match_path(self, path):
+        """Return `True` if `path` matches one of the patterns
+
+        Unlike `does_match()`, symbolic links are not checked.
+
+        """
+        pattern = self.compiled_pattern
+        try:
+            return self._results[path]
+        except KeyError:
+            pass
+        if len(self._results) >= self.max_cached_paths:
+            self._results.clear()
+        result = pattern is not None and pattern.match(path) is not None
+        self._results[path] = result
+        return result
+
     @property
-    def compiled_patterns(self):
-        if self._compiled_patterns is None:
-            self._compiled_patterns = []
-            for pattern in self.patterns:
-                self._add_pattern(pattern)
-        return self._compiled_patterns
+    def compiled_pattern(self):
+        # `Prefs.add()` appends to the list passed to `set_patterns()`
+        if self._compiled_count != len(self.patterns):
+            self._compiled_pattern = None
+            self._results.clear()
+        if self._compiled_pattern is None and self.patterns:
+            self._compiled_pattern = re.compile(
+                "^(?:.*/)?(?:%s)(?:/.*)?$"
+                % "|".join(_translate_pattern(pattern) for pattern in self.patterns)
+            )
+        self._compiled_count = len(self.patterns)
+        return self._compiled_pattern
+
+
+def _translate_pattern(pattern):
+    return (
+        pattern.replace(".", "\\.")
+        .replace("*", "[^/]*")
+        .replace("?", "[^/]")
+        .replace("//", "/(?:.*/)?")
+    )
@@ -49,13 +49,20 @@ may or may not work:
 """
 
 
-def python_to_json(o, version=1):
+def python_to_json(o, version=1, default=None):
+    """Encode `o`
+
+    If given, `default` is called for objects of other types; it should
+    return a JSON-serializable dict with a ``"$"`` key naming the type
+    of the object, which `json_to_python()` passes to its `object_hook`.
+
+    """
     if version not in (1, 2):
         raise ValueError(f"Unexpected version {version}")
     references = []
     result = {
         "v": version,
-        "data": _py2js(o, references, version=version),
+        "data": _py2js(o, references, version=version, default=default),
         "references": references,
     }
     if not result["references"]:
@@ -63,59 +70,61 @@ def python_to_json(o, version=1):
     return result
 
 
-def json_to_python(o):
+def json_to_python(o, object_hook=None):
     version = o["v"]
     if version not in (1, 2):
         raise ValueError(f"Unexpected version {version}")
     references = o.get("references", {})
-    data = _js2py(o["data"], references, version)
+    data = _js2py(o["data"], references, version, object_hook)
     return data
 
 
-def _py2js(o, references, version):
+def _py2js(o, references, version, default=None):
     if isinstance(o, (str, int)) or o is None:
         return o
     elif isinstance(o, tuple):
         if version == 1:
             return {
                 "$": "t",
-                "items": [_py2js(item, references, version) for item in o],
+                "items": [_py2js(item, references, version, default) for item in o],
             }
         else:
-            return [_py2js(item, references, version) for item in o]
+            return [_py2js(item, references, version, default) for item in o]
     elif isinstance(o, list):
         if version == 2:
             return {
                 "$": "l",
-                "items": [_py2js(item, references, version) for item in o],
+                "items": [_py2js(item, references, version, default) for item in o],
             }
         else:
-            return [_py2js(item, references, version) for item in o]
+            return [_py2js(item, references, version, default) for item in o]
     elif isinstance(o, dict):
         result = {}
         for pykey, pyvalue in o.items():
             if pykey == "$":
                 raise ValueError('dict cannot contain reserved key "$"')
             if isinstance(pykey, str) and not pykey.isdigit():
-                result[pykey] = _py2js(pyvalue, references, version)
+                result[pykey] = _py2js(pyvalue, references, version, default)
             else:
                 assert isinstance(pykey, (str, int, tuple)) or pykey is None
                 assert not isinstance(pykey, list)
                 refid = len(references)
-                references.append(_py2js(pykey, references, version))
-                result[str(refid)] = _py2js(pyvalue, references, version)
+                references.append(_py2js(pykey, references, version, default))
+                result[str(refid)] = _py2js(pyvalue, references, version, default)
         return result
+    elif default is not None:
+        return default(o)
     raise TypeError(f"Object of type {type(o)} is not allowed {o}")
 
 
-def _js2py(o, references, version):
+def _js2py(o, references, version, object_hook=None):
     if isinstance(o, (str, int)) or o is None:
         return o
     elif isinstance(o, list):
         if version == 1:
-            return list(_js2py(item, references, version) for item in o)
+            return list(_js2py(item, references, version, object_hook) for item in o)
         elif version == 2:
-            return tuple(_js2py(item, references, version) for item in o)
+            return tuple(_js2py(item, references, version, object_hook) for item in o)
         raise ValueError(f"Unexpected version {version}")
     elif isinstance(o, dict):
         result = {}
@@ -123,11 +132,17 @@ def _js2py(o, references, version):
             if o["$"] == "t":
                 assert version == 1
                 data = o["items"]
-                return tuple(_js2py(item, references, version) for item in data)
+                return tuple(
+                    _js2py(item, references, version, object_hook) for item in data
+                )
             elif o["$"] == "l":
                 assert version == 2
                 data = o["items"]
-                return list(_js2py(item, references, version) for item in data)
+                return list(
+                    _js2py(item, references, version, object_hook) for item in data
+                )
+            elif object_hook is not None:
+                return object_hook(o)
             raise TypeError(f'Unrecognized object of type: {o["$"]} {o}')
         else:
             for refid, jsvalue in o.items():
@@ -136,10 +151,10 @@ def _js2py(o, references, version):
                     refid = int(refid)
                     assert 0 <= refid < len(references)
                     jskey = references[refid]
-                    pyvalue = _js2py(jsvalue, references, version)
-                    pykey = _js2py(jskey, references, version)
+                    pyvalue = _js2py(jsvalue, references, version, object_hook)
+                    pykey = _js2py(jskey, references, version, object_hook)
                     result[pykey] = pyvalue
                 else:
-                    result[refid] = _js2py(jsvalue, references, version)
+                    result[refid] = _js2py(jsvalue, references, version, object_hook)
         return result
     raise TypeError(f'Object of type "{type(o).__name__}" is not allowed {o}')
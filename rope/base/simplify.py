@@ -4,11 +4,11 @@ This module is here to help source code analysis.
 """
 
 import re
+from array import array
 
 from rope.base import codeanalyze, utils
 
 
-@utils.cached(7)
 def real_code(source):
     """Simplify `source` for analysis
 
@@ -22,47 +22,97 @@ def real_code(source):
     The resulting code is a lot easier to analyze if we are interested
     only in offsets.
     """
-    collector = codeanalyze.ChangeCollector(source)
-    for start, end, matchgroups in ignored_regions(source):
-        if source[start] == "#":
-            replacement = " " * (end - start)
-        elif "f" in matchgroups.get("prefix", "").lower():
-            replacement = None
-        else:
-            replacement = '"%s"' % (" " * (end - start - 2))
-        if replacement is not None:
-            collector.add_change(start, end, replacement)
-    source = collector.get_changed() or source
-    collector = codeanalyze.ChangeCollector(source)
-    parens = 0
-    for match in _parens.finditer(source):
-        i = match.start()
-        c = match.group()
-        if c in "({[":
-            parens += 1
-        if c in ")}]":
-            parens -= 1
-        if c == "\n" and parens > 0:
-            collector.add_change(i, i + 1, " ")
-    source = collector.get_changed() or source
-    return source.replace("\\\n", "  ").replace("\t", " ").replace(";", "\n")
-
-
-@utils.cached(7)
+    return _scan(source)[0]
+
+
 def ignored_regions(source):
     """Return ignored regions like strings and comments in `source`"""
-    return [
-        (match.start(), match.end(), match.groupdict())
-        for match in _str.finditer(source)
-    ]
+    return _scan(source)[1]
+
+
+def ignored_offsets(source):
+    """Return the start and end offsets of ignored regions in `source`
+
+    Both are sorted arrays, suitable for `bisect`.
+    """
+    return _scan(source)[2:]
+
+
+@utils.cached(32, pref="simplified_code_cache_size")
+def _scan(source):
+    """Simplify `source` and find its ignored regions in one sweep
+
+    Returns a ``(code, regions, starts, ends)`` tuple; see
+    `real_code()` and `ignored_regions()`.
+    """
+    pieces = []
+    regions = []
+    starts = array("I")
+    ends = array("I")
+    parens = 0
+    last = 0
+    for match in _tokens(source):
+        token = match.group()
+        first = token[0]
+        if first in "({[":
+            parens += len(token)
+            continue
+        if first in ")}]":
+            parens -= len(token)
+            continue
+        start = match.start()
+        end = start + len(token)
+        if first == "\n":
+            if parens <= 0:
+                continue
+            replacement = " " * len(token)
+        elif first == "\t":
+            replacement = " "
+        elif first == ";":
+            replacement = "\n"
+        elif token == "\\\n":
+            # Newlines inside parens are replaced before continuations
+            replacement = "\\ " if parens > 0 else "  "
+        else:
+            prefix = match.group("prefix")
+            regions.append((start, end, {"prefix": prefix}))
+            starts.append(start)
+            ends.append(end)
+            if first == "#":
+                replacement = " " * (end - start)
+            elif "f" in prefix.lower():
+                # Formatted strings are kept; their code is simplified
+                # by the following tokens
+                continue
+            else:
+                replacement = '"%s"' % (" " * (end - start - 2))
+        pieces.append(source[last:start])
+        pieces.append(replacement)
+        last = end
+    if not pieces:
+        return source, regions, starts, ends
+    pieces.append(source[last:])
+    return "".join(pieces), regions, starts, ends
+
+
+def _tokens(source):
+    for match in _scanner.finditer(source):
+        yield match
+        if match.lastindex and "f" in match.group("prefix").lower():
+            yield from _code.finditer(source, *match.span())
 
 
-_str = re.compile(
-    "|".join(
+_code_pattern = r"[\({\[]+|[\]}\)]+|\n+|[\t;]|\\\n"
+_code = re.compile(_code_pattern)
+# The lookahead lets the regex engine skip quickly to the characters
+# that can start a token
+_scanner = re.compile(
+    r"(?=[\({\[\]}\)\n\t;\\#'\"bBfFrRuU])(?:%s)"
+    % "|".join(
         [
+            _code_pattern,
             codeanalyze.get_comment_pattern(),
             codeanalyze.get_any_string_pattern(),
         ]
     )
 )
-_parens = re.compile(r"[\({\[\]}\)\n]")
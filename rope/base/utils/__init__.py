@@ -1,5 +1,7 @@
+import functools
 import sys
 import warnings
+from collections import OrderedDict
 
 
 def saveit(func):
@@ -69,33 +71,106 @@ def deprecated(message=None):
     return _decorator
 
 
-def cached(size):
-    """A caching decorator based on parameter objects"""
+def cached(size, pref=None):
+    """A caching decorator based on parameter objects
+
+    The results for the last `size` distinct arguments are kept;
+    arguments should be hashable.  If `pref` is given, the size is
+    taken from that project config when a project is opened; see
+    `configure_caches()`.  The `_Cached` object is available as the
+    ``cache`` attribute of the decorated function.
+
+    """
 
     def decorator(func):
-        cached_func = _Cached(func, size)
-        return lambda *a, **kw: cached_func(*a, **kw)
+        cached_func = _Cached(func, size, pref)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwds):
+            return cached_func(*args, **kwds)
+
+        wrapper.cache = cached_func
+        return wrapper
 
     return decorator
 
 
+# All `_Cached` objects created by `cached()`
+_caches = []
+
+# Separates positional and keyword arguments in cache keys
+_kwds_mark = object()
+
+
+def configure_caches(prefs):
+    """Set the size of the caches that are configured by `prefs`
+
+    These caches are shared by all projects in this process; the last
+    opened project decides their size.
+
+    """
+    for cache in _caches:
+        if cache.pref is not None and prefs.get(cache.pref) is not None:
+            cache.resize(prefs.get(cache.pref))
+
+
+def get_cache_stats():
+    """Return a dict from the name of cached functions to their stats"""
+    return {cache.name: cache.get_stats() for cache in _caches}
+
+
 class _Cached:
-    def __init__(self, func, count):
+    """A least recently used cache of the results of a function"""
+
+    def __init__(self, func, size, pref=None):
         self.func = func
-        self.cache = []
-        self.count = count
+        self.size = size
+        self.pref = pref
+        self.name = "{}.{}".format(func.__module__, func.__qualname__)
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        _caches.append(self)
 
     def __call__(self, *args, **kwds):
-        key = (args, kwds)
-        for cached_key, cached_result in self.cache:
-            if cached_key == key:
-                return cached_result
+        key = args
+        if kwds:
+            key += (_kwds_mark,) + tuple(sorted(kwds.items()))
+        try:
+            result = self.cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable arguments
+            self.misses += 1
+            return self.func(*args, **kwds)
+        else:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return result
+        self.misses += 1
         result = self.func(*args, **kwds)
-        self.cache.append((key, result))
-        if len(self.cache) > self.count:
-            del self.cache[0]
+        self.cache[key] = result
+        if len(self.cache) > self.size:
+            self.cache.popitem(last=False)
         return result
 
+    def resize(self, size):
+        self.size = size
+        while len(self.cache) > self.size:
+            self.cache.popitem(last=False)
+
+    def clear(self):
+        self.cache.clear()
+
+    def get_stats(self):
+        return {
+            "size": self.size,
+            "entries": len(self.cache),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
 
 def resolve(str_or_obj):
     """Returns object from string"""
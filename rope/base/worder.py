@@ -32,10 +32,8 @@ class Worder:
         self.code = code
 
     def _init_ignores(self):
-        ignores = rope.base.simplify.ignored_regions(self.code)
         self.dumb_finder = _RealFinder(self.code, self.code)
-        self.starts = [ignored[0] for ignored in ignores]
-        self.ends = [ignored[1] for ignored in ignores]
+        self.starts, self.ends = rope.base.simplify.ignored_offsets(self.code)
 
     def _context_call(self, name, offset):
         if self.handle_ignores:
@@ -204,7 +204,10 @@ class AutoImport:
         self.names[modname] = globals
 
     def _write(self):
-        self.project.data_files.write_data("globalnames", self.names)
+        names = self.names
+        if self.project.data_files.writes_in_background:
+            names = {modname: list(globals) for modname, globals in names.items()}
+        self.project.data_files.write_data("globalnames", names)
 
     def _changed(self, resource):
         if not resource.is_folder():
@@ -1,4 +1,4 @@
-from rope.base import evaluate, exceptions, pyobjects, taskhandle, worder
+from rope.base import evaluate, exceptions, parallel, pyobjects, taskhandle, worder
 from rope.contrib import fixsyntax
 from rope.refactor import occurrences
 
@@ -36,9 +36,27 @@ def find_occurrences(
         in_hierarchy=in_hierarchy,
         instance=primary,
     )
+    if resources is None and not parallel.get_processes(project):
+        job_set = task_handle.create_jobset("Finding Occurrences")
+        return _find_locations(finder, project.iter_python_files(resource), job_set)
     if resources is None:
         resources = project.get_python_files()
     job_set = task_handle.create_jobset("Finding Occurrences", count=len(resources))
+    if resource.project is project and parallel.can_run_in_parallel(project, resources):
+        found = occurrences.find_occurrences_in_parallel(
+            project,
+            resources,
+            job_set,
+            resource,
+            offset,
+            unsure=is_match if unsure else None,
+            in_hierarchy=in_hierarchy,
+        )
+        return [
+            Location(occurrence)
+            for file_occurrences in found.values()
+            for occurrence in file_occurrences
+        ]
     return _find_locations(finder, resources, job_set)
 
 
@@ -78,7 +96,8 @@ def find_implementations(
     filters = [is_defined, not_self, occurrences.InHierarchyFilter(pyname, True)]
     finder = occurrences.Finder(project, name, filters=filters)
     if resources is None:
-        resources = project.get_python_files()
+        job_set = task_handle.create_jobset("Finding Implementations")
+        return _find_locations(finder, project.iter_python_files(resource), job_set)
     job_set = task_handle.create_jobset("Finding Implementations", count=len(resources))
     return _find_locations(finder, resources, job_set)
 
@@ -46,8 +46,7 @@ monitoring the progress of refactorings.
 
 """
 
-from rope.refactor.importutils import ImportOrganizer  # noqa
-from rope.refactor.topackage import ModuleToPackage  # noqa
+import importlib
 
 __all__ = [
     "rename",
@@ -66,3 +65,18 @@ __all__ = [
     "method_object",
     "multiproject",
 ]
+
+
+def __getattr__(name):
+    # Refactoring modules are imported when first used
+    if name == "ImportOrganizer":
+        from rope.refactor.importutils import ImportOrganizer
+
+        return ImportOrganizer
+    if name == "ModuleToPackage":
+        from rope.refactor.topackage import ModuleToPackage
+
+        return ModuleToPackage
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -35,17 +35,21 @@ calling the `create_finder()` function.
     arguments
 """
 
+import bisect
 import contextlib
+import heapq
 import re
 from typing import Iterator
 
 from rope.base import (
     ast,
-    codeanalyze,
     evaluate,
     exceptions,
+    libutils,
+    parallel,
     pynames,
     pyobjects,
+    simplify,
     utils,
     worder,
 )
@@ -77,6 +81,12 @@ class Finder:
 
     def find_occurrences(self, resource=None, pymodule=None):
         """Generate `Occurrence` instances"""
+        if (
+            resource is not None
+            and pymodule is None
+            and not self.project.name_index.may_contain(resource, self.name)
+        ):
+            return
         tools = _OccurrenceToolsCreator(
             self.project, resource=resource, pymodule=pymodule, docs=self.docs
         )
@@ -133,6 +143,151 @@ def create_finder(
     return Finder(project, name, filters=filters, docs=docs)
 
 
+def find_occurrences_in_parallel(
+    project, resources, job_set, resource, offset=None, unsure=None, **kwds
+):
+    """Find occurrences in `resources` using worker processes
+
+    The occurrences of the name at `offset` in `resource` are searched
+    for; if `offset` is `None`, the occurrences of module `resource`
+    itself.  `unsure` and `kwds` are the same as the arguments of
+    `create_finder()`; `unsure` is called in this process.
+
+    Returns a dict mapping each resource in `resources` to the list of
+    `RecordedOccurrence` found in it.  See `rope.base.parallel`.
+
+    """
+    target = (resource.path, offset)
+    name = _get_target_name(resource, offset)
+    searched = []
+    for file_ in resources:
+        if project.name_index.may_contain(file_, name):
+            searched.append(file_)
+        else:
+            job_set.started_job(file_.path)
+            job_set.finished_job()
+    results = parallel.run(
+        project,
+        _find_occurrences_in_worker,
+        searched,
+        job_set,
+        target,
+        unsure is not None,
+        kwds,
+    )
+    found = {}
+    for chunk, chunk_records in results:
+        for file_, records in zip(chunk, chunk_records):
+            found[file_] = [RecordedOccurrence(file_, *record) for record in records]
+    if unsure is not None:
+        _filter_unsure_occurrences(project, found, unsure, kwds.get("docs", False))
+    return {file_: found.get(file_, []) for file_ in resources}
+
+
+def _filter_unsure_occurrences(project, found, unsure, docs):
+    for file_, recorded in found.items():
+        if not any(occurrence.is_unsure() for occurrence in recorded):
+            continue
+        tools = _OccurrenceToolsCreator(project, resource=file_, docs=docs)
+        found[file_] = [
+            occurrence
+            for occurrence in recorded
+            if not occurrence.is_unsure()
+            or unsure(Occurrence(tools, occurrence.offset))
+        ]
+
+
+def _find_occurrences_in_worker(project, paths, target, unsure, kwds):
+    path, offset = target
+    resource = project.get_resource(path)
+    name = _get_target_name(resource, offset)
+    if offset is None:
+        if not resource.is_folder() and resource.name == "__init__.py":
+            resource = resource.parent
+        dummy_pymodule = libutils.get_string_module(project, "")
+        instance = None
+        pyname = pynames.ImportedModule(dummy_pymodule, resource=resource)
+    else:
+        pymodule = project.get_pymodule(resource)
+        instance, pyname = evaluate.eval_location2(pymodule, offset)
+    if unsure:
+        kwds = dict(kwds, unsure=lambda occurrence: True)
+    finder = create_finder(project, name, pyname, instance=instance, **kwds)
+    result = []
+    for path in paths:
+        records = []
+        result.append(records)
+        try:
+            file_ = project.get_resource(path)
+        except exceptions.ResourceNotFoundError:
+            continue
+        for occurrence in finder.find_occurrences(file_):
+            records.append(
+                (
+                    occurrence.offset,
+                    occurrence.get_word_range(),
+                    occurrence.get_primary_range(),
+                    occurrence.lineno,
+                    bool(occurrence.is_unsure()),
+                    occurrence.is_written(),
+                    occurrence.is_a_fixed_primary(),
+                )
+            )
+    return result
+
+
+def _get_target_name(resource, offset):
+    if offset is not None:
+        return worder.get_name_at(resource, offset)
+    if not resource.is_folder() and resource.name == "__init__.py":
+        resource = resource.parent
+    return resource.name if resource.is_folder() else resource.name[:-3]
+
+
+class RecordedOccurrence:
+    """An occurrence found by `find_occurrences_in_parallel()`
+
+    It provides the parts of `Occurrence` interface that do not need
+    evaluating python names again.
+
+    """
+
+    def __init__(
+        self,
+        resource,
+        offset,
+        word_range,
+        primary_range,
+        lineno,
+        unsure,
+        written,
+        fixed_primary,
+    ):
+        self.resource = resource
+        self.offset = offset
+        self.lineno = lineno
+        self._word_range = word_range
+        self._primary_range = primary_range
+        self._unsure = unsure
+        self._written = written
+        self._fixed_primary = fixed_primary
+
+    def get_word_range(self):
+        return self._word_range
+
+    def get_primary_range(self):
+        return self._primary_range
+
+    def is_unsure(self):
+        return self._unsure
+
+    def is_written(self):
+        return self._written
+
+    def is_a_fixed_primary(self):
+        return self._fixed_primary
+
+
 class Occurrence:
     def __init__(self, tools, offset):
         self.tools = tools
@@ -311,13 +466,6 @@ class _TextualFinder:
     def __init__(self, name, docs=False):
         self.name = name
         self.docs = docs
-        self.comment_pattern = _TextualFinder.any("comment", [r"#[^\n]*"])
-        self.string_pattern = _TextualFinder.any(
-            "string", [codeanalyze.get_string_pattern()]
-        )
-        self.f_string_pattern = _TextualFinder.any(
-            "fstring", [codeanalyze.get_formatted_string_pattern()]
-        )
         self.pattern = self._get_occurrence_pattern(self.name)
 
     def find_offsets(self, source: str) -> Iterator[int]:
@@ -330,13 +478,31 @@ class _TextualFinder:
         yield from searcher(source)
 
     def _re_search(self, source: str) -> Iterator[int]:
-        for match in self.pattern.finditer(source):
-            if match.groupdict()["occurrence"]:
-                yield match.start("occurrence")
-            elif match.groupdict()["fstring"]:
-                f_string = match.groupdict()["fstring"]
-                for offset in self._search_in_f_string(f_string):
-                    yield match.start("fstring") + offset
+        # Strings and comments are blanked in the simplified code, except
+        # for f-strings whose expressions are searched separately
+        code = simplify.real_code(source)
+        f_strings = [
+            (start, end)
+            for start, end, groups in simplify.ignored_regions(source)
+            if "f" in (groups["prefix"] or "").lower()
+        ]
+        f_string_starts = [start for start, end in f_strings]
+
+        def in_code():
+            for match in self.pattern.finditer(code):
+                offset = match.start()
+                index = bisect.bisect(f_string_starts, offset)
+                if index == 0 or f_strings[index - 1][1] <= offset:
+                    yield offset
+
+        def in_f_strings():
+            for start, end in f_strings:
+                f_string = source[start:end]
+                if self.name in f_string:
+                    for offset in sorted(self._search_in_f_string(f_string)):
+                        yield start + offset
+
+        yield from heapq.merge(in_code(), in_f_strings())
 
     def _search_in_f_string(self, f_string: str) -> Iterator[int]:
         tree = ast.parse(f_string)
@@ -373,21 +539,7 @@ class _TextualFinder:
             return pymodule.source_code
 
     def _get_occurrence_pattern(self, name):
-        occurrence_pattern = _TextualFinder.any("occurrence", ["\\b" + name + "\\b"])
-        pattern = re.compile(
-            occurrence_pattern
-            + "|"
-            + self.comment_pattern
-            + "|"
-            + self.string_pattern
-            + "|"
-            + self.f_string_pattern
-        )
-        return pattern
-
-    @staticmethod
-    def any(name, list_):
-        return "(?P<%s>" % name + "|".join(list_) + ")"
+        return re.compile("\\b" + name + "\\b")
 
 
 class _OccurrenceToolsCreator:
@@ -6,6 +6,7 @@ from rope.base import (
     evaluate,
     exceptions,
     libutils,
+    parallel,
     pynames,
     pyobjects,
     taskhandle,
@@ -27,6 +28,7 @@ class Rename:
         """If `offset` is None, the `resource` itself will be renamed"""
         self.project = project
         self.resource = resource
+        self.offset = offset
         if offset is not None:
             self.old_name = worder.get_name_at(self.resource, offset)
             this_pymodule = self.project.get_pymodule(self.resource)
@@ -118,12 +120,32 @@ class Rename:
             in_hierarchy=in_hierarchy and self.is_method(),
         )
         job_set = task_handle.create_jobset("Collecting Changes", len(resources))
-        for file_ in resources:
-            job_set.started_job(file_.path)
-            new_content = rename_in_module(finder, new_name, resource=file_)
-            if new_content is not None:
-                changes.add_change(ChangeContents(file_, new_content))
-            job_set.finished_job()
+        if self.resource.project is self.project and parallel.can_run_in_parallel(
+            self.project, resources
+        ):
+            found = occurrences.find_occurrences_in_parallel(
+                self.project,
+                resources,
+                job_set,
+                self.resource,
+                self.offset,
+                unsure=unsure,
+                docs=docs,
+                in_hierarchy=in_hierarchy and self.is_method(),
+            )
+            for file_, file_occurrences in found.items():
+                new_content = _rename_occurrences(
+                    file_.read(), file_occurrences, new_name
+                )
+                if new_content is not None:
+                    changes.add_change(ChangeContents(file_, new_content))
+        else:
+            for file_ in resources:
+                job_set.started_job(file_.path)
+                new_content = rename_in_module(finder, new_name, resource=file_)
+                if new_content is not None:
+                    changes.add_change(ChangeContents(file_, new_content))
+                job_set.finished_job()
         if self._is_renaming_a_module():
             resource = self.old_pyname.get_object().get_resource()
             if self._is_allowed_to_move(resources, resource):
@@ -239,8 +261,28 @@ def rename_in_module(
         source_code = resource.read()
     else:
         source_code = pymodule.source_code
+    return _rename_occurrences(
+        source_code,
+        occurrences_finder.find_occurrences(resource, pymodule),
+        new_name,
+        replace_primary,
+        region,
+        reads,
+        writes,
+    )
+
+
+def _rename_occurrences(
+    source_code,
+    found_occurrences,
+    new_name,
+    replace_primary=False,
+    region=None,
+    reads=True,
+    writes=True,
+):
     change_collector = codeanalyze.ChangeCollector(source_code)
-    for occurrence in occurrences_finder.find_occurrences(resource, pymodule):
+    for occurrence in found_occurrences:
         if replace_primary and occurrence.is_a_fixed_primary():
             continue
         if replace_primary:
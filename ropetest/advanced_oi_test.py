@@ -1,8 +1,10 @@
 import unittest
 from textwrap import dedent
+from unittest import mock
 
 import rope.base.libutils
 import rope.base.oi
+import rope.base.oi.callgraph
 from rope.base.builtins import Str
 from ropetest import testutils
 
@@ -507,6 +509,25 @@ class NewStaticOITest(unittest.TestCase):
         p_type = f_scope["p"].get_object().get_type()
         self.assertEqual(c_class, p_type)
 
+    def test_static_oi_for_returned_objects_depending_on_parameters(self):
+        code = dedent("""\
+            class A(object):
+                pass
+            class B(object):
+                pass
+            def ident(x):
+                return x
+            def wrap(p):
+                return ident(p)
+            a = wrap(A())
+            b = wrap(B())
+        """)
+        self.mod.write(code)
+        self.pycore.analyze_module(self.mod, followed_calls=2)
+        pymod = self.project.get_pymodule(self.mod)
+        self.assertEqual(pymod["A"].get_object(), pymod["a"].get_object().get_type())
+        self.assertEqual(pymod["B"].get_object(), pymod["b"].get_object().get_type())
+
     def test_static_oi_not_failing_when_callin_callables(self):
         code = dedent("""\
             class C(object):
@@ -1007,6 +1028,129 @@ class NewStaticOITest(unittest.TestCase):
         p_type = f_scope["p"].get_object().get_type()
         self.assertEqual(c_class, p_type)
 
+    def test_analyzing_all_modules_in_worker_processes(self):
+        self.project.prefs["worker_processes"] = 2
+        mod2 = testutils.create_module(self.project, "mod2")
+        self.mod.write(dedent("""\
+            class C(object):
+                pass
+            def f(p):
+                pass
+        """))
+        mod2.write(dedent("""\
+            import mod
+            mod.f(mod.C())
+        """))
+        rope.base.libutils.analyze_modules(self.project)
+        pymod = self.project.get_pymodule(self.mod)
+        c_class = pymod["C"].get_object()
+        f_scope = pymod["f"].get_object().get_scope()
+        p_type = f_scope["p"].get_object().get_type()
+        self.assertEqual(c_class, p_type)
+
+    def _change_module_for_soa(self, resource, code):
+        old_contents = resource.read()
+        with open(resource.real_path, "w") as output:
+            output.write(code)
+        rope.base.libutils.report_change(
+            self.project, resource.real_path, old_contents
+        )
+
+    def _get_parameter_types(self, key):
+        callinfos = self.pycore.object_info.objectdb.get_callinfos("mod.py", key)
+        return {call_info.get_parameters()[0][1][2] for call_info in callinfos}
+
+    def test_analyzing_callers_of_changed_functions(self):
+        self.project = testutils.sample_project(
+            validate_objectdb=True, automatic_soa=True, soa_call_graph_budget=10
+        )
+        self.pycore = self.project.pycore
+        self.mod = testutils.create_module(self.project, "mod")
+        code = dedent("""\
+            class A(object):
+                pass
+            def make():
+                return A()
+            def g(p):
+                pass
+            def caller():
+                g(make())
+        """)
+        self.mod.write(code)
+        self.pycore.analyze_module(self.mod)
+        self.assertEqual({"A"}, self._get_parameter_types("g"))
+        self._change_module_for_soa(self.mod, code.replace("A", "C"))
+        self.assertIn("C", self._get_parameter_types("g"))
+
+    def test_not_analyzing_callers_without_call_graph_budget(self):
+        self.project.prefs["automatic_soa"] = True
+        code = dedent("""\
+            class A(object):
+                pass
+            def make():
+                return A()
+            def g(p):
+                pass
+            def caller():
+                g(make())
+        """)
+        self.mod.write(code)
+        self.pycore.analyze_module(self.mod)
+        self._change_module_for_soa(self.mod, code.replace("A", "C"))
+        self.assertNotIn("C", self._get_parameter_types("g"))
+
+    def test_limiting_analyzed_affected_scopes_to_call_graph_budget(self):
+        self.project = testutils.sample_project(
+            validate_objectdb=True, automatic_soa=True, soa_call_graph_budget=1
+        )
+        self.pycore = self.project.pycore
+        self.mod = testutils.create_module(self.project, "mod")
+        code = dedent("""\
+            class A(object):
+                pass
+            def make():
+                return A()
+            def caller1():
+                make()
+            def caller2():
+                make()
+        """)
+        self.mod.write(code)
+        self.pycore.analyze_module(self.mod)
+        call_graph = self.pycore.object_info.call_graph
+        self.assertEqual(
+            {("mod.py", "caller1"), ("mod.py", "caller2")},
+            call_graph.get_callers(("mod.py", "make")),
+        )
+        self._change_module_for_soa(self.mod, code.replace("A()", "A(), 1"))
+        self.assertEqual(1, len(call_graph.scheduled))
+        rope.base.oi.callgraph.analyze_affected(self.pycore, [])
+        self.assertEqual(0, len(call_graph.scheduled))
+
+    def test_forgetting_concluded_data_once_for_affected_scopes(self):
+        self.project = testutils.sample_project(
+            validate_objectdb=True, automatic_soa=True, soa_call_graph_budget=10
+        )
+        self.pycore = self.project.pycore
+        self.mod = testutils.create_module(self.project, "mod")
+        self.mod.write(dedent("""\
+            class A(object):
+                pass
+            def make():
+                return A()
+        """))
+        for index in range(3):
+            caller = testutils.create_module(self.project, "caller%d" % index)
+            caller.write("import mod\ndef g(p):\n    pass\ng(mod.make())\n")
+            self.pycore.analyze_module(caller)
+        module_cache = self.pycore.module_cache
+        with mock.patch.object(
+            module_cache, "forget_all_data", wraps=module_cache.forget_all_data
+        ) as forget_all_data:
+            self._change_module_for_soa(self.mod, self.mod.read().replace("A", "C"))
+        self.assertEqual(2, forget_all_data.call_count)
+        self.assertEqual({}, self.pycore.object_info.call_graph.scheduled)
+
     def test_validation_problems_for_objectdb_retrievals(self):
         mod1 = testutils.create_module(self.project, "mod1")
         mod2 = testutils.create_module(self.project, "mod2")
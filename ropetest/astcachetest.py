@@ -0,0 +1,101 @@
+import os
+import time
+import unittest
+from textwrap import dedent
+
+import rope.base.project
+from rope.base import ast, exceptions
+from ropetest import testutils
+
+
+class ASTCacheTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.project = testutils.sample_project(save_ast_cache=True)
+        self.ast_cache = self.project.pycore.ast_cache
+
+    def tearDown(self):
+        testutils.remove_project(self.project)
+        super().tearDown()
+
+    def _reopen_project(self):
+        self.project.close()
+        self.project = rope.base.project.Project(
+            self.project.address, save_ast_cache=True
+        )
+        self.ast_cache = self.project.pycore.ast_cache
+
+    def _get_entries(self):
+        if not os.path.exists(self.ast_cache.folder):
+            return []
+        return os.listdir(self.ast_cache.folder)
+
+    def test_saving_parsed_modules(self):
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = 1\n")
+        self.project.get_pymodule(mod)
+        self.assertEqual(1, self.ast_cache.misses)
+        self.assertEqual(1, len(self._get_entries()))
+
+    def test_reusing_parsed_modules_across_projects(self):
+        mod = testutils.create_module(self.project, "mod")
+        mod.write(dedent("""\
+            def a_func():
+                pass
+        """))
+        self.project.get_pymodule(mod)
+        self._reopen_project()
+        pymod = self.project.get_pymodule(self.project.get_resource("mod.py"))
+        self.assertEqual(1, self.ast_cache.hits)
+        self.assertEqual(0, self.ast_cache.misses)
+        self.assertIsInstance(pymod.get_ast(), ast.Module)
+        self.assertTrue("a_func" in pymod)
+
+    def test_not_reusing_entries_after_changes(self):
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = 1\n")
+        self.project.get_pymodule(mod)
+        mod.write("another_var = 1\n")
+        pymod = self.project.get_pymodule(mod)
+        self.assertEqual(2, self.ast_cache.misses)
+        self.assertTrue("another_var" in pymod)
+        self.assertFalse("a_var" in pymod)
+
+    def test_not_saving_modules_with_syntax_errors(self):
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = \n")
+        with self.assertRaises(exceptions.ModuleSyntaxError):
+            self.project.get_pymodule(mod)
+        self.assertEqual([], self._get_entries())
+
+    def test_evicting_entries_when_exceeding_the_limit(self):
+        self.project.prefs["max_ast_cache_size"] = 0
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = 1\n")
+        self.project.get_pymodule(mod)
+        self.assertEqual([], self._get_entries())
+
+    def test_not_saving_when_disabled(self):
+        self.project.prefs["save_ast_cache"] = False
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = 1\n")
+        self.project.get_pymodule(mod)
+        self.assertEqual([], self._get_entries())
+
+    def test_marking_old_entries_as_used_when_reading_them(self):
+        source = b"a_var = 1\n"
+        self.ast_cache.parse(source)
+        path = self.ast_cache._get_entry_path(source)
+        os.utime(path, (1000, 1000))
+        self.ast_cache.parse(source)
+        self.assertGreater(os.stat(path).st_mtime, 1000)
+
+    def test_not_writing_recently_used_entries_when_reading_them(self):
+        source = b"a_var = 1\n"
+        self.ast_cache.parse(source)
+        path = self.ast_cache._get_entry_path(source)
+        recently = int(time.time()) - 60
+        os.utime(path, (recently, recently))
+        self.ast_cache.parse(source)
+        self.assertEqual(1, self.ast_cache.hits)
+        self.assertEqual(recently, os.stat(path).st_mtime)
@@ -1,7 +1,9 @@
+import time
 import unittest
 from textwrap import dedent
+from unittest import mock
 
-from rope.base import builtins, libutils, pyobjects
+from rope.base import builtins, introspect, libutils, pyobjects
 from rope.base.builtins import Dict
 from ropetest import testutils
 
@@ -675,3 +677,46 @@ class BuiltinModulesTest(unittest.TestCase):
         import rope.base.stdmods
 
         self.assertEqual(rope.base.stdmods.normalize_so_name("timemodule.so"), "time")
+
+
+class IntrospectedModulesTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.project = testutils.sample_project(
+            extension_modules=["time", "invalid"], introspect_in_subprocess=True
+        )
+        self.mod = testutils.create_module(self.project, "mod")
+
+    def tearDown(self):
+        testutils.remove_project(self.project)
+        introspect._descriptions.clear()
+        super().tearDown()
+
+    def test_simple_case(self):
+        self.mod.write("import time")
+        pymod = self.project.get_pymodule(self.mod)
+        time_module = pymod["time"].get_object()
+        self.assertIn("time", time_module)
+        self.assertEqual(time.__doc__, time_module.get_doc())
+        sleep = time_module["sleep"].get_object()
+        self.assertEqual("sleep", sleep.get_name())
+        self.assertIn("sleep", sleep.get_doc())
+        struct_time = time_module["struct_time"].get_object()
+        self.assertIsInstance(struct_time, builtins.BuiltinClass)
+        self.assertIn("tm_year", struct_time)
+
+    def test_nonexistent_modules(self):
+        self.mod.write("import invalid")
+        pymod = self.project.get_pymodule(self.mod)
+        self.assertNotIn("sleep", pymod["invalid"].get_object())
+
+    def test_saving_introspection_results(self):
+        self.mod.write("import time")
+        self.project.get_pymodule(self.mod)["time"].get_object().get_attributes()
+        introspect._descriptions.clear()
+        with mock.patch.object(introspect, "_describe_in_subprocess") as describe:
+            self.project.pycore.module_cache.forget_all_data()
+            self.project.pycore.extension_cache.extensions.clear()
+            pymod = self.project.get_pymodule(self.mod)
+            self.assertIn("time", pymod["time"].get_object())
+        describe.assert_not_called()
@@ -38,6 +38,19 @@ class SourceLinesAdapterTest(unittest.TestCase):
         to_lines = SourceLinesAdapter("line1")
         self.assertEqual(1, to_lines.get_line_number(5))
 
+    def test_source_lines_empty_lines(self):
+        to_lines = SourceLinesAdapter("\n\nline3")
+        self.assertEqual(3, to_lines.length())
+        self.assertEqual("", to_lines.get_line(2))
+        self.assertEqual(2, to_lines.get_line_number(1))
+        self.assertEqual(3, to_lines.get_line_number(2))
+
+    def test_sharing_line_starts_of_the_same_source(self):
+        code = "line1\nline2\n"
+        self.assertIs(
+            SourceLinesAdapter(code).starts, SourceLinesAdapter(code).starts
+        )
+
 
 class WordRangeFinderTest(unittest.TestCase):
     def _find_primary(self, code, offset):
@@ -1,7 +1,7 @@
 import unittest
 from textwrap import dedent
 
-from rope.base import exceptions
+from rope.base import exceptions, taskhandle
 from rope.contrib.findit import find_definition, find_implementations, find_occurrences
 from ropetest import testutils
 
@@ -60,6 +60,56 @@ class FindItTest(unittest.TestCase):
         self.assertEqual(1, len(result))
         self.assertEqual((mod1, 0), (result[0].resource, result[0].offset))
 
+    def test_finding_occurrences_in_the_nearest_modules_first(self):
+        pkg = testutils.create_package(self.project, "pkg")
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2", pkg)
+        mod1.write("from pkg import mod2\nmod2.a_var\n")
+        mod2.write("a_var = 1\n")
+        result = find_occurrences(self.project, mod2, 1)
+        self.assertEqual([mod2, mod1], [location.resource for location in result])
+
+    def test_stopping_find_occurrences(self):
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = 1\n")
+        handle = taskhandle.TaskHandle()
+
+        def stop():
+            jobset = handle.current_jobset()
+            if jobset.job_name is not None and not handle.is_stopped():
+                handle.stop()
+
+        handle.add_observer(stop)
+        with self.assertRaises(exceptions.InterruptedTaskError):
+            find_occurrences(self.project, mod, 1, task_handle=handle)
+
+    def test_finding_occurrences_in_worker_processes(self):
+        self.project.prefs["worker_processes"] = 2
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod1.write(dedent("""\
+            class C(object):
+                def a_func(self):
+                    pass
+        """))
+        mod2.write(dedent("""\
+            import mod1
+            mod1.C().a_func()
+            def f(arg):
+                arg.a_func()
+        """))
+        offset = mod1.read().index("a_func")
+        result = find_occurrences(self.project, mod1, offset, resources=[mod1, mod2])
+        self.assertEqual(
+            [(mod1, offset, 2, False), (mod2, mod2.read().index("a_func"), 2, False)],
+            [(loc.resource, loc.offset, loc.lineno, loc.unsure) for loc in result],
+        )
+        result = find_occurrences(
+            self.project, mod1, offset, unsure=True, resources=[mod1, mod2]
+        )
+        self.assertEqual(3, len(result))
+        self.assertTrue(result[2].unsure)
+
     def test_find_occurrences_and_class_hierarchies(self):
         mod1 = testutils.create_module(self.project, "mod1")
         mod1.write(dedent("""\
@@ -0,0 +1,75 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _import_times(module):
+    """Import `module` in a new interpreter with ``-X importtime``
+
+    Return a dict of the cumulative import time of each module it
+    imports, in microseconds.
+
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        result[name.strip()] = int(cumulative)
+    return result
+
+
+@pytest.mark.parametrize(
+    "module", ["rope", "rope.base.project", "rope.base.libutils", "rope.refactor"]
+)
+def test_importing_does_not_load_object_inference(module):
+    imported = _import_times(module)
+    assert module in imported
+    for heavy in [
+        "importlib.metadata",
+        "rope.base.pycore",
+        "rope.base.oi.soi",
+        "rope.base.builtins",
+        "rope.refactor.importutils",
+    ]:
+        assert heavy not in imported
+
+
+def test_refactoring_classes_are_imported_lazily():
+    import rope.refactor
+    from rope.refactor.importutils import ImportOrganizer
+    from rope.refactor.topackage import ModuleToPackage
+
+    assert rope.refactor.ImportOrganizer is ImportOrganizer
+    assert rope.refactor.ModuleToPackage is ModuleToPackage
+    with pytest.raises(AttributeError):
+        rope.refactor.NotARefactoring
+
+
+@pytest.mark.parametrize("name", ["importutils", "topackage", "rename"])
+def test_refactoring_submodules_are_imported_lazily(name):
+    # In a new interpreter; other tests may have imported them already
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import rope.refactor; print(rope.refactor.%s.__name__)" % name,
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert process.stdout.strip() == "rope.refactor." + name
+
+
+def test_version_is_looked_up_lazily():
+    import rope
+
+    assert rope.VERSION == rope._get_version()
@@ -0,0 +1,117 @@
+import errno
+import os
+import unittest
+from unittest import mock
+
+from rope.base import inotify
+from ropetest import testutils
+
+
+@unittest.skipUnless(inotify.is_available(), "inotify is not available")
+class InotifyWatcherTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.project = testutils.sample_project(watch_resources=True)
+
+    def tearDown(self):
+        testutils.remove_project(self.project)
+        super().tearDown()
+
+    def test_watching_the_project(self):
+        self.assertIsNotNone(self.project.watcher)
+
+    def test_reporting_external_changes(self):
+        mod = testutils.create_module(self.project, "mod")
+        self.project.validate()
+        with open(mod.real_path, "w") as output:
+            output.write("a_var = 1\n")
+        self.assertEqual(
+            [mod], self.project.watcher.get_changed_resources(self.project.root)
+        )
+        self.assertEqual(
+            [], self.project.watcher.get_changed_resources(self.project.root)
+        )
+
+    def test_reporting_changes_in_new_folders(self):
+        pkg = testutils.create_package(self.project, "pkg")
+        self.project.validate()
+        self.project.watcher.get_changed_resources(self.project.root)
+        with open(pkg.get_child("__init__.py").real_path, "w") as output:
+            output.write("a_var = 1\n")
+        self.assertEqual(
+            [pkg.get_child("__init__.py")],
+            self.project.watcher.get_changed_resources(pkg),
+        )
+
+    def test_not_reporting_ignored_resources(self):
+        self.project.set("ignored_resources", [".ropeproject", "*.txt"])
+        self.project.validate()
+        with open(os.path.join(self.project.address, "file.txt"), "w"):
+            pass
+        self.assertEqual(
+            [], self.project.watcher.get_changed_resources(self.project.root)
+        )
+
+    def test_validating_changed_modules(self):
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod1.write("a_var = 1\n")
+        mod2.write("b_var = 1\n")
+        pymod1 = self.project.get_pymodule(mod1)
+        pymod2 = self.project.get_pymodule(mod2)
+        with open(mod1.real_path, "w") as output:
+            output.write("new_var = 1\n")
+        self.project.validate()
+        self.assertIsNot(pymod1, self.project.get_pymodule(mod1))
+        self.assertIs(pymod2, self.project.get_pymodule(mod2))
+        self.assertIn("new_var", self.project.get_pymodule(mod1))
+
+    def test_validating_removed_modules(self):
+        mod = testutils.create_module(self.project, "mod")
+        self.project.get_files()
+        self.project.validate()
+        testutils.remove_recursively(mod.real_path)
+        self.project.validate()
+        self.assertNotIn(mod, self.project.get_files())
+
+    def test_not_validating_without_changes(self):
+        testutils.create_module(self.project, "mod")
+        self.project.validate()
+        files = self.project.get_files()
+        self.project.validate()
+        self.assertIs(files, self.project.file_list.files)
+
+    def test_validating_packages_after_external_changes(self):
+        pkg = testutils.create_package(self.project, "pkg")
+        testutils.create_module(self.project, "mod1", pkg)
+        self.project.validate()
+        self.assertEqual(["mod1"], list(self.project.get_pymodule(pkg)))
+        with open(os.path.join(pkg.real_path, "mod2.py"), "w"):
+            pass
+        self.project.validate()
+        self.assertEqual(["mod1", "mod2"], sorted(self.project.get_pymodule(pkg)))
+        os.remove(os.path.join(pkg.real_path, "mod1.py"))
+        self.project.validate()
+        self.assertEqual(["mod2"], list(self.project.get_pymodule(pkg)))
+
+    def test_validating_everything_when_folders_cannot_be_watched(self):
+        watcher = self.project.watcher
+        watcher.get_changed_resources(self.project.root)
+        with mock.patch.object(
+            watcher.libc, "inotify_add_watch", return_value=-1
+        ), mock.patch("ctypes.get_errno", return_value=errno.ENOSPC):
+            os.mkdir(os.path.join(self.project.address, "pkg"))
+            self.assertIsNone(watcher.get_changed_resources(self.project.root))
+        self.assertIsNone(watcher.get_changed_resources(self.project.root))
+        pkg = self.project.get_folder("pkg")
+        self.project.validate()
+        with open(os.path.join(pkg.real_path, "mod.py"), "w"):
+            pass
+        self.project.validate()
+        self.assertIn(pkg.get_child("mod.py"), self.project.get_files())
+
+    def test_closing_the_watcher_with_the_project(self):
+        watcher = self.project.watcher
+        self.project.close()
+        self.assertIsNone(self.project.watcher)
+        self.assertEqual(-1, watcher.fd)
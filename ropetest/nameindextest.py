@@ -0,0 +1,90 @@
+import os
+import unittest
+
+import rope.base.project
+from ropetest import testutils
+
+
+class NameIndexTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.project = testutils.sample_project()
+        self.name_index = self.project.name_index
+
+    def tearDown(self):
+        testutils.remove_project(self.project)
+        super().tearDown()
+
+    def test_finding_names_in_files(self):
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = another_var  # comment_name\n")
+        self.assertTrue(self.name_index.may_contain(mod, "a_var"))
+        self.assertTrue(self.name_index.may_contain(mod, "another_var"))
+        self.assertTrue(self.name_index.may_contain(mod, "comment_name"))
+        self.assertFalse(self.name_index.may_contain(mod, "var"))
+        self.assertFalse(self.name_index.may_contain(mod, "missing"))
+
+    def test_not_pruning_non_identifiers(self):
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = 1\n")
+        self.assertTrue(self.name_index.may_contain(mod, "a_var.b"))
+
+    def test_updating_after_changes(self):
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = 1\n")
+        self.assertFalse(self.name_index.may_contain(mod, "new_var"))
+        mod.write("new_var = 1\n")
+        self.assertTrue(self.name_index.may_contain(mod, "new_var"))
+        self.assertFalse(self.name_index.may_contain(mod, "a_var"))
+
+    def test_updating_after_moves(self):
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = 1\n")
+        self.assertTrue(self.name_index.may_contain(mod, "a_var"))
+        mod.move("newmod.py")
+        newmod = self.project.get_resource("newmod.py")
+        self.assertEqual([newmod], self.name_index.get_resources("a_var"))
+
+    def test_updating_after_external_changes_and_validation(self):
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = 1\n")
+        self.assertFalse(self.name_index.may_contain(mod, "new_var"))
+        with open(mod.real_path, "w") as output:
+            output.write("new_var = 10\n")
+        self.project.validate(self.project.root)
+        self.assertTrue(self.name_index.may_contain(mod, "new_var"))
+
+    def test_getting_resources_containing_a_name(self):
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod1.write("a_var = 1\n")
+        mod2.write("import mod1\nprint(mod1.a_var)\n")
+        self.assertEqual(
+            {mod1, mod2}, set(self.name_index.get_resources("a_var"))
+        )
+        self.assertEqual([mod2], self.name_index.get_resources("mod1"))
+
+    def test_saving_the_index(self):
+        self.project.prefs["save_name_index"] = True
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = 1\n")
+        self.name_index.may_contain(mod, "a_var")
+        self.project.close()
+        project = rope.base.project.Project(self.project.address, save_name_index=True)
+        self.assertIn("mod.py", project.name_index.files)
+        mod = project.get_resource("mod.py")
+        self.assertTrue(project.name_index.may_contain(mod, "a_var"))
+
+    def test_checking_saved_entries_against_files(self):
+        self.project.prefs["save_name_index"] = True
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = 1\n")
+        self.name_index.may_contain(mod, "a_var")
+        self.project.close()
+        with open(mod.real_path, "w") as output:
+            output.write("new_var = 10\n")
+        os.utime(mod.real_path, ns=(1, 1))
+        project = rope.base.project.Project(self.project.address, save_name_index=True)
+        mod = project.get_resource("mod.py")
+        self.assertTrue(project.name_index.may_contain(mod, "new_var"))
+        self.assertFalse(project.name_index.may_contain(mod, "a_var"))
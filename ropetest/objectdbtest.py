@@ -1,6 +1,7 @@
+import sqlite3
 import unittest
 
-from rope.base.oi import memorydb, objectdb
+from rope.base.oi import memorydb, objectdb, sqlitedb
 from ropetest import testutils
 
 
@@ -42,11 +43,15 @@ class ObjectDBTest(unittest.TestCase):
         super().setUp()
         self.project = testutils.sample_project()
         validation = _MockValidation()
-        self.dbs = [objectdb.ObjectDB(memorydb.MemoryDB(self.project), validation)]
+        self.dbs = [
+            objectdb.ObjectDB(memorydb.MemoryDB(self.project), validation),
+            objectdb.ObjectDB(sqlitedb.SQLiteDB(self.project), validation),
+        ]
 
     def tearDown(self):
         for db in self.dbs:
             db.write()
+        self.dbs[1].db.close()
         testutils.remove_project(self.project)
         super().tearDown()
 
@@ -200,3 +205,99 @@ class ObjectDBTest(unittest.TestCase):
         assert isinstance(rehydrated_scope_info, ScopeInfo)
         assert rehydrated_scope_info.call_info == scope_info.call_info
         assert rehydrated_scope_info.per_name == scope_info.per_name
+
+
+class SQLiteDBTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.project = testutils.sample_project(save_objectdb=True)
+        self.validation = _MockValidation()
+
+    def tearDown(self):
+        testutils.remove_project(self.project)
+        super().tearDown()
+
+    def _open_db(self):
+        return objectdb.ObjectDB(sqlitedb.SQLiteDB(self.project), self.validation)
+
+    def test_saving_object_information(self):
+        db = self._open_db()
+        db.add_callinfo("file", "key", (1, 2), 3)
+        db.add_pername("file", "key", "name", 1)
+        db.add_pername("file", "key2", "name", 2)
+        db.write()
+        db.db.close()
+
+        db = self._open_db()
+        self.assertEqual({"file"}, set(db.get_files()))
+        self.assertEqual(3, db.get_returned("file", "key", (1, 2)))
+        self.assertEqual(1, db.get_pername("file", "key", "name"))
+        self.assertEqual(2, db.get_pername("file", "key2", "name"))
+        db.db.close()
+
+    def test_writing_only_changed_scopes(self):
+        db = self._open_db()
+        db.add_pername("file", "key1", "name", 1)
+        db.add_pername("file", "key2", "name", 2)
+        db.write()
+        db.db.close()
+
+        db = self._open_db()
+        db.add_pername("file", "key1", "name", 3)
+        self.assertEqual(["key1"], list(db.files["file"].scopes))
+        db.write()
+        db.db.close()
+
+        db = self._open_db()
+        self.assertEqual(3, db.get_pername("file", "key1", "name"))
+        self.assertEqual(2, db.get_pername("file", "key2", "name"))
+        db.db.close()
+
+    def test_saving_removed_and_moved_files(self):
+        db = self._open_db()
+        db.add_callinfo("file1", "key", (1, 2), 3)
+        db.add_callinfo("invalid", "key", (1, 2), 3)
+        db.write()
+        db.validate_files()
+        db.file_moved("file1", "file2")
+        db.write()
+        db.db.close()
+
+        db = self._open_db()
+        self.assertEqual({"file2"}, set(db.get_files()))
+        self.assertEqual(3, db.get_returned("file2", "key", (1, 2)))
+        db.db.close()
+
+    def test_importing_pickled_object_information(self):
+        memory_db = objectdb.ObjectDB(
+            memorydb.MemoryDB(self.project, persist=True), self.validation
+        )
+        memory_db.add_callinfo("file", "key", (1, 2), 3)
+        memory_db.write()
+
+        db = self._open_db()
+        self.assertEqual(3, db.get_returned("file", "key", (1, 2)))
+        db.db.close()
+
+    def test_closing_the_database_with_the_project(self):
+        project = testutils.sample_project(
+            save_objectdb=True, objectdb_backend="sqlite"
+        )
+        self.addCleanup(testutils.remove_project, project)
+        connection = project.pycore.object_info.objectdb.db.connection
+        project.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            connection.execute("SELECT path FROM files")
+
+    def test_using_sqlite_backend_in_projects(self):
+        project = testutils.sample_project(
+            save_objectdb=True, objectdb_backend="sqlite"
+        )
+        self.addCleanup(testutils.remove_project, project)
+        mod = testutils.create_module(project, "mod")
+        mod.write("def f(p):\n    return p\nf(1)\n")
+        project.pycore.analyze_module(mod)
+        project.close()
+        db = project.pycore.object_info.objectdb
+        self.assertIsInstance(db.db, sqlitedb.SQLiteDB)
+        self.assertEqual(["mod.py"], list(db.get_files()))
@@ -1,8 +1,10 @@
 import os.path
 import pathlib
 import tempfile
+import threading
 import unittest
 from textwrap import dedent
+from unittest import mock
 
 from rope.base.exceptions import ResourceNotFoundError, RopeError
 from rope.base.fscommands import FileSystemCommands
@@ -283,6 +285,61 @@ class ProjectTest(unittest.TestCase):
         self.project.get_file("newfile.txt").remove()
         self.assertEqual(1, len(self.project.get_files()))
 
+    def test_updating_all_files_without_listing_folders_again(self):
+        files = self.project.get_files()
+        myfile = self.project.root.create_file("myfile.txt")
+        self.assertIs(files, self.project.get_files())
+        self.assertIn(myfile, files)
+        myfile.move("newfile.txt")
+        self.assertIs(files, self.project.get_files())
+        newfile = self.project.get_file("newfile.txt")
+        self.assertEqual({newfile, self.project.get_file(self.sample_file)}, files)
+
+    def test_iterating_python_files_nearest_first(self):
+        pkg = self.project.root.create_folder("pkg")
+        sub = pkg.create_folder("sub")
+        mod1 = self.project.root.create_file("mod1.py")
+        mod2 = pkg.create_file("mod2.py")
+        mod3 = sub.create_file("mod3.py")
+        other = self.project.root.create_folder("other").create_file("mod4.py")
+        self.project.validate()
+        result = list(self.project.iter_python_files(mod2))
+        self.assertEqual({mod1, mod2, mod3, other}, set(result))
+        self.assertEqual(4, len(result))
+        self.assertEqual({mod2, mod3}, set(result[:2]))
+        self.assertIsNotNone(self.project.file_list.files)
+        self.assertEqual([mod2, mod3], list(self.project.iter_python_files(mod2))[:2])
+
+    def test_iterating_python_files_lazily(self):
+        for index in range(3):
+            self.project.root.create_file("mod%d.py" % index)
+        self.project.validate()
+        files = self.project.iter_python_files()
+        next(files)
+        files.close()
+        self.assertIsNone(self.project.file_list.files)
+        self.assertEqual(3, len(list(self.project.iter_python_files())))
+        self.assertEqual(3, len(self.project.get_python_files()))
+
+    def test_get_all_files_after_moving_folders(self):
+        parent = self.project.get_folder(self.sample_folder)
+        parent.create_file("nested.txt")
+        self.assertEqual(2, len(self.project.get_files()))
+        parent.move("newfolder")
+        self.assertIn(
+            self.project.get_file("newfolder/nested.txt"), self.project.get_files()
+        )
+        self.assertEqual(2, len(self.project.get_files()))
+        self.project.get_folder("newfolder").remove()
+        self.assertEqual(1, len(self.project.get_files()))
+
+    def test_get_all_files_after_creating_ignored_files(self):
+        self.project.get_files()
+        self.project.root.create_file("test.pyc")
+        self.project.root.create_folder(".ropeproject")
+        self.project.get_folder(".ropeproject").create_file("data")
+        self.assertEqual(1, len(self.project.get_files()))
+
     def test_multifile_get_all_files(self):
         fileName = "nestedFile.txt"
         parent = self.project.get_resource(self.sample_folder)
@@ -1052,6 +1109,27 @@ class RopeFolderTest(unittest.TestCase):
         myfile = self.project.root.create_file("myfile.txt")  # noqa
         self.assertEqual(0, len(self.project.get_files()))
 
+    def test_ignored_folders_and_get_files(self):
+        self.project = testutils.sample_project(
+            ignored_resources=["node_modules", "*.pyc"], ropefolder=None
+        )
+        folder = self.project.root.create_folder("node_modules")
+        folder.create_folder("pkg").create_file("mod.py")
+        src = self.project.root.create_folder("src")
+        mod = src.create_file("mod.py")
+        src.create_file("mod.pyc")
+        self.project.validate()
+        self.assertEqual({mod}, set(self.project.get_files()))
+
+    @testutils.skipNotPOSIX()
+    def test_not_following_symlinked_folders_in_get_files(self):
+        self.project = testutils.sample_project(ropefolder=None)
+        src = self.project.root.create_folder("src")
+        mod = src.create_file("mod.py")
+        os.symlink(src.real_path, os.path.join(self.project.address, "linked"))
+        self.project.validate()
+        self.assertEqual({mod}, set(self.project.get_files()))
+
     def test_setting_ignored_resources_patterns(self):
         self.project = testutils.sample_project(ignored_resources=["m?file.*"])
         myfile = self.project.get_file("myfile.txt")
@@ -1059,6 +1137,22 @@ class RopeFolderTest(unittest.TestCase):
         self.assertTrue(self.project.is_ignored(myfile))
         self.assertFalse(self.project.is_ignored(file2))
 
+    def test_changing_ignored_resources_after_matching(self):
+        self.project = testutils.sample_project(ignored_resources=["file1.txt"])
+        file1 = self.project.get_file("file1.txt")
+        file2 = self.project.get_file("dir/file2.txt")
+        self.assertTrue(self.project.is_ignored(file1))
+        self.assertFalse(self.project.is_ignored(file2))
+        self.project.set("ignored_resources", ["dir"])
+        self.assertFalse(self.project.is_ignored(file1))
+        self.assertTrue(self.project.is_ignored(file2))
+
+    def test_double_slashes_in_ignored_resources(self):
+        self.project = testutils.sample_project(ignored_resources=["a//b.txt"])
+        self.assertTrue(self.project.is_ignored(self.project.get_file("a/b.txt")))
+        self.assertTrue(self.project.is_ignored(self.project.get_file("a/c/d/b.txt")))
+        self.assertFalse(self.project.is_ignored(self.project.get_file("c/b.txt")))
+
     def test_star_should_not_include_slashes(self):
         self.project = testutils.sample_project(ignored_resources=["f*.txt"])
         folder = self.project.root.create_folder("folder")
@@ -1188,3 +1282,148 @@ class RopeFolderTest(unittest.TestCase):
         ropefolder = self.project.ropefolder
         self.assertEqual(".f1/f2", ropefolder.path)
         self.assertTrue(ropefolder.exists())
+
+    def test_saving_data_files_in_json_format(self):
+        self.project = testutils.sample_project(data_files_format="json")
+        data = {"file": {("a", 1): [(1, 2), None]}}
+        self.project.data_files.write_data("data", data)
+        ropefolder = self.project.ropefolder
+        self.assertTrue(ropefolder.has_child("data.json"))
+        self.assertFalse(ropefolder.has_child("data"))
+        self.assertEqual(data, self.project.data_files.read_data("data"))
+
+    def test_reading_data_files_saved_in_other_formats(self):
+        self.project = testutils.sample_project()
+        self.project.data_files.write_data("data", {"file": (1, 2)})
+        self.project.prefs.set("data_files_format", "json")
+        self.assertEqual({"file": (1, 2)}, self.project.data_files.read_data("data"))
+
+    def test_saving_objectdb_in_json_format(self):
+        self.project = testutils.sample_project(
+            save_objectdb=True, data_files_format="json"
+        )
+        mod = testutils.create_module(self.project, "mod")
+        mod.write(dedent("""\
+            class C(object):
+                pass
+            def f(p):
+                return p
+            f(C())
+        """))
+        self.project.pycore.analyze_module(mod)
+        self.project.close()
+        self.project = Project(
+            self.project.address, save_objectdb=True, data_files_format="json"
+        )
+        objectdb = self.project.pycore.object_info.objectdb
+        call_infos = list(objectdb.get_callinfos("mod.py", "f"))
+        self.assertEqual(1, len(call_infos))
+        self.assertEqual(
+            (("instance", ("defined", "mod.py", "C")),),
+            call_infos[0].get_parameters(),
+        )
+
+    def test_writing_data_files_atomically(self):
+        self.project = testutils.sample_project()
+        self.project.data_files.write_data("data", [1])
+
+        class Unpicklable:
+            def __reduce__(self):
+                raise TypeError("cannot pickle")
+
+        with self.assertRaises(TypeError):
+            self.project.data_files.write_data("data", [Unpicklable()])
+        self.assertEqual([1], self.project.data_files.read_data("data"))
+        self.assertEqual(["data"], os.listdir(self.project.ropefolder.real_path))
+
+    def test_skipping_json_copies_saved_by_older_versions(self):
+        self.project = testutils.sample_project()
+        self.project.data_files.write_data("objectdb", {"mod.py": {}})
+        ropefolder = self.project.ropefolder.real_path
+        with open(os.path.join(ropefolder, "objectdb.json"), "w") as output:
+            output.write('{"mod.py": {}, "old.py": {}}')
+        self.project.close()
+        self.project = Project(
+            self.project.address, save_objectdb=True, data_files_format="json"
+        )
+        self.assertEqual(
+            ["mod.py"], list(self.project.pycore.object_info.objectdb.get_files())
+        )
+
+    def test_reading_the_newest_data_file(self):
+        self.project = testutils.sample_project()
+        ropefolder = self.project.ropefolder.real_path
+        self.project.data_files.write_data("data", "old")
+        os.utime(os.path.join(ropefolder, "data"), ns=(0, 0))
+        with open(os.path.join(ropefolder, "data.json"), "w") as output:
+            output.write('{"v": 2, "data": "new"}')
+        self.assertEqual("new", self.project.data_files.read_data("data"))
+
+    def test_removing_data_files_saved_in_other_formats(self):
+        self.project = testutils.sample_project()
+        self.project.data_files.write_data("data", [1])
+        self.project.prefs.set("data_files_format", "json")
+        self.project.data_files.write_data("data", [2])
+        self.assertEqual(["data.json"], os.listdir(self.project.ropefolder.real_path))
+
+    def test_writing_data_files_in_background(self):
+        self.project = testutils.sample_project(write_data_files_in_background=True)
+        data_files = self.project.data_files
+        started = threading.Event()
+        resume = threading.Event()
+        written = []
+        write_data = data_files._write_data
+
+        def blocking_write_data(path, format, data):
+            started.set()
+            resume.wait()
+            written.append(data)
+            write_data(path, format, data)
+
+        with mock.patch.object(data_files, "_write_data", blocking_write_data):
+            data_files.write_data("data", [1])
+            started.wait()
+            data_files.write_data("data", [2])
+            data_files.write_data("data", [3])
+            resume.set()
+            data_files.flush()
+        self.assertEqual([[1], [3]], written)
+        self.assertEqual([3], data_files.read_data("data"))
+
+    def test_raising_background_write_errors_when_flushing(self):
+        self.project = testutils.sample_project(write_data_files_in_background=True)
+
+        class Unpicklable:
+            def __reduce__(self):
+                raise TypeError("cannot pickle")
+
+        with self.assertLogs("rope.base.project", "ERROR"):
+            self.project.data_files.write_data("data", [Unpicklable()])
+            self.project.data_files._wait_for_writer()
+        self.assertIsNone(self.project.data_files.read_data("data"))
+        with self.assertRaises(TypeError):
+            self.project.data_files.flush()
+        self.project.data_files.flush()
+
+    def test_writing_a_copy_of_autoimport_names_in_background(self):
+        from rope.contrib.autoimport.pickle import AutoImport
+
+        self.project = testutils.sample_project(write_data_files_in_background=True)
+        importer = AutoImport(self.project, observe=False)
+        importer.names["mod"] = ["a_var"]
+        with mock.patch.object(self.project.data_files, "write_data") as write_data:
+            self.project.sync()
+        write_data.assert_called_once_with("globalnames", {"mod": ["a_var"]})
+        names = write_data.call_args[0][1]
+        self.assertIsNot(importer.names, names)
+        self.assertIsNot(importer.names["mod"], names["mod"])
+
+    def test_writing_history_in_background_when_closing(self):
+        self.project = testutils.sample_project(
+            save_history=True, write_data_files_in_background=True
+        )
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("1\n")
+        self.project.close()
+        self.project = Project(self.project.address, save_history=True)
+        self.assertEqual(2, len(self.project.history.undo_list))
@@ -1,8 +1,10 @@
+import gc
 import sys
 import unittest
 from textwrap import dedent
+from unittest import mock
 
-from rope.base import exceptions, libutils
+from rope.base import evaluate, exceptions, libutils
 from rope.base.builtins import BuiltinClass, File
 from rope.base.pycore import _TextChangeDetector
 from rope.base.pynamesdef import AssignedName
@@ -1193,6 +1195,228 @@ class PyCoreInProjectsTest(unittest.TestCase):
         """))
         self.assertTrue("func2" in b_class)
 
+    def test_not_forgetting_unrelated_modules_after_change(self):
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod3 = testutils.create_module(self.project, "mod3")
+        mod1.write(dedent("""\
+            class A(object):
+                pass
+        """))
+        mod2.write(dedent("""\
+            import mod1
+            class B(mod1.A):
+                pass
+        """))
+        mod3.write(dedent("""\
+            class C(object):
+                pass
+        """))
+
+        b_class = self.project.get_module("mod2")["B"].get_object()
+        c_class = self.project.get_module("mod3")["C"].get_object()
+        self.assertEqual(1, len(b_class.get_superclasses()))
+        c_class.get_attributes()
+        self.assertIsNotNone(c_class.attributes.get())
+
+        mod1.write(dedent("""\
+            class A(object):
+                def func(self):
+                    pass
+        """))
+        self.assertIsNotNone(c_class.attributes.get())
+        self.assertIsNone(b_class.attributes.get())
+        self.assertTrue("func" in b_class)
+
+    def test_forgetting_transitive_dependents_after_change(self):
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod3 = testutils.create_module(self.project, "mod3")
+        mod1.write(dedent("""\
+            class A(object):
+                pass
+        """))
+        mod2.write(dedent("""\
+            from mod1 import A
+        """))
+        mod3.write(dedent("""\
+            import mod2
+            class C(mod2.A):
+                pass
+        """))
+
+        c_class = self.project.get_module("mod3")["C"].get_object()
+        self.assertTrue("func" not in c_class)
+        mod1.write(dedent("""\
+            class A(object):
+                def func(self):
+                    pass
+        """))
+        self.assertTrue("func" in c_class)
+
+    def test_evicting_least_recently_used_modules(self):
+        self.project.prefs["max_cached_modules"] = 2
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod3 = testutils.create_module(self.project, "mod3")
+        self.project.get_pymodule(mod1)
+        self.project.get_pymodule(mod2)
+        self.project.get_pymodule(mod1)
+        self.project.get_pymodule(mod3)
+        module_map = self.pycore.module_cache.module_map
+        self.assertEqual([mod1, mod3], list(module_map))
+        stats = self.pycore.get_stats()
+        self.assertEqual(2, stats["modules"])
+        self.assertEqual(1, stats["evictions"])
+
+    def test_reusing_evicted_modules_that_are_still_in_use(self):
+        self.project.prefs["max_cached_modules"] = 1
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        pymod1 = self.project.get_pymodule(mod1)
+        self.project.get_pymodule(mod2)
+        self.assertTrue(mod1 not in self.pycore.module_cache.module_map)
+        self.assertIs(pymod1, self.project.get_pymodule(mod1))
+
+    def test_forgetting_collected_evicted_modules(self):
+        self.project.prefs["max_cached_modules"] = 1
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod3 = testutils.create_module(self.project, "mod3")
+        mod1.write("import mod2\nmod2.a_var\n")
+        mod2.write("a_var = 1\n")
+        pymod1 = self.project.get_pymodule(mod1)
+        pymod1["mod2"].get_object()["a_var"].get_object()
+        module_cache = self.pycore.module_cache
+        self.assertEqual({mod2: {mod1}}, module_cache.dependents)
+        del pymod1
+        self.project.get_pymodule(mod3)
+        gc.collect()
+        self.project.get_pymodule(mod3)
+        self.assertEqual({}, module_cache.dependents)
+        self.assertEqual({}, module_cache.dependencies)
+        self.assertNotIn(mod1, self.pycore.observer.resources)
+        self.assertNotIn(mod2, self.pycore.observer.resources)
+
+    def test_invalidating_evicted_modules_that_are_still_in_use(self):
+        self.project.prefs["max_cached_modules"] = 1
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod1.write("a_var = 1\n")
+        pymod1 = self.project.get_pymodule(mod1)
+        self.project.get_pymodule(mod2)
+        mod1.write("another_var = 1\n")
+        new_pymod1 = self.project.get_pymodule(mod1)
+        self.assertIsNot(pymod1, new_pymod1)
+        self.assertTrue("another_var" in new_pymod1)
+
+    def test_reparsing_changed_definitions_incrementally(self):
+        self.project.prefs["incremental_reparse"] = True
+        mod = testutils.create_module(self.project, "mod")
+        mod.write(dedent("""\
+            import os
+
+
+            def f():
+                return 1
+
+
+            class C:
+                def m(self):
+                    self.attr = 1
+        """))
+        pymod = self.project.get_pymodule(mod)
+        f = pymod["f"].get_object()
+        c_class = pymod["C"].get_object()
+        self.assertEqual(10, c_class["attr"].get_definition_location()[1])
+        mod.write(dedent("""\
+            import os
+
+
+            def f():
+                var = 1
+                return var
+
+
+            class C:
+                def m(self):
+                    self.attr = 1
+        """))
+        self.assertIs(pymod, self.project.get_pymodule(mod))
+        self.assertIsNot(f, pymod["f"].get_object())
+        self.assertIs(c_class, pymod["C"].get_object())
+        self.assertEqual(9, c_class.get_scope().get_start())
+        self.assertEqual(11, c_class["attr"].get_definition_location()[1])
+        scope = pymod.get_scope().get_inner_scope_for_line(5)
+        self.assertIs(pymod["f"].get_object(), scope.pyobject)
+        self.assertIn("var", scope)
+        self.assertEqual(1, self.pycore.get_stats()["reparses"])
+
+    def test_reparsing_modules_changed_outside_definitions(self):
+        self.project.prefs["incremental_reparse"] = True
+        mod = testutils.create_module(self.project, "mod")
+        mod.write(dedent("""\
+            import os
+
+
+            def f():
+                pass
+        """))
+        pymod = self.project.get_pymodule(mod)
+        mod.write(dedent("""\
+            import os
+            import sys
+
+
+            def f():
+                pass
+        """))
+        new_pymod = self.project.get_pymodule(mod)
+        self.assertIsNot(pymod, new_pymod)
+        self.assertIn("sys", new_pymod)
+        self.assertEqual(0, self.pycore.get_stats()["reparses"])
+
+    def test_saving_evaluated_nodes(self):
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = 1\nanother_var = a_var\n")
+        pymod = self.project.get_pymodule(mod)
+        node = pymod.get_ast().body[1].value
+        pyname = evaluate.eval_node(pymod.get_scope(), node)
+        self.assertIs(pymod["a_var"], pyname)
+        self.assertIs(pyname, evaluate.eval_node(pymod.get_scope(), node))
+        self.assertIs(pyname, evaluate.eval_str(pymod.get_scope(), "a_var"))
+
+    def test_not_saving_evaluated_nodes_in_functions(self):
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("def f(p):\n    return p\n")
+        pymod = self.project.get_pymodule(mod)
+        scope = pymod["f"].get_object().get_scope()
+        evaluate.eval_str(scope, "p")
+        self.assertEqual({}, pymod._get_evaluated_nodes())
+
+    def test_limiting_saved_evaluated_nodes(self):
+        mod = testutils.create_module(self.project, "mod")
+        mod.write("a_var = 1\nanother_var = 2\n")
+        pymod = self.project.get_pymodule(mod)
+        with mock.patch.object(evaluate, "_MAX_EVALUATED_NODES", 1):
+            evaluate.eval_str(pymod.get_scope(), "a_var")
+            evaluate.eval_str(pymod.get_scope(), "another_var")
+        self.assertEqual(
+            [(pymod.get_scope(), "another_var")], list(pymod._get_evaluated_nodes())
+        )
+
+    def test_forgetting_evaluated_nodes_when_dependencies_change(self):
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod1.write("class A(object):\n    pass\n")
+        mod2.write("import mod1\n")
+        pymod2 = self.project.get_pymodule(mod2)
+        pyname = evaluate.eval_str(pymod2.get_scope(), "mod1.A")
+        self.assertEqual(get_base_type("Type"), pyname.get_object().get_type())
+        mod1.write("def A():\n    pass\n")
+        pyname = evaluate.eval_str(pymod2.get_scope(), "mod1.A")
+        self.assertEqual(get_base_type("Function"), pyname.get_object().get_type())
+
     def test_caching_pymodule_with_syntax_errors(self):
         self.project.prefs["ignore_syntax_errors"] = True
         self.project.prefs["automatic_soa"] = True
@@ -1252,6 +1476,28 @@ class PyCoreProjectConfigsTest(unittest.TestCase):
             testutils.remove_project(self.project)
         super().tearDown()
 
+    def test_sharing_modules_outside_projects(self):
+        self.project = testutils.sample_project(foldername="external")
+        mod = testutils.create_module(self.project, "extmod")
+        mod.write("a_var = 1\n")
+        project1 = testutils.sample_project(python_path=[self.project.address])
+        project2 = testutils.sample_project(python_path=[self.project.address])
+        try:
+            pymod1 = project1.get_module("extmod")
+            pymod2 = project2.get_module("extmod")
+            self.assertIsNot(pymod1, pymod2)
+            self.assertIs(pymod1.get_ast(), pymod2.get_ast())
+            self.assertIn("a_var", pymod2)
+            mod.write("a_var = 1\nanother_var = 2\n")
+            project3 = testutils.sample_project(python_path=[self.project.address])
+            pymod3 = project3.get_module("extmod")
+            self.assertIsNot(pymod1.get_ast(), pymod3.get_ast())
+            self.assertIn("another_var", pymod3)
+            testutils.remove_project(project3)
+        finally:
+            testutils.remove_project(project1)
+            testutils.remove_project(project2)
+
     def test_python_files_config(self):
         self.project = testutils.sample_project(python_files=["myscript"])
         myscript = self.project.root.create_file("myscript")
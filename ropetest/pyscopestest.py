@@ -455,6 +455,29 @@ class PyCoreScopesTest(unittest.TestCase):
         f_in_c = c_scope.get_scopes()[0]
         self.assertEqual(f_in_c, scope.get_inner_scope_for_line(7))
 
+    def test_get_inner_scope_between_many_scopes(self):
+        code = "".join("def f%d():\n    a = 1\n\n" % index for index in range(10))
+        scope = libutils.get_string_scope(self.project, code)
+
+        f_scopes = scope.get_scopes()
+        self.assertEqual(f_scopes[0], scope.get_inner_scope_for_line(2))
+        self.assertEqual(f_scopes[4], scope.get_inner_scope_for_line(14))
+        self.assertEqual(f_scopes[9], scope.get_inner_scope_for_line(29))
+        self.assertEqual(scope, scope.get_inner_scope_for_line(30))
+
+    def test_get_inner_scope_for_scopes_starting_on_the_same_line(self):
+        code = dedent("""\
+            a = [x for x in y] + [
+                z for z in y]
+            def f():
+                pass
+        """)
+        scope = libutils.get_string_scope(self.project, code)
+
+        first, second, f_scope = scope.get_scopes()
+        self.assertEqual(first, scope.get_inner_scope_for_line(1))
+        self.assertEqual(f_scope, scope.get_inner_scope_for_line(4))
+
     def test_getting_defined_names_for_classes(self):
         code = dedent("""\
             class A(object):
@@ -560,3 +583,19 @@ class PyCoreScopesTest(unittest.TestCase):
         )
 
         self.assertEqual(scope.get_scopes()[1].get_region(), (26, 47))
+
+    def test_function_scopes_and_their_names_use_slots(self):
+        scope = libutils.get_string_scope(
+            self.project,
+            dedent("""\
+                import os
+                def func(param):
+                    var = param
+            """),
+        )
+        func_scope = scope.get_scopes()[0]
+        self.assertEqual(func_scope.get_end(), 3)
+        self.assertFalse(hasattr(func_scope, "__dict__"))
+        for pyname in func_scope.get_names().values():
+            self.assertFalse(hasattr(pyname, "__dict__"))
+        self.assertFalse(hasattr(scope["os"], "__dict__"))
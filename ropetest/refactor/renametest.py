@@ -1,7 +1,8 @@
 import sys
 import unittest
 from textwrap import dedent
-from rope.base import exceptions
+from unittest import mock
+from rope.base import exceptions, parallel
 
 import rope.base.codeanalyze
 import rope.refactor.occurrences
@@ -1096,6 +1097,15 @@ class RenameRefactoringTest(RenameTestMixin, unittest.TestCase):
             refactored,
         )
 
+    def test_not_analyzing_modules_without_the_name(self):
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod1.write("a_var = 1\n")
+        mod2.write("unrelated = \n")
+        self._rename(mod1, 1, "new_var")
+        self.assertEqual("new_var = 1\n", mod1.read())
+        self.assertTrue(mod2 not in self.project.pycore.module_cache.module_map)
+
     def test_renaming_when_unsure(self):
         code = dedent("""\
             class C(object):
@@ -1583,6 +1593,145 @@ class RenameRefactoringWithSuperclassTest(RenameTestMixin, unittest.TestCase):
         )
 
 
+class ParallelRenameTest(RenameTestMixin, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.project.prefs["worker_processes"] = 2
+
+    def test_renaming_in_multiple_modules(self):
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod1.write(dedent("""\
+            def a_func():
+                pass
+        """))
+        mods = []
+        for index in range(2, 6):
+            mod = testutils.create_module(self.project, "mod%d" % index)
+            mod.write(dedent("""\
+                from mod1 import a_func
+                a_func()
+            """))
+            mods.append(mod)
+        self._rename(mod1, len("def "), "new_func")
+        self.assertEqual(
+            dedent("""\
+                def new_func():
+                    pass
+            """),
+            mod1.read(),
+        )
+        for mod in mods:
+            self.assertEqual(
+                dedent("""\
+                    from mod1 import new_func
+                    new_func()
+                """),
+                mod.read(),
+            )
+
+    def test_renaming_modules(self):
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod2.write("import mod1\nmod1.a_var = 1\n")
+        self._rename(mod1, None, "newmod")
+        self.assertFalse(mod1.exists())
+        self.assertTrue(self.project.get_resource("newmod.py").exists())
+        self.assertEqual("import newmod\nnewmod.a_var = 1\n", mod2.read())
+
+    def test_reusing_worker_processes_after_changes(self):
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod1.write("a_var = 1\n")
+        mod2.write("import mod1\nprint(mod1.a_var)\n")
+        self._rename(mod1, 1, "new_var")
+        pool = parallel._pools[self.project]
+        mod2.write("import mod1\nprint(mod1.new_var, mod1.new_var)\n")
+        with mock.patch.object(
+            parallel, "_get_objectdb_snapshot"
+        ) as get_objectdb_snapshot:
+            self._rename(mod1, 1, "newer_var")
+        get_objectdb_snapshot.assert_not_called()
+        self.assertIs(pool, parallel._pools[self.project])
+        self.assertEqual(
+            "import mod1\nprint(mod1.newer_var, mod1.newer_var)\n", mod2.read()
+        )
+        self.project.close()
+        self.assertNotIn(self.project, parallel._pools)
+
+    def test_renaming_occurrences_found_with_object_information(self):
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod1.write(dedent("""\
+            class C(object):
+                def a_func(self):
+                    pass
+            def f(arg):
+                arg.a_func()
+        """))
+        mod2.write(dedent("""\
+            from mod1 import C, f
+            f(C())
+        """))
+        pool = parallel._get_pool(self.project)
+        self.project.pycore.analyze_module(mod2)
+        self._rename(mod1, mod1.read().index("a_func"), "new_func")
+        self.assertIsNot(pool, parallel._pools[self.project])
+        self.assertEqual(
+            dedent("""\
+                class C(object):
+                    def new_func(self):
+                        pass
+                def f(arg):
+                    arg.new_func()
+            """),
+            mod1.read(),
+        )
+
+    def test_renaming_when_unsure_with_confirmation(self):
+        code = dedent("""\
+            class C(object):
+                def a_func(self):
+                    pass
+            def f(arg):
+                arg.a_func()
+            def g(arg):
+                arg.a_func()
+        """)
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod1.write(code)
+
+        def confirm(occurrence):
+            return occurrence.offset == code.rindex("a_func")
+
+        self._rename(mod1, code.index("a_func"), "new_func", unsure=confirm)
+        self.assertEqual(
+            dedent("""\
+                class C(object):
+                    def new_func(self):
+                        pass
+                def f(arg):
+                    arg.a_func()
+                def g(arg):
+                    arg.new_func()
+            """),
+            mod1.read(),
+        )
+        self.assertEqual("", mod2.read())
+
+    def test_stopping_the_task(self):
+        from rope.base import taskhandle
+
+        mod1 = testutils.create_module(self.project, "mod1")
+        mod2 = testutils.create_module(self.project, "mod2")
+        mod1.write("a_var = 1\n")
+        mod2.write("import mod1\nprint(mod1.a_var)\n")
+        handle = taskhandle.TaskHandle()
+        handle.stop()
+        with self.assertRaises(exceptions.InterruptedTaskError):
+            Rename(self.project, mod1, 1).get_changes("new_var", task_handle=handle)
+
+
 class ChangeOccurrencesTest(unittest.TestCase):
     def setUp(self):
         self.project = testutils.sample_project()
@@ -62,3 +62,28 @@ class SimplifyTest(unittest.TestCase):
     def test_simplifying_uppercase_f_string_containing_quotes(self):
         code = """s = Fr"..'{hello}'.."\n"""
         self.assertEqual("""s = Fr"..'{hello}'.."\n""", simplify.real_code(code))
+
+    def test_continuations_inside_parens(self):
+        code = "(1, \\\n 2)\n"
+        self.assertEqual("(1, \\  2)\n", simplify.real_code(code))
+
+    def test_joining_implicit_continuations_in_f_strings(self):
+        code = 's = f"{(a,\n b)}"\n'
+        self.assertEqual('s = f"{(a,  b)}"\n', simplify.real_code(code))
+
+    def test_ignored_regions(self):
+        code = 'a = "x"  # c\nb = f"{a}"\n'
+        self.assertEqual(
+            [
+                (4, 7, {"prefix": ""}),
+                (9, 12, {"prefix": None}),
+                (17, 23, {"prefix": "f"}),
+            ],
+            simplify.ignored_regions(code),
+        )
+
+    def test_ignored_offsets(self):
+        code = 'a = "x"  # c\nb = 1\n'
+        starts, ends = simplify.ignored_offsets(code)
+        self.assertEqual([4, 9], list(starts))
+        self.assertEqual([7, 12], list(ends))
@@ -0,0 +1,70 @@
+import unittest
+
+from rope.base import simplify, utils
+from ropetest import testutils
+
+
+class CachedTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+
+        @utils.cached(2)
+        def double(value, factor=2):
+            self.calls.append(value)
+            return value * factor
+
+        self.double = double
+
+    def tearDown(self):
+        utils._caches.remove(self.double.cache)
+        super().tearDown()
+
+    def test_caching_results(self):
+        self.assertEqual(2, self.double(1))
+        self.assertEqual(2, self.double(1))
+        self.assertEqual([1], self.calls)
+        self.assertEqual(1, self.double.cache.hits)
+        self.assertEqual(1, self.double.cache.misses)
+
+    def test_dropping_least_recently_used_results(self):
+        self.double(1)
+        self.double(2)
+        self.double(1)
+        self.double(3)
+        self.double(1)
+        self.double(2)
+        self.assertEqual([1, 2, 3, 2], self.calls)
+
+    def test_keyword_arguments(self):
+        self.assertEqual(3, self.double(1, factor=3))
+        self.assertEqual(2, self.double(1))
+        self.assertEqual(3, self.double(1, factor=3))
+        self.assertEqual([1, 1], self.calls)
+
+    def test_unhashable_arguments(self):
+        self.assertEqual([1, 1], self.double([1]))
+        self.assertEqual([1, 1], self.double([1]))
+        self.assertEqual(2, len(self.calls))
+        self.assertEqual(0, len(self.double.cache.cache))
+
+    def test_resizing(self):
+        self.double(1)
+        self.double(2)
+        self.double.cache.resize(1)
+        self.assertEqual(
+            {"size": 1, "entries": 1, "hits": 0, "misses": 2},
+            self.double.cache.get_stats(),
+        )
+        self.double(2)
+        self.assertEqual([1, 2], self.calls)
+
+    def test_setting_cache_sizes_from_prefs(self):
+        cache = simplify._scan.cache
+        project = testutils.sample_project(simplified_code_cache_size=5)
+        try:
+            self.assertEqual(5, cache.size)
+            self.assertIn(cache.name, utils.get_cache_stats())
+        finally:
+            testutils.remove_project(project)
+            cache.resize(32)